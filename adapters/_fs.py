@@ -0,0 +1,29 @@
+"""
+Directory creation helpers for cache writers.
+
+Cache directories are created on the first write and then reused for every
+page / month written after it, so the mkdir syscall only needs to happen
+once per directory per process.
+"""
+
+import threading
+from pathlib import Path
+
+_ensured_dirs: set[str] = set()
+_lock = threading.Lock()
+
+
+def ensure_dir(path: Path) -> None:
+    """mkdir -p, skipped for directories already created by this process."""
+    key = str(path)
+    if key in _ensured_dirs:
+        return
+    path.mkdir(parents=True, exist_ok=True)
+    with _lock:
+        _ensured_dirs.add(key)
+
+
+def forget_dir(path: Path) -> None:
+    """Drop a directory from the memo (e.g. after it was removed)."""
+    with _lock:
+        _ensured_dirs.discard(str(path))
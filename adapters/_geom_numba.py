@@ -0,0 +1,58 @@
+"""
+Per-geometry centroid reduction over a flat vertex buffer.
+
+Used by ArcGISClient.compute_centroids_batch. When Numba is installed the
+reduction is JIT-compiled into a single pass over the buffer (no temporary
+arrays); otherwise it falls back to NumPy's np.add.reduceat.
+"""
+
+import numpy as np
+
+try:
+    from numba import njit
+except ImportError:
+    njit = None
+
+
+def _centroids_from_flat_numpy(flat_xy: np.ndarray, offsets: np.ndarray) -> np.ndarray:
+    """NumPy fallback: segment sums via reduceat, divided by segment lengths."""
+    counts = np.diff(offsets)
+    sums = np.add.reduceat(flat_xy, offsets[:-1], axis=0)
+    return sums / counts[:, None]
+
+
+if njit is not None:
+
+    @njit(cache=True, fastmath=True)
+    def _centroids_from_flat_jit(flat_xy, offsets):
+        n = offsets.shape[0] - 1
+        out = np.empty((n, 2), dtype=np.float64)
+        for i in range(n):
+            sx = 0.0
+            sy = 0.0
+            for j in range(offsets[i], offsets[i + 1]):
+                sx += flat_xy[j, 0]
+                sy += flat_xy[j, 1]
+            count = offsets[i + 1] - offsets[i]
+            out[i, 0] = sx / count
+            out[i, 1] = sy / count
+        return out
+
+
+def centroids_from_flat(flat_xy: np.ndarray, offsets: np.ndarray) -> np.ndarray:
+    """Mean (x, y) of each vertex segment in a flat buffer.
+
+    Args:
+        flat_xy: (N, 2) float64 array of all vertices, segment after segment.
+        offsets: (M + 1,) int64 segment boundaries; segment i spans
+            flat_xy[offsets[i]:offsets[i + 1]] and must be non-empty.
+
+    Returns:
+        (M, 2) float64 array of per-segment (x, y) means.
+    """
+    if njit is not None:
+        return _centroids_from_flat_jit(
+            np.ascontiguousarray(flat_xy, dtype=np.float64),
+            np.ascontiguousarray(offsets, dtype=np.int64),
+        )
+    return _centroids_from_flat_numpy(flat_xy, offsets)
@@ -5,16 +5,96 @@ Extracted from scraping/grip_fetcher.py to support hosting capacity
 data ingestion across ~50 utility ArcGIS endpoints.
 """
 
+import hashlib
+import json
 import logging
 import math
+import os
+import random
+import threading
 import time
-from typing import Optional
-
+from concurrent.futures import ThreadPoolExecutor
+from email.utils import parsedate_to_datetime
+from itertools import chain
+from pathlib import Path
+from typing import Iterator, Optional, Union
+from urllib.parse import parse_qsl, quote, urlencode
+
+import numpy as np
 import requests
+from requests.adapters import HTTPAdapter
+
+from ._fs import ensure_dir, forget_dir
+from ._geom_numba import centroids_from_flat
+
+try:
+    # orjson parses bytes directly and is several times faster than the
+    # stdlib on multi-MB feature pages
+    from orjson import dumps as _orjson_dumps, loads as _json_loads
+
+    def _json_dumps(obj) -> bytes:
+        return _orjson_dumps(obj)
+except ImportError:
+    from json import loads as _json_loads
+
+    def _json_dumps(obj) -> bytes:
+        return json.dumps(obj).encode()
 
 logger = logging.getLogger(__name__)
 
 
+def _xy_array(rings: list) -> np.ndarray:
+    """Stack vertex sequences into one (N, 2) float64 array, dropping any Z/M.
+
+    Each ring is converted by NumPy directly and the per-ring blocks are
+    concatenated, so vertices are never copied into an intermediate
+    Python list of all coordinates.
+    """
+    parts = []
+    for ring in rings:
+        try:
+            arr = np.asarray(ring, dtype=np.float64)
+        except ValueError:
+            # Mixed 2D/3D vertices can't form a rectangular array
+            arr = np.asarray([c[:2] for c in ring], dtype=np.float64)
+        parts.append(arr[:, :2])
+    return parts[0] if len(parts) == 1 else np.concatenate(parts)
+
+
+def _encode_query(params: dict) -> str:
+    """Encode the parameters shared by every page of a paged query.
+
+    Paging loops encode this once and append only resultOffset per page,
+    rather than having requests re-run urlencode on the full dict.
+    """
+    return urlencode(params, quote_via=quote)
+
+
+def _parse_retry_after(value: Optional[str]) -> Optional[float]:
+    """Parse a Retry-After header (delta-seconds or HTTP-date) to seconds."""
+    if not value:
+        return None
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        return max(0.0, parsedate_to_datetime(value).timestamp() - time.time())
+    except (TypeError, ValueError):
+        return None
+
+
+# Layer lists, field schemas, and capability metadata rarely change
+SCHEMA_CACHE_TTL_SEC = 7 * 24 * 3600
+
+# Minimum keep-alive connections per host
+HTTP_POOL_MIN_SIZE = 16
+
+
+class ArcGISQueryError(RuntimeError):
+    """A feature page still failed after retries, so the result would be incomplete."""
+
+
 class ArcGISClient:
     """Generic ArcGIS FeatureServer/MapServer query client with pagination."""
 
@@ -24,12 +104,56 @@ class ArcGISClient:
         rate_limit_sec: float = 0.5,
         max_retries: int = 3,
         timeout: int = 120,
+        concurrency: int = 4,
+        cache_dir: Optional[Path] = None,
+        schema_ttl_sec: float = SCHEMA_CACHE_TTL_SEC,
+        feature_ttl_sec: Optional[float] = None,
+        base_delay: float = 1.0,
+        max_delay: float = 30.0,
+        jitter: float = 0.5,
     ):
+        """
+        Args:
+            cache_dir: Directory for the on-disk response cache. None
+                disables caching entirely.
+            schema_ttl_sec: Cache lifetime for layer lists, field schemas,
+                and capability probes.
+            feature_ttl_sec: Cache lifetime for feature/count pages. None
+                (default) never caches feature data.
+            base_delay: First retry delay in seconds (doubles per attempt).
+            max_delay: Cap on any single retry delay, including Retry-After.
+            jitter: Fractional +/- randomization applied to retry delays.
+        """
         self.session = requests.Session()
         self.session.headers.update({"User-Agent": user_agent})
+        # One keep-alive connection per concurrent page worker (plus headroom)
+        # so parallel pages reuse TLS sessions instead of reconnecting.
+        pool_size = max(HTTP_POOL_MIN_SIZE, 2 * max(1, concurrency))
+        adapter = HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size)
+        self.session.mount("https://", adapter)
+        self.session.mount("http://", adapter)
         self.rate_limit_sec = rate_limit_sec
         self.max_retries = max_retries
         self.timeout = timeout
+        self.concurrency = max(1, concurrency)
+        self._throttle_lock = threading.Lock()
+        self._next_request_at = 0.0
+        self.cache_dir = Path(cache_dir) if cache_dir else None
+        self.schema_ttl_sec = schema_ttl_sec
+        self.feature_ttl_sec = feature_ttl_sec
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+        self.jitter = jitter
+
+    def close(self) -> None:
+        """Close pooled HTTP connections."""
+        self.session.close()
+
+    def __enter__(self) -> "ArcGISClient":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
 
     def query_features(
         self,
@@ -41,12 +165,24 @@ class ArcGISClient:
         page_size: int = 2000,
         max_records: Optional[int] = None,
         auth_token: Optional[str] = None,
+        pagination_strategy: str = "auto",
+        force: bool = False,
     ) -> list[dict]:
         """
         Paginated feature query. Returns list of raw feature dicts.
 
-        Pagination uses resultOffset/resultRecordCount with exceededTransferLimit
-        detection. Includes retry with exponential backoff and rate limiting.
+        Pagination strategies:
+          - "oid": WHERE clauses over ObjectID ranges, built from the layer's
+            min/max ObjectID statistics. Avoids the full scan + sort that
+            many ArcGIS backends perform for every resultOffset page.
+          - "offset": resultOffset/resultRecordCount. When the layer reports
+            a record count, pages are fetched concurrently; otherwise they
+            are walked serially with exceededTransferLimit detection.
+          - "auto" (default): probe the layer metadata and use "oid" when
+            statistics are supported, falling back to "offset".
+
+        Pages are fetched with up to ``concurrency`` requests in flight.
+        Includes retry with exponential backoff and rate limiting.
 
         Args:
             url: ArcGIS layer query endpoint (e.g. .../FeatureServer/0/query).
@@ -57,27 +193,88 @@ class ArcGISClient:
             page_size: Records per page (default 2000, ArcGIS max varies).
             max_records: Stop after this many total records (None = all).
             auth_token: Optional ArcGIS token for authenticated services.
+            pagination_strategy: "auto", "oid", or "offset" (see above).
+            force: Bypass cached responses (fresh responses are still cached).
 
         Returns:
             List of raw ESRI feature dicts with "attributes" and "geometry" keys.
+
+        Raises:
+            ArcGISQueryError: a page of a precomputed ("oid" or concurrent
+                "offset") query failed after retries. Serial offset paging
+                stops at the failed page instead, as it always has.
         """
+        if pagination_strategy not in ("auto", "oid", "offset"):
+            raise ValueError(f"Unknown pagination_strategy: {pagination_strategy}")
+
+        # ObjectID ranges can be sparse, so a record cap is only honored
+        # exactly by offset paging.
+        if pagination_strategy != "offset" and max_records is None:
+            range_wheres = self._oid_range_wheres(
+                url, where, page_size, auth_token, force=force,
+            )
+            if range_wheres:
+                params = {
+                    "outFields": out_fields,
+                    "returnGeometry": str(return_geometry).lower(),
+                    "outSR": out_sr,
+                    "f": "json",
+                }
+                if auth_token:
+                    params["token"] = auth_token
+                return self._fetch_pages(
+                    url, [{**params, "where": w} for w in range_wheres], force=force,
+                )
+            logger.info("  ObjectID range paging unavailable, using offset paging")
+
+        params = {
+            "where": where,
+            "outFields": out_fields,
+            "returnGeometry": str(return_geometry).lower(),
+            "outSR": out_sr,
+            "f": "json",
+            "resultRecordCount": page_size,
+        }
+        if auth_token:
+            params["token"] = auth_token
+
+        # With a known record count, every page offset can be computed up
+        # front and fetched concurrently. Small capped queries skip the
+        # extra count round-trip.
+        if self.concurrency > 1 and (max_records is None or max_records > page_size):
+            total = self.get_record_count(
+                url, where, auth_token=auth_token, force=force,
+            )
+            if max_records:
+                total = min(total, max_records)
+            if total > page_size:
+                static_qs = _encode_query(params)
+                pages = [
+                    f"{static_qs}&resultOffset={offset}"
+                    for offset in range(0, total, page_size)
+                ]
+                return self._fetch_pages(url, pages, force=force)[:total]
+
+        return self._query_pages_serial(url, params, page_size, max_records, force)
+
+    def _query_pages_serial(
+        self,
+        url: str,
+        params: dict,
+        page_size: int,
+        max_records: Optional[int],
+        force: bool = False,
+    ) -> list[dict]:
+        """Fetch pages one at a time until the server reports no more data."""
         all_features: list[dict] = []
         offset = 0
+        static_qs = _encode_query(params)
 
         while True:
-            params = {
-                "where": where,
-                "outFields": out_fields,
-                "returnGeometry": str(return_geometry).lower(),
-                "outSR": out_sr,
-                "f": "json",
-                "resultRecordCount": page_size,
-                "resultOffset": offset,
-            }
-            if auth_token:
-                params["token"] = auth_token
-
-            data = self._request_with_retry(url, params)
+            data = self._request_with_retry(
+                url, f"{static_qs}&resultOffset={offset}",
+                ttl=self.feature_ttl_sec, force=force,
+            )
             if data is None:
                 break
 
@@ -102,34 +299,299 @@ class ArcGISClient:
 
         return all_features
 
-    def query_features_geojson(self, url: str, **kwargs) -> dict:
+    def _fetch_pages(
+        self, url: str, pages: list[Union[dict, str]], force: bool = False,
+    ) -> list[dict]:
+        """Fetch a precomputed list of page queries in parallel, preserving order.
+
+        Each page is a params dict or an already-encoded query string. A
+        page that fails after retries would leave a hole in the middle of
+        the result, so pages not yet started are cancelled and
+        ArcGISQueryError is raised.
+        """
+
+        def fetch_page(page_params: Union[dict, str]) -> Optional[list[dict]]:
+            self._throttle()
+            data = self._request_with_retry(
+                url, page_params, ttl=self.feature_ttl_sec, force=force,
+            )
+            if data is None:
+                return None
+            return data.get("features", [])
+
+        logger.info(
+            f"  Fetching {len(pages)} pages ({self.concurrency} concurrent)..."
+        )
+        all_features: list[dict] = []
+        pool = ThreadPoolExecutor(max_workers=self.concurrency)
+        try:
+            # map() yields results in submission order, so pages stay sorted
+            for i, features in enumerate(pool.map(fetch_page, pages)):
+                if features is None:
+                    raise ArcGISQueryError(
+                        f"Page {i + 1}/{len(pages)} of {url} failed after retries: {pages[i]}"
+                    )
+                all_features.extend(features)
+        finally:
+            pool.shutdown(wait=True, cancel_futures=True)
+
+        logger.info(f"  Fetched {len(all_features)} features")
+        return all_features
+
+    def _probe_capabilities(
+        self,
+        layer_url: str,
+        auth_token: Optional[str] = None,
+        force: bool = False,
+    ) -> dict:
+        """Read paging-related capabilities from a layer's metadata.
+
+        Returns:
+            Dict with "oid_field", "supports_pagination",
+            "supports_statistics", and "max_record_count" (None if unknown).
+        """
+        params = {"f": "json"}
+        if auth_token:
+            params["token"] = auth_token
+        data = self._request_with_retry(
+            layer_url, params, ttl=self.schema_ttl_sec, force=force,
+        ) or {}
+
+        oid_field = data.get("objectIdField")
+        if not oid_field:
+            for f in data.get("fields", []):
+                if f.get("type") == "esriFieldTypeOID":
+                    oid_field = f.get("name")
+                    break
+
+        adv = data.get("advancedQueryCapabilities", {})
+        return {
+            "oid_field": oid_field,
+            "supports_pagination": adv.get(
+                "supportsPagination", data.get("supportsPagination", False)
+            ),
+            "supports_statistics": adv.get(
+                "supportsStatistics", data.get("supportsStatistics", False)
+            ),
+            "max_record_count": data.get("maxRecordCount"),
+        }
+
+    def _oid_range_wheres(
+        self,
+        url: str,
+        where: str,
+        page_size: int,
+        auth_token: Optional[str] = None,
+        force: bool = False,
+    ) -> list[str]:
+        """Build one WHERE clause per ObjectID range page.
+
+        Returns an empty list when the layer lacks an ObjectID field or
+        statistics support, or the min/max query fails.
+        """
+        if not url.rstrip("/").endswith("/query"):
+            return []
+        layer_url = url.rstrip("/")[: -len("/query")]
+        caps = self._probe_capabilities(layer_url, auth_token, force=force)
+        oid = caps["oid_field"]
+        if not oid or not caps["supports_statistics"]:
+            if not caps["supports_pagination"]:
+                logger.warning(
+                    f"  {layer_url} reports neither statistics nor pagination "
+                    f"support; offset paging may be slow or incomplete"
+                )
+            return []
+
+        # A range wider than the server's transfer limit would be truncated
+        if caps["max_record_count"]:
+            page_size = min(page_size, caps["max_record_count"])
+
+        params = {
+            "where": where,
+            "outStatistics": json.dumps([
+                {"statisticType": "min", "onStatisticField": oid,
+                 "outStatisticFieldName": "min_oid"},
+                {"statisticType": "max", "onStatisticField": oid,
+                 "outStatisticFieldName": "max_oid"},
+            ]),
+            "f": "json",
+        }
+        if auth_token:
+            params["token"] = auth_token
+        data = self._request_with_retry(
+            url, params, ttl=self.feature_ttl_sec, force=force,
+        )
+        features = (data or {}).get("features", [])
+        if not features:
+            return []
+        attrs = {k.lower(): v for k, v in features[0].get("attributes", {}).items()}
+        lo, hi = attrs.get("min_oid"), attrs.get("max_oid")
+        if lo is None or hi is None:
+            return []
+
+        lo, hi = int(lo), int(hi)
+        n_pages = math.ceil((hi - lo + 1) / page_size)
+        logger.info(
+            f"  Paging by {oid} ranges {lo}..{hi} ({n_pages} pages of {page_size})"
+        )
+        prefix = "" if where.strip() == "1=1" else f"({where}) AND "
+        return [
+            f"{prefix}{oid} >= {start} AND {oid} <= {min(start + page_size - 1, hi)}"
+            for start in range(lo, hi + 1, page_size)
+        ]
+
+    def _throttle(self) -> None:
+        """Space request starts so concurrent workers share the rate limit."""
+        interval = self.rate_limit_sec / self.concurrency
+        with self._throttle_lock:
+            now = time.monotonic()
+            wait = self._next_request_at - now
+            self._next_request_at = max(now, self._next_request_at) + interval
+        if wait > 0:
+            time.sleep(wait)
+
+    def query_features_streaming(
+        self,
+        url: str,
+        fields_to_keep: Optional[set[str]] = None,
+        where: str = "1=1",
+        out_fields: str = "*",
+        return_geometry: bool = True,
+        out_sr: int = 4326,
+        page_size: int = 2000,
+        max_records: Optional[int] = None,
+        auth_token: Optional[str] = None,
+        force: bool = False,
+    ) -> Iterator[dict]:
+        """Yield raw features one at a time, holding only one page in memory.
+
+        Unlike query_features(), pages are fetched serially and released as
+        soon as they are consumed, so peak memory is one page rather than
+        the whole layer. The offset advances by the number of features
+        actually returned, so servers whose maxRecordCount is below
+        page_size are still read completely. Paging stops at a short page
+        without exceededTransferLimit, or when the server repeats the
+        previous page (a layer that ignores resultOffset).
+
+        Args:
+            url: ArcGIS layer query endpoint.
+            fields_to_keep: If given, each feature's attributes are projected
+                to these names before it is yielded.
+            Remaining arguments are as for query_features().
+
+        Raises:
+            ArcGISQueryError: A page failed after retries; stopping there
+                would silently truncate the layer.
+        """
+        params = {
+            "where": where,
+            "outFields": out_fields,
+            "returnGeometry": str(return_geometry).lower(),
+            "outSR": out_sr,
+            "f": "json",
+            "resultRecordCount": page_size,
+        }
+        if auth_token:
+            params["token"] = auth_token
+
+        offset = 0
+        yielded = 0
+        last_page = None
+        static_qs = _encode_query(params)
+        while True:
+            data = self._request_with_retry(
+                url, f"{static_qs}&resultOffset={offset}",
+                ttl=self.feature_ttl_sec, force=force,
+            )
+            if data is None:
+                raise ArcGISQueryError(
+                    f"Page at offset {offset} of {url} failed after retries"
+                )
+            features = data.get("features", [])
+            if not features:
+                return
+            more = data.get("exceededTransferLimit", False) or len(features) >= page_size
+            # Drop the page dict so only the feature list stays referenced
+            data = None
+
+            # First/last attributes fingerprint the page, taken before projection
+            page_key = (
+                len(features),
+                repr(features[0].get("attributes")),
+                repr(features[-1].get("attributes")),
+            )
+            if page_key == last_page:
+                logger.warning(
+                    f"  {url} returned the same page at offset {offset}; "
+                    f"resultOffset looks unsupported, stopping"
+                )
+                return
+            last_page = page_key
+
+            for feat in features:
+                if fields_to_keep is not None:
+                    attrs = feat.get("attributes", {})
+                    feat["attributes"] = {
+                        k: v for k, v in attrs.items() if k in fields_to_keep
+                    }
+                yield feat
+                yielded += 1
+                if max_records and yielded >= max_records:
+                    return
+
+            if not more:
+                return
+            offset += len(features)
+            time.sleep(self.rate_limit_sec)
+
+    def query_features_geojson(
+        self,
+        url: str,
+        fields_to_keep: Optional[set[str]] = None,
+        stream: bool = False,
+        **kwargs,
+    ) -> dict:
         """Query and return as GeoJSON FeatureCollection.
 
-        Accepts the same keyword arguments as query_features().
-        Geometry is converted from ESRI JSON to GeoJSON format.
+        By default features come from query_features() (ObjectID-range or
+        concurrent offset paging) and accept its keyword arguments,
+        including pagination_strategy. stream=True reads them through
+        query_features_streaming() instead: serial paging, but raw ESRI
+        pages are never held alongside the GeoJSON output. Either way each
+        feature is projected to fields_to_keep (if given) and converted in
+        one pass. Geometry is converted from ESRI JSON to GeoJSON format.
         """
-        features = self.query_features(url, **kwargs)
-        geojson_features = []
-        for feat in features:
-            geom = feat.get("geometry")
-            attrs = feat.get("attributes", {})
-            geojson_features.append({
+        if stream:
+            features = self.query_features_streaming(url, **kwargs)
+        else:
+            features = self.query_features(url, **kwargs)
+
+        to_geojson = self._esri_to_geojson_geometry
+        out = []
+        for f in features:
+            attrs = f.get("attributes", {})
+            if fields_to_keep is not None:
+                attrs = {k: v for k, v in attrs.items() if k in fields_to_keep}
+            out.append({
                 "type": "Feature",
                 "properties": attrs,
-                "geometry": self._esri_to_geojson_geometry(geom) if geom else None,
+                "geometry": to_geojson(f.get("geometry")),
             })
-        return {"type": "FeatureCollection", "features": geojson_features}
+        return {"type": "FeatureCollection", "features": out}
 
-    def discover_layers(self, service_url: str) -> list[dict]:
+    def discover_layers(self, service_url: str, force: bool = False) -> list[dict]:
         """List available layers and tables from a FeatureServer/MapServer.
 
         Args:
             service_url: Service root URL (without /query suffix).
+            force: Bypass the schema cache.
 
         Returns:
             List of dicts with "id", "name", and "type" ("layer" or "table").
         """
-        data = self._request_with_retry(service_url, {"f": "json"})
+        data = self._request_with_retry(
+            service_url, {"f": "json"}, ttl=self.schema_ttl_sec, force=force,
+        )
         if not data:
             return []
         layers = data.get("layers", [])
@@ -139,51 +601,136 @@ class ArcGISClient:
             + [{"id": t["id"], "name": t["name"], "type": "table"} for t in tables]
         )
 
-    def get_field_schema(self, layer_url: str) -> list[dict]:
+    def get_field_schema(self, layer_url: str, force: bool = False) -> list[dict]:
         """Get field definitions for a specific layer.
 
         Args:
             layer_url: Layer URL (e.g. .../FeatureServer/0) without /query.
+            force: Bypass the schema cache.
 
         Returns:
             List of field definition dicts with "name", "type", "alias", etc.
         """
-        data = self._request_with_retry(layer_url, {"f": "json"})
+        data = self._request_with_retry(
+            layer_url, {"f": "json"}, ttl=self.schema_ttl_sec, force=force,
+        )
         if not data:
             return []
         return data.get("fields", [])
 
-    def get_record_count(self, url: str, where: str = "1=1") -> int:
+    def get_record_count(
+        self,
+        url: str,
+        where: str = "1=1",
+        auth_token: Optional[str] = None,
+        force: bool = False,
+    ) -> int:
         """Get total record count for a layer query.
 
         Args:
             url: Layer query endpoint.
             where: SQL WHERE clause.
+            auth_token: Optional ArcGIS token for authenticated services.
+            force: Bypass cached responses.
 
         Returns:
             Feature count, or 0 on error.
         """
-        data = self._request_with_retry(url, {
-            "where": where, "returnCountOnly": "true", "f": "json",
-        })
+        params = {"where": where, "returnCountOnly": "true", "f": "json"}
+        if auth_token:
+            params["token"] = auth_token
+        data = self._request_with_retry(
+            url, params, ttl=self.feature_ttl_sec, force=force,
+        )
         return data.get("count", 0) if data else 0
 
-    def _request_with_retry(self, url: str, params: dict) -> Optional[dict]:
-        """HTTP GET with exponential backoff retry (1s, 2s, 4s)."""
+    def _cache_path(self, url: str, params: Union[dict, str]) -> Path:
+        """Cache file for a request, keyed by URL and sorted params.
+
+        Tokens are excluded so rotating credentials still hit. Pre-encoded
+        query strings are decoded first, so a page keys the same whether
+        it was built as a dict or a string.
+        """
+        if isinstance(params, str):
+            items = parse_qsl(params, keep_blank_values=True)
+        else:
+            items = [(k, str(v)) for k, v in params.items()]
+        query = urlencode(sorted((k, v) for k, v in items if k != "token"))
+        key = hashlib.sha256(f"{url}?{query}".encode()).hexdigest()
+        return self.cache_dir / key[:2] / f"{key}.json"
+
+    def _read_cache(self, path: Path, ttl: float) -> Optional[dict]:
+        """Return a cached response if present and younger than ttl."""
+        try:
+            if time.time() - path.stat().st_mtime > ttl:
+                return None
+            return _json_loads(path.read_bytes())
+        except (OSError, ValueError):
+            return None
+
+    def _write_cache(self, path: Path, data: dict) -> None:
+        """Atomically write a response to the cache (temp file + rename)."""
+        try:
+            ensure_dir(path.parent)
+            tmp = path.with_suffix(f".{os.getpid()}.{threading.get_ident()}.tmp")
+            tmp.write_bytes(_json_dumps(data))
+            os.replace(tmp, path)
+        except OSError as e:
+            forget_dir(path.parent)
+            logger.debug(f"Cache write failed for {path}: {e}")
+
+    def _request_with_retry(
+        self,
+        url: str,
+        params: Union[dict, str],
+        ttl: Optional[float] = None,
+        force: bool = False,
+    ) -> Optional[dict]:
+        """Cached HTTP GET; misses go through _get_with_retry.
+
+        Retries use jittered, capped exponential backoff that honours
+        Retry-After (see _backoff_delay). params may be a dict or an
+        already-encoded query string. Responses are served from / stored
+        in the on-disk cache when a cache_dir is configured and ttl is set.
+        force skips the cache read. Returns None once retries are exhausted.
+        """
+        cache_path = None
+        if self.cache_dir is not None and ttl:
+            cache_path = self._cache_path(url, params)
+            if not force:
+                cached = self._read_cache(cache_path, ttl)
+                if cached is not None:
+                    return cached
+
+        data = self._get_with_retry(url, params)
+        if data is not None and cache_path is not None:
+            self._write_cache(cache_path, data)
+        return data
+
+    def _get_with_retry(self, url: str, params: Union[dict, str]) -> Optional[dict]:
+        """HTTP GET with jittered, capped exponential backoff retry.
+
+        Timeouts, connection errors, 429, 5xx, malformed JSON, and ArcGIS
+        error bodies are retried. Other 4xx responses fail immediately.
+        A Retry-After header on 429/503 overrides the computed delay.
+        """
         for attempt in range(self.max_retries):
+            retry_after = None
             try:
                 resp = self.session.get(url, params=params, timeout=self.timeout)
+                if resp.status_code in (429, 503):
+                    retry_after = _parse_retry_after(resp.headers.get("Retry-After"))
+                elif 400 <= resp.status_code < 500:
+                    logger.warning(f"HTTP {resp.status_code} (not retried): {url}")
+                    return None
                 resp.raise_for_status()
-                data = resp.json()
+                data = _json_loads(resp.content)
                 # ArcGIS returns 200 with error body for many failures
                 if "error" in data:
                     err = data["error"]
                     logger.warning(f"ArcGIS error: {err.get('message', err)}")
-                    if attempt < self.max_retries - 1:
-                        time.sleep(2 ** attempt)
-                        continue
-                    return None
-                return data
+                else:
+                    return data
             except requests.exceptions.Timeout:
                 logger.warning(
                     f"Timeout (attempt {attempt + 1}/{self.max_retries})"
@@ -192,10 +739,27 @@ class ArcGISClient:
                 logger.warning(
                     f"Request failed (attempt {attempt + 1}/{self.max_retries}): {e}"
                 )
+            except ValueError as e:
+                logger.warning(
+                    f"Invalid JSON response (attempt {attempt + 1}/{self.max_retries}): {e}"
+                )
             if attempt < self.max_retries - 1:
-                time.sleep(2 ** attempt)
+                time.sleep(self._backoff_delay(attempt, retry_after))
         return None
 
+    def _backoff_delay(self, attempt: int, retry_after: Optional[float] = None) -> float:
+        """Delay before retry number attempt + 1.
+
+        Uses the server's Retry-After when given (capped at max_delay),
+        otherwise base_delay * 2**attempt capped at max_delay, scaled by a
+        random factor in [1 - jitter, 1 + jitter] so parallel workers
+        don't retry in lockstep.
+        """
+        if retry_after is not None:
+            return min(self.max_delay, retry_after)
+        delay = min(self.max_delay, self.base_delay * (2 ** attempt))
+        return delay * (1 + random.uniform(-self.jitter, self.jitter))
+
     @staticmethod
     def web_mercator_to_wgs84(x: float, y: float) -> tuple[float, float]:
         """Convert Web Mercator (EPSG:3857) to WGS84 (lat, lon)."""
@@ -220,42 +784,92 @@ class ArcGISClient:
         if not geometry:
             return None, None
 
+        point = ArcGISClient._point_lat_lon(geometry)
+        if point is not None:
+            return point
+
+        rings = ArcGISClient._vertex_rings(geometry)
+        if not rings:
+            return None, None
+
+        # Average all coordinate points
+        lon, lat = _xy_array(rings).mean(axis=0)
+        return float(lat), float(lon)
+
+    @staticmethod
+    def compute_centroids_batch(geometries: list[Optional[dict]]) -> np.ndarray:
+        """Vectorized compute_centroid over many geometries.
+
+        All line/polygon vertices are flattened into one (N, 2) array and
+        reduced per geometry in a single pass (Numba-compiled when
+        available, np.add.reduceat otherwise).
+
+        Returns:
+            (M, 2) float64 array of (lat, lon); rows are NaN where
+            compute_centroid would return (None, None).
+        """
+        out = np.full((len(geometries), 2), np.nan)
+        all_rings: list = []
+        lengths: list[int] = []
+        rows: list[int] = []
+
+        for i, geometry in enumerate(geometries):
+            if not geometry:
+                continue
+            point = ArcGISClient._point_lat_lon(geometry)
+            if point is not None:
+                out[i] = point
+                continue
+            rings = ArcGISClient._vertex_rings(geometry)
+            if rings:
+                all_rings.extend(rings)
+                lengths.append(sum(len(r) for r in rings))
+                rows.append(i)
+
+        if all_rings:
+            offsets = np.concatenate(([0], np.cumsum(lengths)))
+            means = centroids_from_flat(_xy_array(all_rings), offsets)
+            # Columns are (lon, lat); flip to (lat, lon)
+            out[rows] = means[:, ::-1]
+
+        return out
+
+    @staticmethod
+    def _point_lat_lon(geometry: dict) -> Optional[tuple[float, float]]:
+        """Return (lat, lon) for ESRI or GeoJSON point geometry, else None."""
         # ArcGIS point geometry
         if "x" in geometry and "y" in geometry:
             return geometry["y"], geometry["x"]
+        if geometry.get("type") == "Point" and "coordinates" in geometry:
+            c = geometry["coordinates"]
+            return c[1], c[0]  # GeoJSON is [lon, lat]
+        return None
 
+    @staticmethod
+    def _vertex_rings(geometry: dict) -> list:
+        """Collect the non-empty vertex sequences of line/polygon geometry.
+
+        Returns [] if there are none or the vertices are not [x, y, ...]
+        sequences.
+        """
         # ArcGIS polyline (paths) or polygon (rings)
-        coords: list = []
-        for key in ("paths", "rings"):
-            for ring_or_path in geometry.get(key, []):
-                coords.extend(ring_or_path)
+        rings = [*geometry.get("paths", []), *geometry.get("rings", [])]
 
         # GeoJSON coordinates
         if "coordinates" in geometry:
             gtype = geometry.get("type", "")
-            if gtype == "Point":
-                c = geometry["coordinates"]
-                return c[1], c[0]  # GeoJSON is [lon, lat]
-            elif gtype in ("LineString", "MultiPoint"):
-                coords = geometry["coordinates"]
+            coords = geometry["coordinates"]
+            if gtype in ("LineString", "MultiPoint"):
+                rings = [coords]
             elif gtype in ("Polygon", "MultiLineString"):
-                for ring in geometry["coordinates"]:
-                    coords.extend(ring)
+                rings.extend(coords)
             elif gtype == "MultiPolygon":
-                for poly in geometry["coordinates"]:
-                    for ring in poly:
-                        coords.extend(ring)
-
-        if not coords:
-            return None, None
-
-        # Average all coordinate points
-        if isinstance(coords[0], (list, tuple)) and len(coords[0]) >= 2:
-            lons = [c[0] for c in coords]
-            lats = [c[1] for c in coords]
-            return sum(lats) / len(lats), sum(lons) / len(lons)
+                rings.extend(chain.from_iterable(coords))
 
-        return None, None
+        rings = [r for r in rings if r]
+        if not rings or not isinstance(rings[0][0], (list, tuple)) or len(rings[0][0]) < 2:
+            return []
+        return rings
 
     @staticmethod
     def _esri_to_geojson_geometry(geom: dict) -> Optional[dict]:
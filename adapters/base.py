@@ -6,17 +6,81 @@ for pulling zone and node LMP data, regardless of the underlying
 data source (gridstatus, custom API client, CSV files, etc.).
 """
 
+import copy
 import logging
+import threading
 from abc import ABC, abstractmethod
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from dataclasses import dataclass, field
+from functools import lru_cache
 from pathlib import Path
 from typing import Optional
 
 import pandas as pd
+import pyarrow as pa
+import pyarrow.parquet as pq
 import yaml
 
+from ._fs import ensure_dir, forget_dir
+
 logger = logging.getLogger(__name__)
 
+# Zones pulled concurrently per ISO during pnode drill-down. The limit is
+# enforced by a per-ISO semaphore, so drivers running several adapters for
+# the same ISO share one budget against that vendor's rate limits.
+ZONE_PARALLELISM = 8
+
+_iso_semaphores: dict[str, threading.BoundedSemaphore] = {}
+_iso_semaphores_lock = threading.Lock()
+
+
+def _iso_semaphore(iso_id: str) -> threading.BoundedSemaphore:
+    """Return the process-wide zone-fetch semaphore for an ISO."""
+    with _iso_semaphores_lock:
+        sem = _iso_semaphores.get(iso_id)
+        if sem is None:
+            sem = _iso_semaphores[iso_id] = threading.BoundedSemaphore(ZONE_PARALLELISM)
+        return sem
+
+
+# libyaml's C loader is an order of magnitude faster than the pure-Python one
+_YAML_LOADER = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
+
+@lru_cache(maxsize=32)
+def _load_yaml_cached(path_str: str, mtime_ns: int) -> dict:
+    """Parse a YAML file once per (path, mtime); edits invalidate the entry.
+
+    Callers must not mutate the returned dict (it is shared).
+    """
+    with open(path_str) as f:
+        return yaml.load(f, Loader=_YAML_LOADER)
+
+
+def arrow_to_pandas(table: pa.Table) -> pd.DataFrame:
+    """Convert an Arrow table that is not used afterwards to pandas.
+
+    split_blocks keeps one block per column (no consolidation copy) and
+    self_destruct frees each Arrow column as soon as it is converted, so
+    peak memory stays near one copy of the data.
+    """
+    return table.to_pandas(split_blocks=True, self_destruct=True)
+
+
+def concat_frames(frames: list[pd.DataFrame]) -> pd.DataFrame:
+    """Concatenate DataFrames via Arrow tables instead of pd.concat.
+
+    pa.concat_tables stitches column chunks together without copying, and
+    permissive promotion reconciles frames whose dtypes drifted (e.g.
+    int32 vs int64 IDs, all-null columns). Falls back to pd.concat for
+    frames Arrow cannot represent, such as mixed-type object columns.
+    """
+    try:
+        tables = [pa.Table.from_pandas(f, preserve_index=False) for f in frames]
+        return pa.concat_tables(tables, promote_options="permissive").to_pandas()
+    except (pa.ArrowInvalid, pa.ArrowTypeError, pa.ArrowNotImplementedError):
+        return pd.concat(frames, ignore_index=True)
+
 
 @dataclass
 class ISOConfig:
@@ -41,9 +105,12 @@ class ISOConfig:
 
     @classmethod
     def from_yaml(cls, yaml_path: Path) -> "ISOConfig":
-        """Load ISO config from a YAML file."""
-        with open(yaml_path) as f:
-            data = yaml.safe_load(f)
+        """Load ISO config from a YAML file (parsed once per file version)."""
+        yaml_path = Path(yaml_path)
+        # Deep copy so configs never share mutable state with the cache
+        data = copy.deepcopy(
+            _load_yaml_cached(str(yaml_path), yaml_path.stat().st_mtime_ns)
+        )
 
         # Parse peak_hours from range notation or list
         peak_hours_raw = data.get("peak_hours", list(range(7, 23)))
@@ -114,7 +181,9 @@ class ISOAdapter(ABC):
         return self.config.iso_id
 
     @abstractmethod
-    def pull_zone_lmps(self, year: int, force: bool = False) -> pd.DataFrame:
+    def pull_zone_lmps(
+        self, year: int, force: bool = False, columns: Optional[list[str]] = None,
+    ) -> pd.DataFrame:
         """
         Pull zone-level day-ahead hourly LMPs for a full year.
 
@@ -128,13 +197,21 @@ class ISOAdapter(ABC):
           - hour (0-23)
           - month (1-12)
 
+        If columns is given, only those columns are returned (and only those
+        are decoded when reading the parquet cache).
+
         Caches result as parquet.
         """
         ...
 
     @abstractmethod
     def pull_node_lmps(
-        self, zone: str, year: int, month: int, force: bool = False
+        self,
+        zone: str,
+        year: int,
+        month: int,
+        force: bool = False,
+        columns: Optional[list[str]] = None,
     ) -> pd.DataFrame:
         """
         Pull node-level LMPs for a specific zone and month.
@@ -145,16 +222,24 @@ class ISOAdapter(ABC):
           - pnode_name (node name)
           - congestion_price_da
           - hour
+
+        If columns is given, only those columns are returned.
         """
         ...
 
     def pull_node_lmps_year(
-        self, zone: str, year: int, force: bool = False
+        self,
+        zone: str,
+        year: int,
+        force: bool = False,
+        columns: Optional[list[str]] = None,
     ) -> pd.DataFrame:
         """Pull node-level LMPs for a zone across all 12 months."""
         frames = []
         for month in range(1, 13):
-            df = self.pull_node_lmps(zone=zone, year=year, month=month, force=force)
+            df = self.pull_node_lmps(
+                zone=zone, year=year, month=month, force=force, columns=columns,
+            )
             if len(df) > 0:
                 frames.append(df)
 
@@ -162,10 +247,57 @@ class ISOAdapter(ABC):
             logger.warning(f"No node LMP data for {zone} {year}")
             return pd.DataFrame()
 
-        combined = pd.concat(frames, ignore_index=True)
+        combined = concat_frames(frames)
         logger.info(f"Combined {len(combined)} node LMP rows for {zone} {year}")
         return combined
 
+    @staticmethod
+    def _read_cache(
+        cache_path: Path, columns: Optional[list[str]] = None,
+    ) -> pd.DataFrame:
+        """Read a parquet cache, decoding only the requested columns.
+
+        Requested columns missing from the file are ignored. Columns are
+        decoded on Arrow's thread pool and handed to pandas without a
+        consolidation copy.
+        """
+        if columns is not None:
+            available = set(pq.read_schema(cache_path).names)
+            columns = [c for c in columns if c in available]
+        table = pq.read_table(cache_path, columns=columns, use_threads=True)
+        return arrow_to_pandas(table)
+
+    @staticmethod
+    def _write_cache(df: pd.DataFrame, cache_path: Path) -> None:
+        """Write a parquet cache with zstd and bounded row groups.
+
+        Row groups of 100k rows keep column statistics fine-grained enough
+        for projected and filtered reads to skip unneeded data.
+        """
+        ensure_dir(cache_path.parent)
+        try:
+            df.to_parquet(
+                cache_path, index=False, compression="zstd", row_group_size=100_000,
+            )
+        except OSError:
+            if cache_path.parent.exists():
+                raise
+            # Directory was removed since it was first created; recreate it
+            forget_dir(cache_path.parent)
+            ensure_dir(cache_path.parent)
+            df.to_parquet(
+                cache_path, index=False, compression="zstd", row_group_size=100_000,
+            )
+
+    @staticmethod
+    def _select_columns(
+        df: pd.DataFrame, columns: Optional[list[str]] = None,
+    ) -> pd.DataFrame:
+        """Project a freshly pulled frame the same way _read_cache would."""
+        if columns is None:
+            return df
+        return df[[c for c in columns if c in df.columns]]
+
     def get_zone_codes(self) -> list[str]:
         """Return list of zone codes for this ISO."""
         return list(self.config.zones.keys())
@@ -203,16 +335,33 @@ class ISOAdapter(ABC):
 
         logger.info(f"Constrained zones for node drill-down: {constrained_zones}")
 
+        def pull_zone(zone: str) -> pd.DataFrame:
+            with _iso_semaphore(self.iso_id):
+                return self.pull_node_lmps_year(zone=zone, year=year, force=force)
+
+        results = {}
+        if constrained_zones:
+            workers = min(ZONE_PARALLELISM, len(constrained_zones))
+            with ThreadPoolExecutor(max_workers=workers) as pool:
+                futures = {pool.submit(pull_zone, z): z for z in constrained_zones}
+                for future in as_completed(futures):
+                    zone = futures[future]
+                    try:
+                        results[zone] = future.result()
+                    except Exception as e:
+                        logger.warning(
+                            f"  {zone}: failed to pull node LMP data ({e}), skipping"
+                        )
+
         zone_data = {}
         for zone in constrained_zones:
-            try:
-                node_lmps = self.pull_node_lmps_year(zone=zone, year=year, force=force)
-                if len(node_lmps) > 0:
-                    zone_data[zone] = node_lmps
-                else:
-                    logger.warning(f"  {zone}: no node LMP data, skipping")
-            except Exception as e:
-                logger.warning(f"  {zone}: failed to pull node LMP data ({e}), skipping")
+            node_lmps = results.get(zone)
+            if node_lmps is None:
+                continue
+            if len(node_lmps) > 0:
+                zone_data[zone] = node_lmps
+            else:
+                logger.warning(f"  {zone}: no node LMP data, skipping")
 
         logger.info(f"Pulled node data for {len(zone_data)} zones")
         return zone_data
@@ -11,15 +11,109 @@ since CAISO has no PNode-to-Sub-LAP mapping (unlike PJM zone filtering).
 import calendar
 import json
 import logging
+import shutil
+import threading
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from datetime import date
+from functools import lru_cache
 from pathlib import Path
+from typing import Optional
+from urllib.parse import unquote
 
 import pandas as pd
+import pyarrow as pa
+import pyarrow.dataset as ds
+import pyarrow.parquet as pq
 
-from .base import ISOConfig
+try:
+    from orjson import loads as _json_loads
+except ImportError:
+    from json import loads as _json_loads
+
+from .base import ISOConfig, arrow_to_pandas
 from .gridstatus_adapter import GridstatusAdapter
 
 logger = logging.getLogger(__name__)
 
+# Append-only record of completed batch part files, one JSON object per line
+BATCH_MANIFEST = "_done.jsonl"
+
+# Concurrent OASIS PNode batch requests per month pull
+OASIS_PARALLELISM = 4
+
+# Hive-partitioned Sub-LAP LMP dataset under zone_lmps/
+ZONE_DATASET = "oasis"
+ZONE_PARTITIONS = ["year", "pnode_name", "month"]
+
+# Append-only record, under the zone dataset root, of (year, Sub-LAP, month)
+# partitions OASIS was asked for and returned nothing. The leading
+# underscore keeps pyarrow's dataset discovery from reading it as data.
+EMPTY_PARTITIONS_MANIFEST = "_empty.jsonl"
+
+# OASIS LMP component columns coerced to float64 after a pull
+PRICE_COLUMNS = [
+    "total_lmp_da", "congestion_price_da",
+    "marginal_loss_price_da", "system_energy_price_da",
+]
+
+
+def _coerce_prices(df: pd.DataFrame) -> pd.DataFrame:
+    """Coerce present price columns to numeric in one block operation."""
+    cols = [c for c in PRICE_COLUMNS if c in df.columns]
+    if cols:
+        df[cols] = df[cols].apply(pd.to_numeric, errors="coerce")
+    return df
+
+
+def _today() -> date:
+    return date.today()
+
+
+def _month_runs(months: list[int]) -> list[tuple[int, int]]:
+    """Collapse sorted months into inclusive (first, last) runs of consecutive months."""
+    runs: list[tuple[int, int]] = []
+    for m in months:
+        if runs and runs[-1][1] == m - 1:
+            runs[-1] = (runs[-1][0], m)
+        else:
+            runs.append((m, m))
+    return runs
+
+
+@lru_cache(maxsize=8)
+def _pnode_registry_cached(path_str: str, mtime_ns: int) -> tuple[str, ...]:
+    """Parse the PNode registry once per (path, mtime).
+
+    A year pull loads the registry for each of 12 months; this keeps it
+    to a single read unless the file changes.
+    """
+    registry = _json_loads(Path(path_str).read_bytes())
+    # Flatten all trading hubs (np15, zp26) into a single list
+    # Skip non-list entries like "total" count
+    all_pnodes = set()
+    for hub, nodes in registry.items():
+        if isinstance(nodes, list):
+            all_pnodes.update(nodes)
+    logger.info(f"Loaded {len(all_pnodes)} PG&E PNodes from registry")
+    return tuple(sorted(all_pnodes))
+
+
+_CAISO_CLIENT_LOCK = threading.RLock()
+
+
+@lru_cache(maxsize=1)
+def _caiso_client_cached():
+    from src.caiso_client import CAISOClient
+    return CAISOClient()
+
+
+def _shared_caiso_client():
+    """The process-wide OASIS client, so every adapter shares one session
+    and one request throttle."""
+    with _CAISO_CLIENT_LOCK:
+        return _caiso_client_cached()
+
 
 class CAISOAdapter(GridstatusAdapter):
     """
@@ -31,62 +125,188 @@ class CAISOAdapter(GridstatusAdapter):
     def __init__(self, config: ISOConfig, data_dir: Path):
         super().__init__(config, data_dir)
         self._caiso_client = None
+        self.oasis_parallelism = OASIS_PARALLELISM
 
     def _get_caiso_client(self):
         """Lazy-load the custom CAISO OASIS client."""
         if self._caiso_client is None:
-            from src.caiso_client import CAISOClient
-            self._caiso_client = CAISOClient()
+            self._caiso_client = _shared_caiso_client()
         return self._caiso_client
 
-    def pull_zone_lmps(self, year: int, force: bool = False) -> pd.DataFrame:
-        """Pull CAISO Sub-LAP LMPs, preferring OASIS API over gridstatus."""
-        cache_path = self.data_dir / "zone_lmps" / f"zone_lmps_{year}.parquet"
-
-        if cache_path.exists() and not force:
-            logger.info(f"Loading cached zone LMPs from {cache_path}")
-            return pd.read_parquet(cache_path)
+    def pull_zone_lmps(
+        self, year: int, force: bool = False, columns: Optional[list[str]] = None,
+    ) -> pd.DataFrame:
+        """
+        Pull CAISO Sub-LAP LMPs, preferring OASIS API over gridstatus.
+
+        OASIS results are cached as a hive-partitioned dataset
+        (zone_lmps/oasis/year=/pnode_name=/month=), so only (Sub-LAP, month)
+        partitions not yet on disk are requested. Months that have not
+        started are not requested, and finished months OASIS returned no
+        rows for are recorded in EMPTY_PARTITIONS_MANIFEST so they are not
+        asked for again. A legacy single-file zone_lmps_{year}.parquet
+        (e.g. from the gridstatus fallback) is still served when the
+        dataset is incomplete.
+        """
+        root = self.data_dir / "zone_lmps" / ZONE_DATASET
+        legacy_path = self.data_dir / "zone_lmps" / f"zone_lmps_{year}.parquet"
+        nodes = list(self.config.zones.keys())
+        today = _today()
+        last_month = 12 if year < today.year else (today.month if year == today.year else 0)
+        wanted = {(n, m) for n in nodes for m in range(1, last_month + 1)}
+
+        if force:
+            missing = wanted
+        else:
+            known = self._cached_zone_partitions(root, year) | self._empty_zone_partitions(root, year)
+            missing = wanted - known
+        if not missing:
+            logger.info(f"Loading cached zone LMPs from {root} (year={year})")
+            return self._read_zone_dataset(root, year, nodes, columns)
+
+        if legacy_path.exists() and not force:
+            logger.info(f"Loading cached zone LMPs from {legacy_path}")
+            return self._read_cache(legacy_path, columns)
 
         # Try custom OASIS client first
         try:
-            return self._pull_zone_lmps_oasis(year, cache_path)
+            self._pull_zone_lmps_oasis(year, root, missing)
         except Exception as e:
             logger.warning(f"OASIS pull failed ({e}), falling back to gridstatus")
-            return super().pull_zone_lmps(year, force=True)
+            return super().pull_zone_lmps(year, force=True, columns=columns)
+
+        return self._read_zone_dataset(root, year, nodes, columns)
+
+    @staticmethod
+    def _cached_zone_partitions(root: Path, year: int) -> set[tuple[str, int]]:
+        """(pnode_name, month) pairs with a partition on disk for a year."""
+        cached = set()
+        year_dir = root / f"year={year}"
+        if not year_dir.is_dir():
+            return cached
+        for month_dir in year_dir.glob("pnode_name=*/month=*"):
+            if any(month_dir.glob("*.parquet")):
+                node = unquote(month_dir.parent.name.split("=", 1)[1])
+                cached.add((node, int(month_dir.name.split("=", 1)[1])))
+        return cached
+
+    @staticmethod
+    def _empty_zone_partitions(root: Path, year: int) -> set[tuple[str, int]]:
+        """(pnode_name, month) pairs recorded as returning no data for a year."""
+        manifest_path = root / EMPTY_PARTITIONS_MANIFEST
+        empty = set()
+        if manifest_path.exists():
+            with open(manifest_path) as f:
+                for line in f:
+                    if line.strip():
+                        entry = json.loads(line)
+                        if entry["year"] == year:
+                            empty.add((entry["pnode_name"], entry["month"]))
+        return empty
+
+    @staticmethod
+    def _record_empty_zone_partitions(
+        root: Path, year: int, empty: set[tuple[str, int]],
+    ) -> None:
+        root.mkdir(parents=True, exist_ok=True)
+        with open(root / EMPTY_PARTITIONS_MANIFEST, "a") as f:
+            for node, month in sorted(empty):
+                f.write(json.dumps({"year": year, "pnode_name": node, "month": month}) + "\n")
+
+    @staticmethod
+    def _read_zone_dataset(
+        root: Path, year: int, nodes: list[str], columns: Optional[list[str]] = None,
+    ) -> pd.DataFrame:
+        """Read one year of Sub-LAPs from the partitioned zone LMP dataset."""
+        if not (root / f"year={year}").is_dir():
+            return pd.DataFrame()
+        dataset = ds.dataset(root, format="parquet", partitioning="hive")
+        if columns is None:
+            read_cols = [c for c in dataset.schema.names if c != "year"]
+        else:
+            read_cols = [c for c in columns if c in dataset.schema.names]
+        table = dataset.to_table(
+            columns=read_cols,
+            filter=(ds.field("year") == year) & ds.field("pnode_name").isin(nodes),
+        )
+        df = arrow_to_pandas(table)
+        sort_cols = [c for c in ("pnode_name", "datetime_beginning_ept") if c in df.columns]
+        if sort_cols:
+            df = df.sort_values(sort_cols, kind="stable").reset_index(drop=True)
+        return df
 
     def _pull_zone_lmps_oasis(
-        self, year: int, cache_path: Path
+        self, year: int, root: Path, missing: set[tuple[str, int]],
     ) -> pd.DataFrame:
-        """Pull Sub-LAP LMPs using the custom OASIS client."""
-        client = self._get_caiso_client()
-        nodes = list(self.config.zones.keys())
-
-        logger.info(
-            f"Pulling CAISO Sub-LAP LMPs for {year} via OASIS "
-            f"({len(nodes)} Sub-LAPs)"
-        )
+        """Pull the missing Sub-LAP months using the custom OASIS client.
 
-        df = client.query_lmps(
-            start_date=f"{year}-01-01",
-            end_date=f"{year}-12-31",
-            nodes=nodes,
-        )
+        Each Sub-LAP's missing months are split into runs of consecutive
+        months, and Sub-LAPs needing the same run share one query, so a gap
+        in January and another in December never re-pull the months
+        between them.
+        """
+        client = self._get_caiso_client()
+        months_by_node: dict[str, list[int]] = defaultdict(list)
+        for node, month in sorted(missing):
+            months_by_node[node].append(month)
+        nodes_by_run: dict[tuple[int, int], list[str]] = defaultdict(list)
+        for node, months in months_by_node.items():
+            for run in _month_runs(months):
+                nodes_by_run[run].append(node)
+
+        today = _today()
+        frames = []
+        for (first, last), nodes in sorted(nodes_by_run.items()):
+            last_day = calendar.monthrange(year, last)[1]
+            logger.info(
+                f"Pulling CAISO Sub-LAP LMPs for {year}-{first:02d}.."
+                f"{year}-{last:02d} via OASIS ({len(nodes)} Sub-LAPs)"
+            )
+            df = client.query_lmps(
+                start_date=f"{year}-{first:02d}-01",
+                end_date=f"{year}-{last:02d}-{last_day}",
+                nodes=nodes,
+            )
+            requested = {(n, m) for n in nodes for m in range(first, last + 1)}
+
+            if len(df):
+                df = _coerce_prices(df)
+                # Only write partitions that were requested; others are already cached
+                keys = pd.MultiIndex.from_arrays([df["pnode_name"], df["month"]])
+                df = df[keys.isin(list(requested))].reset_index(drop=True)
+                self._write_zone_partitions(root, year, df)
+                frames.append(df)
+                returned = set(zip(df["pnode_name"], df["month"]))
+            else:
+                returned = set()
+
+            # A finished month with no rows stays empty; the current month
+            # may still fill in, so it is asked for again next time
+            empty = {
+                (n, m) for n, m in requested - returned
+                if (year, m) < (today.year, today.month)
+            }
+            if empty:
+                self._record_empty_zone_partitions(root, year, empty)
 
-        if len(df) == 0:
+        if not frames:
             logger.warning("No Sub-LAP LMP data returned from OASIS")
-            return df
-
-        # Ensure numeric columns
-        for col in ["system_energy_price_da", "total_lmp_da",
-                     "congestion_price_da", "marginal_loss_price_da"]:
-            if col in df.columns:
-                df[col] = pd.to_numeric(df[col], errors="coerce")
-
-        cache_path.parent.mkdir(parents=True, exist_ok=True)
-        df.to_parquet(cache_path, index=False)
-        logger.info(f"Cached {len(df)} rows to {cache_path}")
-
-        return df
+            return pd.DataFrame()
+        return pd.concat(frames, ignore_index=True)
+
+    @staticmethod
+    def _write_zone_partitions(root: Path, year: int, df: pd.DataFrame) -> None:
+        table = pa.Table.from_pandas(df.assign(year=year), preserve_index=False)
+        ds.write_dataset(
+            table,
+            root,
+            format="parquet",
+            partitioning=ZONE_PARTITIONS,
+            partitioning_flavor="hive",
+            existing_data_behavior="delete_matching",
+            file_options=ds.ParquetFileFormat().make_write_options(compression="zstd"),
+        )
+        logger.info(f"Cached {len(df)} rows to {root} (year={year})")
 
     # ── PNode-level LMP support ──
 
@@ -98,26 +318,41 @@ class CAISOAdapter(GridstatusAdapter):
                 f"PNode registry not found at {registry_path}. "
                 "Run scripts/pull_pge_pnodes.py first."
             )
-        with open(registry_path) as f:
-            registry = json.load(f)
-        # Flatten all trading hubs (np15, zp26) into a single list
-        # Skip non-list entries like "total" count
-        all_pnodes = []
-        for hub, nodes in registry.items():
-            if isinstance(nodes, list):
-                all_pnodes.extend(nodes)
-        all_pnodes = sorted(set(all_pnodes))
-        logger.info(f"Loaded {len(all_pnodes)} PG&E PNodes from registry")
-        return all_pnodes
+        return list(
+            _pnode_registry_cached(str(registry_path), registry_path.stat().st_mtime_ns)
+        )
+
+    @staticmethod
+    def _read_batch_manifest(batch_dir: Path) -> list[dict]:
+        """Load completed batch parts and drop any part a crash left unrecorded."""
+        manifest_path = batch_dir / BATCH_MANIFEST
+        manifest = []
+        if manifest_path.exists():
+            with open(manifest_path) as f:
+                for line in f:
+                    if line.strip():
+                        manifest.append(json.loads(line))
+
+        recorded = {entry["part"] for entry in manifest}
+        for part in batch_dir.glob("part-*.parquet"):
+            if part.name not in recorded:
+                part.unlink()
+        return manifest
 
     def pull_node_lmps(
-        self, zone: str, year: int, month: int, force: bool = False
+        self,
+        zone: str,
+        year: int,
+        month: int,
+        force: bool = False,
+        columns: Optional[list[str]] = None,
     ) -> pd.DataFrame:
         """
         Pull node-level LMPs for PG&E PNodes for a single month.
 
         Zone is expected to be "PGE_ALL" (all PG&E PNodes as one group).
-        Uses the custom OASIS client in batches of 10 nodes.
+        Uses the custom OASIS client in batches of 10 nodes, with up to
+        oasis_parallelism batches in flight.
         """
         cache_path = (
             self.data_dir / "node_lmps"
@@ -126,7 +361,7 @@ class CAISOAdapter(GridstatusAdapter):
 
         if cache_path.exists() and not force:
             logger.info(f"Loading cached node LMPs from {cache_path}")
-            return pd.read_parquet(cache_path)
+            return self._read_cache(cache_path, columns)
 
         pnodes = self._load_pnode_registry()
         client = self._get_caiso_client()
@@ -137,68 +372,99 @@ class CAISOAdapter(GridstatusAdapter):
 
         logger.info(
             f"Pulling CAISO PNode LMPs for {zone} {year}-{month:02d} "
-            f"({len(pnodes)} nodes in batches of 10)"
+            f"({len(pnodes)} nodes in batches of 10, "
+            f"{self.oasis_parallelism} concurrent)"
         )
 
-        # Pull in batches with incremental caching for resume-on-failure
+        # Pull in batches with incremental caching for resume-on-failure.
+        # Each run appends its batches to one parquet part file; the part and
+        # the batch indices it holds are recorded in the manifest once the
+        # writer closes, so an interrupted run resumes from completed parts.
         batch_dir = cache_path.parent / f"_batches_{zone}_{year}_{month:02d}"
+        if force:
+            shutil.rmtree(batch_dir, ignore_errors=True)
         batch_dir.mkdir(parents=True, exist_ok=True)
         batch_size = 10
-        frames = []
 
-        for i in range(0, len(pnodes), batch_size):
-            batch_idx = i // batch_size
-            batch_cache = batch_dir / f"batch_{batch_idx:04d}.parquet"
-
-            if batch_cache.exists() and not force:
-                frames.append(pd.read_parquet(batch_cache))
-                continue
-
-            batch = pnodes[i : i + batch_size]
+        manifest = self._read_batch_manifest(batch_dir)
+        done = {idx for entry in manifest for idx in entry["batches"]}
+        pending = [
+            (i // batch_size, pnodes[i : i + batch_size])
+            for i in range(0, len(pnodes), batch_size)
+            if i // batch_size not in done
+        ]
+        part_name = f"part-{len(manifest):04d}.parquet"
+        writer = None
+        written: list[int] = []
+
+        def fetch_batch(batch_idx: int, batch: list[str]):
             try:
-                df = client.query_lmps(
+                return batch_idx, client.query_lmps(
                     start_date=start_date,
                     end_date=end_date,
                     nodes=batch,
                 )
-                if len(df) > 0:
-                    df.to_parquet(batch_cache, index=False)
-                    frames.append(df)
             except Exception as e:
-                logger.warning(
-                    f"Batch {batch_idx} failed ({batch[0]}...): {e}"
-                )
+                logger.warning(f"Batch {batch_idx} failed ({batch[0]}...): {e}")
+                return batch_idx, None
 
-        if not frames:
+        # Batches are fetched concurrently (the OASIS client spaces request
+        # starts itself); results are written from this thread only.
+        pool = ThreadPoolExecutor(max_workers=self.oasis_parallelism)
+        try:
+            futures = [pool.submit(fetch_batch, idx, batch) for idx, batch in pending]
+            for future in as_completed(futures):
+                batch_idx, df = future.result()
+                if df is None or len(df) == 0:
+                    continue
+                table = pa.Table.from_pandas(df, preserve_index=False)
+                if writer is None:
+                    writer = pq.ParquetWriter(batch_dir / part_name, table.schema)
+                else:
+                    table = table.select(writer.schema.names).cast(writer.schema)
+                writer.write_table(table)
+                written.append(batch_idx)
+        finally:
+            pool.shutdown(wait=True, cancel_futures=True)
+            if writer is not None:
+                writer.close()
+                with open(batch_dir / BATCH_MANIFEST, "a") as f:
+                    f.write(json.dumps({"part": part_name, "batches": written}) + "\n")
+                manifest.append({"part": part_name, "batches": written})
+
+        parts = [batch_dir / entry["part"] for entry in manifest]
+        if not parts:
             logger.warning(f"No PNode LMP data for {zone} {year}-{month:02d}")
             return pd.DataFrame()
 
-        combined = pd.concat(frames, ignore_index=True)
+        tables = [pq.read_table(p) for p in parts]
+        names = tables[0].schema.names
+        combined = pa.concat_tables(
+            [t.select(names) for t in tables], promote_options="permissive",
+        ).to_pandas()
 
-        # Add pnode_id (hash-based) since OASIS PNode names lack numeric IDs
+        # Add pnode_id (hash-based) since OASIS PNode names lack numeric IDs.
+        # Hash each distinct name once; hash_array is vectorized and, unlike
+        # the builtin hash(), stable across Python processes.
         if "pnode_id" not in combined.columns and "pnode_name" in combined.columns:
-            combined["pnode_id"] = combined["pnode_name"].apply(
-                lambda x: abs(hash(str(x))) % 10**8
-            )
+            names = combined["pnode_name"].astype(str)
+            uniq = names.unique()
+            ids = pd.util.hash_array(uniq) % 100_000_000
+            combined["pnode_id"] = names.map(dict(zip(uniq, ids))).astype("int32")
 
         # Ensure numeric columns
-        for col in ["total_lmp_da", "congestion_price_da",
-                     "marginal_loss_price_da", "system_energy_price_da"]:
-            if col in combined.columns:
-                combined[col] = pd.to_numeric(combined[col], errors="coerce")
+        combined = _coerce_prices(combined)
 
-        cache_path.parent.mkdir(parents=True, exist_ok=True)
-        combined.to_parquet(cache_path, index=False)
+        self._write_cache(combined, cache_path)
         logger.info(
             f"Cached {len(combined)} PNode LMP rows to {cache_path} "
             f"({combined['pnode_name'].nunique()} nodes)"
         )
 
         # Clean up batch files
-        import shutil
         shutil.rmtree(batch_dir, ignore_errors=True)
 
-        return combined
+        return self._select_columns(combined, columns)
 
     def pull_constrained_zone_pnodes(
         self,
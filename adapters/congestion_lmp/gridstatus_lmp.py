@@ -9,16 +9,52 @@ chunk sizes, rate limits, hub names, and column normalization.
 """
 
 import logging
+import os
+import random
+import threading
 import time
+from concurrent.futures import ThreadPoolExecutor
 from datetime import date, timedelta
+from functools import lru_cache
+from pathlib import Path
+from types import MappingProxyType
 from typing import Optional
+from urllib.parse import quote
 
+import numpy as np
 import pandas as pd
+import pyarrow as pa
+import requests
+
+from .._fs import ensure_dir
 
 logger = logging.getLogger(__name__)
 
-# Per-RTO configuration
-RTO_CONFIG = {
+# Date-window chunks fetched concurrently per node. Request starts are still
+# spaced by the RTO's rate_limit_sec, so this overlaps response latency
+# without raising the aggregate request rate.
+CHUNK_PARALLELISM = 4
+
+# Chunks ending within this many days of today may still be revised by the
+# ISO, so they are never served from the on-disk chunk cache
+VOLATILE_CHUNK_DAYS = 2
+
+# Arrow schema of fetch_*_table results (naive UTC timestamps, as in the
+# DataFrame API)
+CANONICAL_SCHEMA = pa.schema([
+    ("timestamp_utc", pa.timestamp("ns")),
+    ("node_id", pa.dictionary(pa.int32(), pa.string())),
+    ("lmp", pa.float64()),
+    ("energy_component", pa.float64()),
+    ("congestion_component", pa.float64()),
+    ("loss_component", pa.float64()),
+])
+
+# HTTP statuses that will not succeed on retry
+NON_RETRYABLE_STATUS = {400, 401, 403, 404}
+
+# Per-RTO configuration (read-only at the top level)
+RTO_CONFIG = MappingProxyType({
     "CAISO": {
         "gridstatus_class": "CAISO",
         "chunk_days": 30,
@@ -28,6 +64,8 @@ RTO_CONFIG = {
             "SP15": "TH_SP15_GEN-APND",
         },
         "default_hub": "NP15",
+        "retry": {"base": 1.0, "cap": 30.0, "max_retries": 3},
+        "breaker": {"threshold": 5, "cooldown_sec": 60.0},
     },
     "MISO": {
         "gridstatus_class": "MISO",
@@ -42,6 +80,8 @@ RTO_CONFIG = {
             "TEXAS": "TEXAS.HUB",
         },
         "default_hub": "INDIANA",
+        "retry": {"base": 1.0, "cap": 30.0, "max_retries": 3},
+        "breaker": {"threshold": 5, "cooldown_sec": 60.0},
     },
     "SPP": {
         "gridstatus_class": "SPP",
@@ -52,6 +92,8 @@ RTO_CONFIG = {
             "NORTH": "SPPNORTH_HUB",
         },
         "default_hub": "SOUTH",
+        "retry": {"base": 1.0, "cap": 30.0, "max_retries": 3},
+        "breaker": {"threshold": 5, "cooldown_sec": 60.0},
         "disabled": True,  # SPP historical DA LMP downloads 404 as of 2026-02
     },
     "PJM": {
@@ -62,8 +104,119 @@ RTO_CONFIG = {
             "WESTERN": "51288",  # WESTERN HUB pnode_id
         },
         "default_hub": "WESTERN",
+        "retry": {"base": 2.0, "cap": 60.0, "max_retries": 3},
+        "breaker": {"threshold": 5, "cooldown_sec": 60.0},
     },
-}
+})
+
+
+def first_row_per_timestamp(
+    ts_ns: np.ndarray, node_codes: Optional[np.ndarray] = None,
+) -> np.ndarray:
+    """Row indices keeping the first row per timestamp, in time order.
+
+    `ts_ns` is the int64 nanosecond view of a timestamp column. With
+    `node_codes` (integer codes, e.g. from pd.factorize) the key is
+    (node, timestamp) and rows come back sorted by node, then time.
+    Both paths are a stable C-level sort plus a neighbour comparison,
+    with no per-row hashing.
+    """
+    if node_codes is None:
+        _, keep = np.unique(ts_ns, return_index=True)
+        return keep
+
+    order = np.lexsort((ts_ns, node_codes))
+    ts_sorted = ts_ns[order]
+    nodes_sorted = node_codes[order]
+    first = np.ones(len(order), dtype=bool)
+    first[1:] = (ts_sorted[1:] != ts_sorted[:-1]) | (nodes_sorted[1:] != nodes_sorted[:-1])
+    return order[first]
+
+
+# gridstatus ISO clients shared by all adapter instances in the process
+_ISO_LOCK = threading.RLock()
+
+
+@lru_cache(maxsize=None)
+def _iso_for_class(class_name: str):
+    import gridstatus
+    return getattr(gridstatus, class_name)()
+
+
+def _get_iso_singleton(rto: str):
+    """The process-wide gridstatus client for `rto`, created on first use.
+
+    lru_cache alone can run the factory twice under a concurrent first
+    call; the lock makes construction happen exactly once.
+    """
+    with _ISO_LOCK:
+        return _iso_for_class(RTO_CONFIG[rto]["gridstatus_class"])
+
+
+# Per-RTO circuit breakers shared by all adapter instances in the process:
+# {rto: {"state": "closed"|"open"|"half_open", "failures": int, "opened_at": float}}
+_BREAKERS: dict[str, dict] = {}
+_BREAKERS_LOCK = threading.Lock()
+
+
+def _breaker_allow(rto: str, cooldown_sec: float) -> bool:
+    """Whether a request to `rto` may proceed.
+
+    An open breaker refuses requests until the cooldown elapses, then lets
+    a single half-open probe through; other callers keep being refused
+    until that probe reports back.
+    """
+    with _BREAKERS_LOCK:
+        b = _BREAKERS.setdefault(
+            rto, {"state": "closed", "failures": 0, "opened_at": 0.0},
+        )
+        if b["state"] == "closed":
+            return True
+        if b["state"] == "open" and time.monotonic() - b["opened_at"] >= cooldown_sec:
+            b["state"] = "half_open"
+            return True
+        return False
+
+
+def _breaker_record(rto: str, ok: bool, threshold: int) -> None:
+    """Record a request outcome, opening the breaker on repeated failure."""
+    with _BREAKERS_LOCK:
+        b = _BREAKERS.setdefault(
+            rto, {"state": "closed", "failures": 0, "opened_at": 0.0},
+        )
+        if ok:
+            b.update(state="closed", failures=0)
+            return
+        b["failures"] += 1
+        if b["state"] == "half_open" or b["failures"] >= threshold:
+            if b["state"] != "open":
+                logger.warning(
+                    f"{rto}: circuit open after {b['failures']} consecutive failures"
+                )
+            b.update(state="open", opened_at=time.monotonic())
+
+
+def _utc_naive_ns(col: pd.Series) -> np.ndarray:
+    """Timestamps as naive-UTC datetime64[ns] (tz-aware values converted to UTC).
+
+    Datetime columns go through a single Arrow cast: a tz-aware Arrow
+    timestamp already stores UTC instants, so dropping the zone is a
+    metadata change. Other columns (e.g. strings) are parsed by pandas.
+    """
+    if isinstance(col.dtype, pd.DatetimeTZDtype) or pd.api.types.is_datetime64_dtype(col.dtype):
+        arr = pa.Array.from_pandas(col).cast(pa.timestamp("ns"))
+        return arr.to_numpy(zero_copy_only=False)
+    ts = pd.to_datetime(col)
+    if ts.dt.tz is not None:
+        ts = ts.dt.tz_convert(None)
+    return ts.to_numpy(dtype="datetime64[ns]")
+
+
+def _is_retryable(exc: Exception) -> bool:
+    """False for HTTP client errors that a retry cannot fix."""
+    if isinstance(exc, requests.HTTPError) and exc.response is not None:
+        return exc.response.status_code not in NON_RETRYABLE_STATUS
+    return True
 
 
 class GridStatusLMPAdapter:
@@ -77,6 +230,8 @@ class GridStatusLMPAdapter:
         self,
         rto: str = "CAISO",
         rate_limit_sec: Optional[float] = None,
+        parallelism: int = CHUNK_PARALLELISM,
+        cache_dir: Optional[Path] = None,
     ):
         rto = rto.upper()
         if rto not in RTO_CONFIG:
@@ -86,21 +241,66 @@ class GridStatusLMPAdapter:
         self._config = RTO_CONFIG[rto]
         self._iso = None
         self._rate_limit_sec = rate_limit_sec or self._config["rate_limit_sec"]
-        self._last_request_time = 0.0
+        self._throttle_lock = threading.Lock()
+        self._next_request_at = 0.0
         self._chunk_days = self._config["chunk_days"]
+        self._parallelism = max(1, parallelism)
+        self._hubs = MappingProxyType(self._config["hubs"])
+        self._hub_names = tuple(self._hubs)
+        self._cache_dir = Path(cache_dir) if cache_dir else None
 
     def _get_iso(self):
         if self._iso is None:
-            import gridstatus
-            cls_name = self._config["gridstatus_class"]
-            self._iso = getattr(gridstatus, cls_name)()
+            self._iso = _get_iso_singleton(self._rto)
         return self._iso
 
     def _throttle(self):
-        elapsed = time.time() - self._last_request_time
-        if elapsed < self._rate_limit_sec:
-            time.sleep(self._rate_limit_sec - elapsed)
-        self._last_request_time = time.time()
+        """Block until this caller may start a request (thread-safe)."""
+        with self._throttle_lock:
+            now = time.monotonic()
+            wait = self._next_request_at - now
+            self._next_request_at = max(now, self._next_request_at) + self._rate_limit_sec
+        if wait > 0:
+            time.sleep(wait)
+
+    def _date_chunks(self, start_date: date, end_date: date) -> list[tuple[date, date]]:
+        """Split [start_date, end_date) into chunk_days windows."""
+        chunks = []
+        chunk_start = start_date
+        while chunk_start < end_date:
+            chunk_end = min(chunk_start + timedelta(days=self._chunk_days), end_date)
+            chunks.append((chunk_start, chunk_end))
+            chunk_start = chunk_end
+        return chunks
+
+    def _fetch_chunks(
+        self,
+        node_id: str,
+        chunks: list[tuple[date, date]],
+        market: str = "DAY_AHEAD_HOURLY",
+        force: bool = False,
+    ) -> list[dict[str, np.ndarray]]:
+        """Fetch date-window chunks concurrently, normalizing each as it arrives.
+
+        Returns the non-empty normalized chunks in date order; raw frames are
+        dropped as soon as their columns have been extracted.
+        """
+
+        def fetch(chunk: tuple[date, date]) -> Optional[dict[str, np.ndarray]]:
+            chunk_start, chunk_end = chunk
+            logger.info(f"  Fetching {self._rto}/{node_id}: {chunk_start} to {chunk_end}")
+            return self._normalize_chunk(self._fetch_chunk(
+                node_id, start=str(chunk_start), end=str(chunk_end), market=market,
+                force=force,
+            ))
+
+        workers = min(self._parallelism, len(chunks))
+        if workers <= 1:
+            results = [fetch(c) for c in chunks]
+        else:
+            with ThreadPoolExecutor(max_workers=workers) as pool:
+                results = list(pool.map(fetch, chunks))
+        return [c for c in results if c is not None]
 
     def _fetch_chunk(
         self,
@@ -108,12 +308,39 @@ class GridStatusLMPAdapter:
         start: str,
         end: str,
         market: str = "DAY_AHEAD_HOURLY",
-        max_retries: int = 3,
+        max_retries: Optional[int] = None,
+        force: bool = False,
     ) -> pd.DataFrame:
-        """Fetch LMP for a single node over a date range."""
+        """Fetch LMP for a single node over a date range.
+
+        With a cache_dir, settled chunks are served from and written to an
+        on-disk parquet cache; force=True bypasses the cached copy.
+
+        Retries use decorrelated-jitter backoff bounded by the RTO's retry
+        config, so concurrent chunks do not retry in lockstep. Client errors
+        (400/401/403/404) fail immediately. While the RTO's circuit breaker
+        is open, returns an empty DataFrame without making a request.
+        """
+        cache_path = self._chunk_cache_path(node_id, start, end, market)
+        if cache_path is not None and not force and cache_path.exists():
+            try:
+                return pd.read_parquet(cache_path)
+            except Exception as e:
+                logger.debug(f"Chunk cache read failed for {cache_path}: {e}")
+
         iso = self._get_iso()
+        retry = self._config["retry"]
+        breaker = self._config["breaker"]
+        if max_retries is None:
+            max_retries = retry["max_retries"]
+        prev_delay = retry["base"]
 
         for attempt in range(max_retries):
+            if not _breaker_allow(self._rto, breaker["cooldown_sec"]):
+                logger.warning(
+                    f"{self._rto} circuit open, skipping {node_id} {start}->{end}"
+                )
+                return pd.DataFrame()
             try:
                 self._throttle()
                 df = iso.get_lmp(
@@ -122,13 +349,27 @@ class GridStatusLMPAdapter:
                     market=market,
                     locations=[node_id],
                 )
+                _breaker_record(self._rto, True, breaker["threshold"])
+                if cache_path is not None and df is not None and not df.empty:
+                    self._write_chunk_cache(cache_path, df)
                 return df
             except Exception as e:
+                # A client error still means the RTO answered
+                _breaker_record(self._rto, not _is_retryable(e), breaker["threshold"])
+                if not _is_retryable(e):
+                    logger.error(
+                        f"Non-retryable error for {self._rto}/{node_id} "
+                        f"{start}->{end}: {e}"
+                    )
+                    return pd.DataFrame()
                 if attempt < max_retries - 1:
-                    wait = 2 ** (attempt + 1)
+                    wait = random.uniform(
+                        retry["base"], min(retry["cap"], prev_delay * 3),
+                    )
+                    prev_delay = wait
                     logger.warning(
                         f"Retry {attempt + 1}/{max_retries} for {self._rto}/{node_id} "
-                        f"{start}->{end}: {e}. Waiting {wait}s."
+                        f"{start}->{end}: {e}. Waiting {wait:.1f}s."
                     )
                     time.sleep(wait)
                 else:
@@ -138,52 +379,75 @@ class GridStatusLMPAdapter:
                     )
                     return pd.DataFrame()
 
+    def _chunk_cache_path(
+        self, node_id: str, start: str, end: str, market: str,
+    ) -> Optional[Path]:
+        """Cache file for a chunk, or None when caching does not apply."""
+        if self._cache_dir is None:
+            return None
+        if date.fromisoformat(end) > date.today() - timedelta(days=VOLATILE_CHUNK_DAYS):
+            return None
+        return (
+            self._cache_dir / self._rto / quote(node_id, safe="")
+            / f"{start}_{end}_{market}.parquet"
+        )
+
+    @staticmethod
+    def _write_chunk_cache(path: Path, df: pd.DataFrame) -> None:
+        """Atomically write a raw chunk to the cache (temp file + rename)."""
+        try:
+            ensure_dir(path.parent)
+            tmp = path.with_suffix(f".{os.getpid()}.{threading.get_ident()}.tmp")
+            df.to_parquet(tmp, compression="zstd")
+            os.replace(tmp, path)
+        except Exception as e:
+            logger.debug(f"Chunk cache write failed for {path}: {e}")
+
     def fetch_node_lmp(
         self,
         node_id: str,
         start_date: date,
         end_date: date,
         market: str = "DAY_AHEAD_HOURLY",
+        force: bool = False,
     ) -> pd.DataFrame:
         """
         Fetch LMP data for a node over an arbitrary date range.
 
-        Automatically chunks into bite-sized requests per RTO limits.
+        Automatically chunks into bite-sized requests per RTO limits and
+        fetches up to `parallelism` chunks concurrently.
 
         Returns DataFrame with columns:
             timestamp_utc, node_id, lmp, energy_component,
             congestion_component, loss_component
         """
-        all_chunks = []
-        chunk_start = start_date
+        all_chunks = self._fetch_chunks(
+            node_id, self._date_chunks(start_date, end_date), market=market,
+            force=force,
+        )
+        return self._merge_chunks(all_chunks, node_id)
 
-        while chunk_start < end_date:
-            chunk_end = min(chunk_start + timedelta(days=self._chunk_days), end_date)
-            logger.info(f"  Fetching {self._rto}/{node_id}: {chunk_start} to {chunk_end}")
-
-            df = self._fetch_chunk(
-                node_id,
-                start=str(chunk_start),
-                end=str(chunk_end),
-                market=market,
-            )
-
-            if not df.empty:
-                all_chunks.append(df)
-
-            chunk_start = chunk_end
-
-        if not all_chunks:
-            return pd.DataFrame()
-
-        combined = pd.concat(all_chunks, ignore_index=True)
-        return self._normalize(combined, node_id)
+    def fetch_node_lmp_table(
+        self,
+        node_id: str,
+        start_date: date,
+        end_date: date,
+        market: str = "DAY_AHEAD_HOURLY",
+        force: bool = False,
+    ) -> pa.Table:
+        """Like fetch_node_lmp, but returns a CANONICAL_SCHEMA Arrow table."""
+        all_chunks = self._fetch_chunks(
+            node_id, self._date_chunks(start_date, end_date), market=market,
+            force=force,
+        )
+        return self._merge_chunks_table(all_chunks, node_id)
 
     def fetch_hub_baseline(
         self,
         start_date: date,
         end_date: date,
         hub: Optional[str] = None,
+        force: bool = False,
     ) -> pd.DataFrame:
         """
         Fetch hub LMP for use as regional baseline.
@@ -192,75 +456,130 @@ class GridStatusLMPAdapter:
         Returns DataFrame with columns: timestamp_utc, node_id, lmp,
         energy_component, congestion_component, loss_component
         """
+        hub_node, baseline_node_id = self._resolve_hub(hub)
+        all_chunks = self._fetch_chunks(
+            hub_node, self._date_chunks(start_date, end_date), force=force,
+        )
+        return self._merge_chunks(all_chunks, baseline_node_id)
+
+    def fetch_hub_baseline_table(
+        self,
+        start_date: date,
+        end_date: date,
+        hub: Optional[str] = None,
+        force: bool = False,
+    ) -> pa.Table:
+        """Like fetch_hub_baseline, but returns a CANONICAL_SCHEMA Arrow table."""
+        hub_node, baseline_node_id = self._resolve_hub(hub)
+        all_chunks = self._fetch_chunks(
+            hub_node, self._date_chunks(start_date, end_date), force=force,
+        )
+        return self._merge_chunks_table(all_chunks, baseline_node_id)
+
+    def _resolve_hub(self, hub: Optional[str]) -> tuple[str, str]:
+        """Map a hub name (default: the RTO's default hub) to (hub node, baseline id)."""
         if hub is None:
             hub = self._config["default_hub"]
 
-        hub_node = self._config["hubs"].get(hub)
+        hub_node = self._hubs.get(hub)
         if not hub_node:
             raise ValueError(
                 f"Unknown hub '{hub}' for {self._rto}. "
-                f"Available: {list(self._config['hubs'])}"
+                f"Available: {list(self._hub_names)}"
             )
 
-        baseline_node_id = f"{self._rto}_{hub}_BASELINE"
         logger.info(f"Fetching {self._rto} {hub} baseline ({hub_node})")
-
-        all_chunks = []
-        chunk_start = start_date
-
-        while chunk_start < end_date:
-            chunk_end = min(chunk_start + timedelta(days=self._chunk_days), end_date)
-            logger.info(f"  Fetching {hub_node}: {chunk_start} to {chunk_end}")
-
-            df = self._fetch_chunk(
-                hub_node,
-                start=str(chunk_start),
-                end=str(chunk_end),
-            )
-
-            if not df.empty:
-                all_chunks.append(df)
-
-            chunk_start = chunk_end
-
-        if not all_chunks:
-            return pd.DataFrame()
-
-        combined = pd.concat(all_chunks, ignore_index=True)
-        return self._normalize(combined, baseline_node_id)
+        return hub_node, f"{self._rto}_{hub}_BASELINE"
 
     def _normalize(self, df: pd.DataFrame, node_id: str) -> pd.DataFrame:
         """Normalize gridstatus output to canonical schema.
 
         Handles column naming differences across CAISO, MISO, SPP, PJM.
         """
-        if df.empty:
-            return pd.DataFrame()
+        chunk = self._normalize_chunk(df)
+        return self._merge_chunks([chunk] if chunk is not None else [], node_id)
+
+    def _normalize_chunk(self, df: pd.DataFrame) -> Optional[dict[str, np.ndarray]]:
+        """Extract canonical float64 / UTC timestamp columns from one raw chunk.
 
-        out = pd.DataFrame()
+        Returns None for empty chunks or chunks without a timestamp column.
+        """
+        if df.empty:
+            return None
 
         # Timestamp: gridstatus uses "Interval Start" or "Time"
         if "Interval Start" in df.columns:
-            ts = pd.to_datetime(df["Interval Start"])
+            ts = _utc_naive_ns(df["Interval Start"])
         elif "Time" in df.columns:
-            ts = pd.to_datetime(df["Time"])
+            ts = _utc_naive_ns(df["Time"])
         else:
             logger.warning(f"No timestamp column found in {self._rto} data")
+            return None
+
+        n = len(df)
+
+        def component(col: str) -> np.ndarray:
+            if col in df.columns:
+                return df[col].to_numpy(dtype=np.float64, copy=False)
+            return np.full(n, np.nan)
+
+        return {
+            "timestamp_utc": ts,
+            "lmp": df["LMP"].to_numpy(dtype=np.float64, copy=False),
+            "energy_component": component("Energy"),
+            "congestion_component": component("Congestion"),
+            "loss_component": component("Loss"),
+        }
+
+    @staticmethod
+    def _merge_arrays(
+        chunks: list[dict[str, np.ndarray]],
+    ) -> Optional[dict[str, np.ndarray]]:
+        """Concatenate normalized chunks once, deduplicated and time-sorted."""
+        if not chunks:
+            return None
+
+        merged = {k: np.concatenate([c[k] for c in chunks]) for k in chunks[0]}
+
+        # Deduplicate on timestamp (DST transitions and chunk boundaries can
+        # overlap), keeping the first row per timestamp, and sort in one pass
+        keep = first_row_per_timestamp(merged["timestamp_utc"].view("i8"))
+        return {k: v[keep] for k, v in merged.items()}
+
+    @classmethod
+    def _merge_chunks(
+        cls, chunks: list[dict[str, np.ndarray]], node_id: str,
+    ) -> pd.DataFrame:
+        """Build the canonical DataFrame from normalized chunks."""
+        merged = cls._merge_arrays(chunks)
+        if merged is None:
             return pd.DataFrame()
 
-        # Convert to UTC if timezone-aware
-        if ts.dt.tz is not None:
-            ts = ts.dt.tz_convert("UTC").dt.tz_localize(None)
-
-        out["timestamp_utc"] = ts
-        out["node_id"] = node_id
-        out["lmp"] = df["LMP"].astype(float)
-        out["energy_component"] = df.get("Energy", pd.Series(dtype=float)).astype(float)
-        out["congestion_component"] = df.get("Congestion", pd.Series(dtype=float)).astype(float)
-        out["loss_component"] = df.get("Loss", pd.Series(dtype=float)).astype(float)
-
-        # Deduplicate on timestamp (DST transitions can cause overlap)
-        out = out.drop_duplicates(subset=["timestamp_utc", "node_id"], keep="first")
-        out = out.sort_values("timestamp_utc").reset_index(drop=True)
-
-        return out
+        n = len(merged["timestamp_utc"])
+        out = {
+            "timestamp_utc": merged.pop("timestamp_utc"),
+            "node_id": np.full(n, node_id, dtype=object),
+        }
+        out.update(merged)
+        return pd.DataFrame(out)
+
+    @classmethod
+    def _merge_chunks_table(
+        cls, chunks: list[dict[str, np.ndarray]], node_id: str,
+    ) -> pa.Table:
+        """Build a CANONICAL_SCHEMA Arrow table from normalized chunks.
+
+        Columns wrap the merged NumPy buffers without copying; node_id is
+        dictionary-encoded against a single-entry dictionary.
+        """
+        merged = cls._merge_arrays(chunks)
+        if merged is None:
+            return CANONICAL_SCHEMA.empty_table()
+
+        n = len(merged["timestamp_utc"])
+        node_ids = pa.DictionaryArray.from_arrays(
+            pa.array(np.zeros(n, dtype=np.int32)), pa.array([node_id]),
+        )
+        columns = {"timestamp_utc": merged.pop("timestamp_utc"), "node_id": node_ids}
+        columns.update(merged)
+        return pa.Table.from_pydict(columns, schema=CANONICAL_SCHEMA)
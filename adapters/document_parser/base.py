@@ -48,7 +48,7 @@ class Confidence(str, Enum):
     UNVERIFIED = "unverified"  # Needs human review
 
 
-@dataclass
+@dataclass(slots=True)
 class ParsedTable:
     """A table extracted from a document."""
     df: pd.DataFrame
@@ -59,7 +59,7 @@ class ParsedTable:
     source_method: str = ""  # tabula, pdfplumber, openpyxl, etc.
 
 
-@dataclass
+@dataclass(slots=True)
 class ExtractedData:
     """Structured data extracted from a document via parsing or LLM."""
     extraction_type: ExtractionType
@@ -72,7 +72,11 @@ class ExtractedData:
     notes: Optional[str] = None
 
 
-@dataclass
+# Confidence levels that flag an extraction for human review
+_REVIEW_CONFIDENCE = frozenset({Confidence.LOW, Confidence.UNVERIFIED})
+
+
+@dataclass(slots=True)
 class DocumentParseResult:
     """Complete result from parsing a single document."""
     file_path: str
@@ -98,5 +102,4 @@ class DocumentParseResult:
 
     @property
     def needs_review(self) -> bool:
-        return any(e.confidence in (Confidence.LOW, Confidence.UNVERIFIED)
-                   for e in self.extractions)
+        return any(e.confidence in _REVIEW_CONFIDENCE for e in self.extractions)
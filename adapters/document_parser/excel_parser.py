@@ -7,7 +7,14 @@ Handles structured data files from utility filings:
   - Rate schedule tables
 """
 
+import hashlib
+import json
 import logging
+import os
+import re
+import shutil
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import Optional
 
@@ -17,6 +24,17 @@ from .base import Confidence, ParsedTable
 
 logger = logging.getLogger(__name__)
 
+# openpyxl streaming mode: no styles, cached formula values, no external links
+OPENPYXL_KWARGS = {"read_only": True, "data_only": True, "keep_links": False}
+
+# Sheets parsed concurrently per workbook
+SHEET_PARALLELISM = 8
+
+# On-disk memo of parse results, keyed by file content and parse options.
+# Bump PARSE_CACHE_VERSION when parsing output changes.
+PARSE_CACHE_DIR: Optional[Path] = Path.home() / ".cache" / "grid_constraint_classifier" / "excel"
+PARSE_CACHE_VERSION = 1
+
 
 def parse_excel(
     file_path: Path,
@@ -26,9 +44,43 @@ def parse_excel(
     """Parse an Excel file into ParsedTable objects.
 
     Reads all sheets (up to max_sheets) and returns non-empty tables.
+    Cells are read as strings (empty cells stay NaN); callers that need
+    numbers coerce the relevant columns with pd.to_numeric.
+
+    Sheets share one loaded workbook per thread: serial reads reuse the
+    handle used to list sheets, and concurrent reads give each worker its
+    own (openpyxl read-only workbooks are not thread-safe), the first of
+    which is that same handle.
+    Results are memoized on disk under PARSE_CACHE_DIR (None disables).
     """
+    cache_dir = None
+    if PARSE_CACHE_DIR is not None:
+        try:
+            key = _parse_cache_key(file_path, sheet_name, max_sheets)
+            cache_dir = Path(PARSE_CACHE_DIR) / key
+        except OSError:
+            pass
+
+    if cache_dir is not None:
+        cached = _load_cached_tables(cache_dir)
+        if cached is not None:
+            logger.info(f"Loaded {len(cached)} cached tables for {file_path.name}")
+            return cached
+
+    results = _parse_file(file_path, sheet_name, max_sheets)
+
+    if cache_dir is not None and results:
+        _store_cached_tables(cache_dir, results)
+    return results
+
+
+def _parse_file(
+    file_path: Path,
+    sheet_name: Optional[str],
+    max_sheets: int,
+) -> list[ParsedTable]:
+    """Parse a CSV/TSV/Excel file without consulting the cache."""
     suffix = file_path.suffix.lower()
-    results = []
 
     if suffix == ".csv":
         return _parse_csv(file_path)
@@ -37,39 +89,187 @@ def parse_excel(
         return _parse_csv(file_path, sep="\t")
 
     try:
-        xls = pd.ExcelFile(file_path)
+        xls = _open_excel(file_path)
     except Exception as e:
         logger.error(f"Failed to open {file_path.name}: {e}")
         return []
 
     sheets = [sheet_name] if sheet_name else xls.sheet_names[:max_sheets]
+    workers = min(SHEET_PARALLELISM, len(sheets))
 
-    for i, sheet in enumerate(sheets):
+    if workers <= 1:
         try:
-            df = pd.read_excel(xls, sheet_name=sheet)
+            tables = [_read_one_sheet(xls, sheet, i, file_path.name)
+                      for i, sheet in enumerate(sheets)]
+        finally:
+            xls.close()
+    else:
+        # The workbook opened above is handed to the first worker; only the
+        # remaining workers open their own handle
+        local = threading.local()
+        handles_lock = threading.Lock()
+        spare = [xls]
+        opened = []
 
-            # Skip empty or header-only sheets
-            if df.empty or len(df) < 1:
-                continue
+        def read(item: tuple[int, str]) -> Optional[ParsedTable]:
+            i, sheet = item
+            worker_xls = getattr(local, "xls", None)
+            if worker_xls is None:
+                with handles_lock:
+                    worker_xls = spare.pop() if spare else None
+                if worker_xls is None:
+                    try:
+                        worker_xls = _open_excel(file_path)
+                    except Exception as e:
+                        logger.warning(f"Failed to read sheet '{sheet}' from {file_path.name}: {e}")
+                        return None
+                local.xls = worker_xls
+                with handles_lock:
+                    opened.append(worker_xls)
+            return _read_one_sheet(worker_xls, sheet, i, file_path.name)
+
+        try:
+            with ThreadPoolExecutor(max_workers=workers) as pool:
+                tables = list(pool.map(read, enumerate(sheets)))
+        finally:
+            for worker_xls in opened + spare:
+                worker_xls.close()
+
+    results = [t for t in tables if t is not None]
+    logger.info(f"Parsed {len(results)} sheets from {file_path.name}")
+    return results
+
+
+def _parse_cache_key(
+    file_path: Path, sheet_name: Optional[str], max_sheets: int,
+) -> str:
+    """Cache key from size, mtime, the first 64 KB, and the parse options."""
+    st = file_path.stat()
+    h = hashlib.blake2b(digest_size=16)
+    h.update(
+        f"{PARSE_CACHE_VERSION}|{st.st_size}|{st.st_mtime_ns}|"
+        f"{file_path.suffix.lower()}|{sheet_name}|{max_sheets}|".encode()
+    )
+    with open(file_path, "rb") as f:
+        h.update(f.read(65536))
+    return h.hexdigest()
 
-            # Clean up: drop fully empty rows and columns
-            df = df.dropna(how="all").dropna(axis=1, how="all")
-            if df.empty:
-                continue
 
-            results.append(ParsedTable(
+def _load_cached_tables(cache_dir: Path) -> Optional[list[ParsedTable]]:
+    """Load memoized tables, or None on a miss or unreadable entry."""
+    meta_path = cache_dir / "meta.json"
+    if not meta_path.exists():
+        return None
+    try:
+        meta = json.loads(meta_path.read_text())
+        tables = []
+        for i, entry in enumerate(meta):
+            df = pd.read_parquet(cache_dir / f"table_{i}.parquet")
+            df.columns = entry["columns"]
+            tables.append(ParsedTable(
                 df=df,
-                table_index=i,
-                title=sheet,
-                confidence=Confidence.HIGH,
-                source_method="openpyxl",
+                page_number=entry["page_number"],
+                table_index=entry["table_index"],
+                title=entry["title"],
+                confidence=Confidence(entry["confidence"]),
+                source_method=entry["source_method"],
             ))
+        return tables
+    except Exception as e:
+        logger.debug(f"Parse cache read failed for {cache_dir}: {e}")
+        return None
 
-        except Exception as e:
-            logger.warning(f"Failed to read sheet '{sheet}' from {file_path.name}: {e}")
 
-    logger.info(f"Parsed {len(results)} sheets from {file_path.name}")
-    return results
+def _store_cached_tables(cache_dir: Path, tables: list[ParsedTable]) -> None:
+    """Write tables as parquet plus a meta.json sidecar, then rename into place.
+
+    Column labels are kept in the sidecar (parquet needs string names).
+    Tables with labels JSON cannot round-trip (e.g. datetimes) are not cached.
+    """
+    meta = []
+    for t in tables:
+        columns = list(t.df.columns)
+        if not all(isinstance(c, (str, int, float)) for c in columns):
+            return
+        meta.append({
+            "columns": columns,
+            "page_number": t.page_number,
+            "table_index": t.table_index,
+            "title": t.title,
+            "confidence": t.confidence.value,
+            "source_method": t.source_method,
+        })
+
+    tmp = cache_dir.with_name(f"{cache_dir.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+    try:
+        tmp.mkdir(parents=True, exist_ok=True)
+        for i, t in enumerate(tables):
+            df = t.df.copy(deep=False)
+            df.columns = [f"c{j}" for j in range(df.shape[1])]
+            df.to_parquet(tmp / f"table_{i}.parquet", index=False)
+        (tmp / "meta.json").write_text(json.dumps(meta))
+        os.replace(tmp, cache_dir)
+    except Exception as e:
+        logger.debug(f"Parse cache write failed for {cache_dir}: {e}")
+        shutil.rmtree(tmp, ignore_errors=True)
+
+
+def _open_excel(file_path: Path) -> pd.ExcelFile:
+    """Open a workbook, streaming .xlsx/.xlsm through openpyxl read-only mode."""
+    if file_path.suffix.lower() in (".xlsx", ".xlsm"):
+        return pd.ExcelFile(
+            file_path, engine="openpyxl", engine_kwargs=OPENPYXL_KWARGS,
+        )
+    return pd.ExcelFile(file_path)
+
+
+def _has_data_rows(xls: pd.ExcelFile, sheet: str) -> bool:
+    """Whether a sheet has any non-blank cell below its header row.
+
+    pandas takes the first physical row as the header, so a sheet with no
+    values past row 1 parses to an empty frame. This streams raw openpyxl
+    rows and stops at the first value, rejecting such sheets without
+    building a DataFrame. Other engines are not probed.
+    """
+    if xls.engine != "openpyxl":
+        return True
+    for row in xls.book[sheet].iter_rows(min_row=2, values_only=True):
+        if any(v is not None and v != "" for v in row):
+            return True
+    return False
+
+
+def _read_one_sheet(
+    xls: pd.ExcelFile, sheet: str, index: int, file_name: str,
+) -> Optional[ParsedTable]:
+    """Read and clean one sheet; None if it is empty or unreadable."""
+    try:
+        # Cover pages, blank and header-only sheets: skip without a DataFrame
+        if not _has_data_rows(xls, sheet):
+            return None
+
+        df = pd.read_excel(xls, sheet_name=sheet, dtype=str)
+
+        # Skip empty or header-only sheets
+        if df.empty or len(df) < 1:
+            return None
+
+        # Clean up: drop fully empty rows and columns
+        df = df.dropna(how="all").dropna(axis=1, how="all")
+        if df.empty:
+            return None
+
+        return ParsedTable(
+            df=df,
+            table_index=index,
+            title=sheet,
+            confidence=Confidence.HIGH,
+            source_method="openpyxl",
+        )
+
+    except Exception as e:
+        logger.warning(f"Failed to read sheet '{sheet}' from {file_name}: {e}")
+        return None
 
 
 def _parse_csv(file_path: Path, sep: str = ",") -> list[ParsedTable]:
@@ -93,35 +293,48 @@ def _parse_csv(file_path: Path, sep: str = ",") -> list[ParsedTable]:
         return []
 
 
+def _keyword_pattern(*keywords: str) -> re.Pattern:
+    """Compile a substring alternation over literal keywords."""
+    return re.compile("|".join(re.escape(kw) for kw in keywords))
+
+
+# Column-name keyword patterns for detect_table_type, compiled once so each
+# check is a single regex scan instead of one substring search per keyword
+_LOAD_FORECAST = _keyword_pattern("peak_demand", "peak demand", "energy_gwh", "forecast", "growth")
+_LOAD_FORECAST_UNITS = _keyword_pattern("year", "mw", "gwh")
+_HOSTING_CAPACITY = _keyword_pattern("hosting", "integration capacity", "feeder", "circuit")
+_HOSTING_CAPACITY_UNITS = _keyword_pattern("mw", "kw", "capacity")
+_GRID_CONSTRAINT = _keyword_pattern("constraint", "overload", "thermal", "voltage limit")
+_RESOURCE_NEED = _keyword_pattern("resource", "procurement", "need", "shortfall")
+_RESOURCE_NEED_UNITS = _keyword_pattern("mw", "capacity")
+_AVOIDED_COST = _keyword_pattern("avoided cost", "marginal", "$/kwh", "$/mwh")
+
+
 def detect_table_type(df: pd.DataFrame) -> Optional[str]:
     """Attempt to classify what kind of data a table contains.
 
     Returns an extraction_type string or None if unrecognized.
     """
-    cols_lower = [str(c).lower() for c in df.columns]
-    all_cols = " ".join(cols_lower)
+    all_cols = " ".join(str(c).lower() for c in df.columns)
 
     # Load forecast indicators
-    if any(kw in all_cols for kw in ("peak_demand", "peak demand", "energy_gwh", "forecast", "growth")):
-        if any(kw in all_cols for kw in ("year", "mw", "gwh")):
-            return "load_forecast"
+    if _LOAD_FORECAST.search(all_cols) and _LOAD_FORECAST_UNITS.search(all_cols):
+        return "load_forecast"
 
     # Hosting capacity indicators
-    if any(kw in all_cols for kw in ("hosting", "integration capacity", "feeder", "circuit")):
-        if any(kw in all_cols for kw in ("mw", "kw", "capacity")):
-            return "hosting_capacity"
+    if _HOSTING_CAPACITY.search(all_cols) and _HOSTING_CAPACITY_UNITS.search(all_cols):
+        return "hosting_capacity"
 
     # Grid constraint indicators
-    if any(kw in all_cols for kw in ("constraint", "overload", "thermal", "voltage limit")):
+    if _GRID_CONSTRAINT.search(all_cols):
         return "grid_constraint"
 
     # Resource need indicators
-    if any(kw in all_cols for kw in ("resource", "procurement", "need", "shortfall")):
-        if any(kw in all_cols for kw in ("mw", "capacity")):
-            return "resource_need"
+    if _RESOURCE_NEED.search(all_cols) and _RESOURCE_NEED_UNITS.search(all_cols):
+        return "resource_need"
 
     # Avoided cost indicators
-    if any(kw in all_cols for kw in ("avoided cost", "marginal", "$/kwh", "$/mwh")):
+    if _AVOIDED_COST.search(all_cols):
         return "avoided_cost"
 
     return None
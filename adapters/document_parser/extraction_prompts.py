@@ -5,6 +5,8 @@ from utility regulatory filings. Prompts instruct the LLM to return
 JSON conforming to the expected schema for each extraction type.
 """
 
+from types import MappingProxyType
+
 SYSTEM_PROMPT = (
     "You are a utility regulatory analyst specializing in electric grid "
     "planning data extraction. Extract structured data from utility filings "
@@ -159,10 +161,11 @@ Rules:
 - Keep key_findings concise (1-2 sentences each)"""
 
 
-PROMPTS = {
+# Read-only: shared by every extraction call, so callers never need a copy
+PROMPTS = MappingProxyType({
     "load_forecast": LOAD_FORECAST_PROMPT,
     "grid_constraint": GRID_CONSTRAINT_PROMPT,
     "resource_need": RESOURCE_NEED_PROMPT,
     "hosting_capacity": HOSTING_CAPACITY_PROMPT,
     "general_summary": GENERAL_SUMMARY_PROMPT,
-}
+})
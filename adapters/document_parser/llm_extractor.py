@@ -4,20 +4,78 @@ Sends document text (or table text) to Claude with structured extraction
 prompts, then parses the JSON response into ExtractedData objects.
 """
 
+import copy
+import hashlib
 import json
 import logging
 import os
+import re
+import threading
+import time
+from collections import OrderedDict
+from functools import lru_cache
+from types import MappingProxyType
 from typing import Optional
 
+try:
+    # orjson.JSONDecodeError subclasses json.JSONDecodeError, so callers
+    # catch the same exception either way
+    from orjson import loads as _json_loads
+except ImportError:
+    from json import loads as _json_loads
+
 from .base import Confidence, ExtractedData, ExtractionType
 from .extraction_prompts import PROMPTS, SYSTEM_PROMPT
+from .semantic_cache import SemanticCache, embed_text
 
 logger = logging.getLogger(__name__)
 
-# Default model for extraction
+# Default model for extraction; FAST_MODEL is tried first when no model is
+# pinned, escalating to DEFAULT_MODEL on low-confidence or invalid output
 DEFAULT_MODEL = "claude-sonnet-4-5-20250929"
+FAST_MODEL = "claude-haiku-4-5-20251001"
 MAX_INPUT_CHARS = 100_000  # ~25K tokens
 
+# Local retries around each extraction call (on top of the SDK's own):
+# rate limited (429) and overloaded (529) responses, and timeouts
+LLM_MAX_RETRIES = 3
+LLM_RETRY_BACKOFF_S = (1.0, 4.0, 16.0)
+LLM_RETRY_AFTER_CAP_S = 60.0
+RETRY_STATUS = {429, 529}
+
+# In-process LRU of successful extractions, keyed by text digest and options
+EXTRACTION_CACHE_SIZE = 1024
+_EXTRACTION_CACHE: "OrderedDict[tuple, ExtractedData]" = OrderedDict()
+_EXTRACTION_CACHE_LOCK = threading.Lock()
+
+# Near-duplicate documents (e.g. successive years of the same filing) reuse
+# a prior extraction with the same options instead of calling the API. A
+# near-duplicate may be an errata that changes a few numbers, so a reused
+# result is marked UNVERIFIED for review. Set SEMANTIC_CACHE_ENABLED to
+# False to always extract unless the text matches exactly.
+SEMANTIC_CACHE_ENABLED = True
+_SEMANTIC_CACHE = SemanticCache(max_entries=EXTRACTION_CACHE_SIZE)
+SEMANTIC_HIT_NOTE = "semantic cache hit"
+
+# PROMPTS key -> ExtractionType recorded on the result
+ETYPE_MAP = MappingProxyType({
+    "load_forecast": ExtractionType.LOAD_FORECAST,
+    "grid_constraint": ExtractionType.GRID_CONSTRAINT,
+    "resource_need": ExtractionType.RESOURCE_NEED,
+    "hosting_capacity": ExtractionType.HOSTING_CAPACITY,
+    "general_summary": ExtractionType.GENERAL_SUMMARY,
+})
+
+# Message Batches polling (batches usually end within minutes)
+BATCH_POLL_INTERVAL_S = 10
+BATCH_TIMEOUT_S = 3600
+
+# Prompt-cache breakpoint. The system prompt and the document block form a
+# prefix that is identical across extraction types for the same document,
+# so every extraction after the first reads it from the cache.
+CACHE_CONTROL = {"type": "ephemeral"}
+SYSTEM_BLOCKS = [{"type": "text", "text": SYSTEM_PROMPT, "cache_control": CACHE_CONTROL}]
+
 
 def extract_with_llm(
     text: str,
@@ -28,18 +86,330 @@ def extract_with_llm(
 ) -> Optional[ExtractedData]:
     """Use Claude to extract structured data from document text.
 
+    Without a pinned model, FAST_MODEL runs first and DEFAULT_MODEL is
+    called only when that result is low-confidence or unparseable.
+
     Args:
         text: Document text or table text to extract from.
         extraction_type: One of the keys in PROMPTS dict.
         utility_name: Utility name for context.
-        model: Claude model to use.
+        model: Claude model to use (skips the cascade).
         max_tokens: Max response tokens.
 
     Returns:
         ExtractedData object or None if extraction fails.
     """
+    if extraction_type not in PROMPTS:
+        logger.error(f"Unknown extraction type: {extraction_type}")
+        return None
+
+    text = _truncate(text)
+    key = _cache_key(text, extraction_type, utility_name, model, max_tokens)
+    cached = _cache_get(key)
+    if cached is not None:
+        return cached
+    vector = embed_text(text) if SEMANTIC_CACHE_ENABLED else None
+    similar = _semantic_get(key, vector)
+    if similar is not None:
+        return similar
+
+    client = _anthropic_client()
+    if client is None:
+        return None
+
+    if model is not None:
+        extracted = _extract_once(client, text, extraction_type, utility_name, model, max_tokens)
+    else:
+        extracted = _extract_once(client, text, extraction_type, utility_name, FAST_MODEL, max_tokens)
+        if _needs_escalation(extracted):
+            strong = _extract_once(
+                client, text, extraction_type, utility_name, DEFAULT_MODEL, max_tokens,
+            )
+            extracted = _escalated(extracted, strong)
+
+    _cache_put(key, extracted)
+    _SEMANTIC_CACHE.add(key[1:], vector, extracted)
+    return extracted
+
+
+def extract_many_with_llm(
+    text: str,
+    extraction_types: list[str],
+    utility_name: Optional[str] = None,
+    model: Optional[str] = None,
+    max_tokens: int = 4096,
+    poll_interval: float = BATCH_POLL_INTERVAL_S,
+    timeout: float = BATCH_TIMEOUT_S,
+) -> dict[str, Optional[ExtractedData]]:
+    """Run several extraction types over one document as one Message Batch.
+
+    Batched requests are billed at half price and need a single submission
+    instead of one round trip per type. A lone type, or a batch that cannot
+    be submitted or does not end within timeout, falls back to one request
+    per type. Without a pinned
+    model the cascade of extract_with_llm applies, with the escalated
+    types sent as a second batch.
+
+    Returns:
+        {extraction_type: ExtractedData or None}, in extraction_types order.
+    """
+    results: dict[str, Optional[ExtractedData]] = {etype: None for etype in extraction_types}
+    text = _truncate(text)
+    vector = embed_text(text) if SEMANTIC_CACHE_ENABLED else None
+
+    known = []
+    for etype in results:
+        if etype not in PROMPTS:
+            logger.error(f"Unknown extraction type: {etype}")
+            continue
+        key = _cache_key(text, etype, utility_name, model, max_tokens)
+        results[etype] = _cache_get(key) or _semantic_get(key, vector)
+        if results[etype] is None:
+            known.append(etype)
+
+    if len(known) <= 1:
+        for etype in known:
+            results[etype] = extract_with_llm(text, etype, utility_name, model, max_tokens)
+        return results
+
+    client = _anthropic_client()
+    if client is None:
+        return results
+
+    # After a batch fails or times out, later rounds go straight to
+    # per-type requests instead of waiting on another batch
+    use_batch = True
+
+    def run(etypes: list[str], run_model: str) -> dict[str, Optional[ExtractedData]]:
+        nonlocal use_batch
+        batched = None
+        if use_batch:
+            batched = _run_batch(
+                client, text, etypes, utility_name, run_model, max_tokens, poll_interval, timeout,
+            )
+            use_batch = batched is not None
+        if batched is None:
+            batched = {
+                etype: _extract_once(client, text, etype, utility_name, run_model, max_tokens)
+                for etype in etypes
+            }
+        return batched
+
+    if model is not None:
+        results.update(run(known, model))
+    else:
+        results.update(run(known, FAST_MODEL))
+        escalate = [etype for etype in known if _needs_escalation(results[etype])]
+        if escalate:
+            logger.info(f"Escalating {escalate} from {FAST_MODEL} to {DEFAULT_MODEL}")
+            for etype, strong in run(escalate, DEFAULT_MODEL).items():
+                results[etype] = _escalated(results[etype], strong)
+
+    for etype in known:
+        key = _cache_key(text, etype, utility_name, model, max_tokens)
+        _cache_put(key, results[etype])
+        _SEMANTIC_CACHE.add(key[1:], vector, results[etype])
+    return results
+
+
+def _cache_key(
+    text: str, extraction_type: str, utility_name: Optional[str],
+    model: Optional[str], max_tokens: int,
+) -> tuple:
+    """Extraction cache key: a digest of the (truncated) text plus the options."""
+    digest = hashlib.blake2b(text.encode(), digest_size=16).digest()
+    return (digest, extraction_type, utility_name, model, max_tokens)
+
+
+def _cache_get(key: tuple) -> Optional[ExtractedData]:
+    """A copy of the memoized extraction for key, or None."""
+    with _EXTRACTION_CACHE_LOCK:
+        hit = _EXTRACTION_CACHE.get(key)
+        if hit is None:
+            return None
+        _EXTRACTION_CACHE.move_to_end(key)
+    return copy.deepcopy(hit)
+
+
+def _semantic_get(key: tuple, vector) -> Optional[ExtractedData]:
+    """A prior extraction of a near-duplicate text with the same options.
+
+    The copy keeps its notes with SEMANTIC_HIT_NOTE appended and is
+    downgraded to UNVERIFIED, since the texts may differ in the values.
+    """
+    if not SEMANTIC_CACHE_ENABLED:
+        return None
+    similar = _SEMANTIC_CACHE.lookup(key[1:], vector)
+    if similar is not None:
+        logger.info(f"Reusing {key[1]} extraction of a near-duplicate document")
+        similar.notes = f"{similar.notes}; {SEMANTIC_HIT_NOTE}" if similar.notes else SEMANTIC_HIT_NOTE
+        similar.confidence = Confidence.UNVERIFIED
+    return similar
+
+
+def _cache_put(key: tuple, extracted: Optional[ExtractedData]) -> None:
+    """Memoize a successful extraction (failures are retried next time)."""
+    if extracted is None:
+        return
+    with _EXTRACTION_CACHE_LOCK:
+        _EXTRACTION_CACHE[key] = copy.deepcopy(extracted)
+        _EXTRACTION_CACHE.move_to_end(key)
+        while len(_EXTRACTION_CACHE) > EXTRACTION_CACHE_SIZE:
+            _EXTRACTION_CACHE.popitem(last=False)
+
+
+def _extract_once(
+    client, text: str, extraction_type: str, utility_name: Optional[str],
+    model: str, max_tokens: int,
+) -> Optional[ExtractedData]:
+    """One streamed Messages API extraction call; None (logged) on any failure."""
+    logger.info(
+        f"LLM extraction: type={extraction_type}, model={model}, "
+        f"input_chars={len(text)}"
+    )
+
+    params = _build_request(text, PROMPTS[extraction_type], utility_name, model, max_tokens)
+    try:
+        for attempt in range(LLM_MAX_RETRIES + 1):
+            try:
+                # Streamed so long generations are read as they arrive rather
+                # than held open as one blocking request (which the SDK may
+                # time out)
+                with client.messages.stream(**params) as stream:
+                    response = stream.get_final_message()
+                break
+            except Exception as e:
+                wait = _retry_delay(e, attempt)
+                if wait is None or attempt == LLM_MAX_RETRIES:
+                    raise
+                logger.warning(
+                    f"LLM extraction ({extraction_type}) attempt {attempt + 1} failed: {e}; "
+                    f"retrying in {wait:.1f}s"
+                )
+                time.sleep(wait)
+
+        _log_cache_usage(response, extraction_type)
+        return _parse_response(response, extraction_type, text, model)
+    except Exception as e:
+        logger.error(f"LLM extraction failed: {e}")
+        return None
+
+
+def _retry_delay(exc: Exception, attempt: int) -> Optional[float]:
+    """Seconds to wait before retrying after `exc`, or None if a retry cannot help.
+
+    Rate-limited and overloaded responses honour Retry-After (capped at
+    LLM_RETRY_AFTER_CAP_S); timeouts back off per LLM_RETRY_BACKOFF_S.
+    """
+    backoff = LLM_RETRY_BACKOFF_S[min(attempt, len(LLM_RETRY_BACKOFF_S) - 1)]
+
+    if getattr(exc, "status_code", None) in RETRY_STATUS:
+        response = getattr(exc, "response", None)
+        headers = getattr(response, "headers", None) or {}
+        try:
+            return min(float(headers.get("retry-after")), LLM_RETRY_AFTER_CAP_S)
+        except (TypeError, ValueError):
+            return backoff
+
+    if isinstance(exc, TimeoutError):
+        return backoff
     try:
         import anthropic
+    except ImportError:
+        return None
+    return backoff if isinstance(exc, anthropic.APITimeoutError) else None
+
+
+def _run_batch(
+    client, text: str, extraction_types: list[str], utility_name: Optional[str],
+    model: str, max_tokens: int, poll_interval: float, timeout: float,
+) -> Optional[dict[str, Optional[ExtractedData]]]:
+    """Submit one Message Batch and collect its results by custom_id.
+
+    Returns None if the batch could not be submitted or did not end within
+    timeout (it is then cancelled), so the caller extracts type by type.
+    """
+    results: dict[str, Optional[ExtractedData]] = {etype: None for etype in extraction_types}
+    batch_requests = [
+        {
+            "custom_id": etype,
+            "params": _build_request(text, PROMPTS[etype], utility_name, model, max_tokens),
+        }
+        for etype in extraction_types
+    ]
+
+    try:
+        batch = client.messages.batches.create(requests=batch_requests)
+    except Exception as e:
+        logger.warning(f"Batch submission failed ({e}), extracting one type at a time")
+        return None
+
+    logger.info(
+        f"LLM batch {batch.id}: types={extraction_types}, model={model}, "
+        f"input_chars={len(text)}"
+    )
+
+    deadline = time.monotonic() + timeout
+    try:
+        while batch.processing_status != "ended":
+            if time.monotonic() >= deadline:
+                logger.error(f"LLM batch {batch.id} timed out after {timeout:.0f}s; cancelling")
+                client.messages.batches.cancel(batch.id)
+                return None
+            time.sleep(poll_interval)
+            batch = client.messages.batches.retrieve(batch.id)
+
+        for entry in client.messages.batches.results(batch.id):
+            etype = entry.custom_id
+            if entry.result.type != "succeeded":
+                logger.error(f"LLM batch {batch.id}: {etype} {entry.result.type}")
+                continue
+            # One bad entry must not drop the rest of the batch
+            try:
+                message = entry.result.message
+                _log_cache_usage(message, etype)
+                results[etype] = _parse_response(message, etype, text, model)
+            except Exception as e:
+                logger.error(f"LLM batch {batch.id}: {etype} could not be parsed: {e}")
+    except Exception as e:
+        logger.error(f"LLM batch {batch.id} failed: {e}")
+
+    return results
+
+
+def _needs_escalation(extracted: Optional[ExtractedData]) -> bool:
+    """Whether a FAST_MODEL result should be redone with DEFAULT_MODEL."""
+    return extracted is None or extracted.confidence == Confidence.LOW
+
+
+def _escalated(
+    fast: Optional[ExtractedData], strong: Optional[ExtractedData],
+) -> Optional[ExtractedData]:
+    """The DEFAULT_MODEL result, noted as escalated; the fast one if it failed."""
+    if strong is None:
+        return fast
+    strong.notes = f"escalated {FAST_MODEL}->{DEFAULT_MODEL}"
+    return strong
+
+
+_CLIENT_LOCK = threading.Lock()
+
+
+@lru_cache(maxsize=1)
+def _client_for_key(api_key: str):
+    import anthropic
+    return anthropic.Anthropic(api_key=api_key)
+
+
+def _anthropic_client():
+    """The shared Anthropic client, or None (logged) if the SDK or API key
+    is missing.
+
+    Built once per API key, so every extraction reuses one connection pool
+    instead of paying client setup and a TLS handshake per call.
+    """
+    try:
+        import anthropic  # noqa: F401 (a sys.modules lookup after the first call)
     except ImportError:
         logger.error("anthropic package not installed. Run: pip install anthropic")
         return None
@@ -49,73 +419,55 @@ def extract_with_llm(
         logger.error("ANTHROPIC_API_KEY not set")
         return None
 
-    prompt_template = PROMPTS.get(extraction_type)
-    if not prompt_template:
-        logger.error(f"Unknown extraction type: {extraction_type}")
-        return None
+    with _CLIENT_LOCK:
+        return _client_for_key(api_key)
 
-    model = model or DEFAULT_MODEL
 
-    # Truncate text if too long
+def _truncate(text: str) -> str:
+    """Cap text at MAX_INPUT_CHARS."""
     if len(text) > MAX_INPUT_CHARS:
         logger.warning(
             f"Text truncated from {len(text)} to {MAX_INPUT_CHARS} chars"
         )
         text = text[:MAX_INPUT_CHARS]
+    return text
 
-    # Build user message
-    user_content = f"Utility: {utility_name}\n\n" if utility_name else ""
-    user_content += f"Document text:\n\n{text}\n\n{prompt_template}"
-
-    logger.info(
-        f"LLM extraction: type={extraction_type}, model={model}, "
-        f"input_chars={len(text)}"
-    )
 
-    try:
-        client = anthropic.Anthropic(api_key=api_key)
-        response = client.messages.create(
-            model=model,
-            max_tokens=max_tokens,
-            system=SYSTEM_PROMPT,
-            messages=[{"role": "user", "content": user_content}],
-        )
+def _parse_response(
+    response, extraction_type: str, text: str, model: str,
+) -> Optional[ExtractedData]:
+    """Turn a Messages API response into ExtractedData; None on bad JSON.
 
-        response_text = response.content[0].text.strip()
+    The payload must be a JSON object; a list or scalar is rejected too.
+    """
+    response_text = response.content[0].text.strip()
 
+    try:
         # Parse JSON from response (handle markdown code blocks)
         json_text = _extract_json(response_text)
-        data = json.loads(json_text)
-
-        # Determine confidence based on response characteristics
-        confidence = _assess_confidence(data, extraction_type)
-
-        # Map string to enum
-        etype_map = {
-            "load_forecast": ExtractionType.LOAD_FORECAST,
-            "grid_constraint": ExtractionType.GRID_CONSTRAINT,
-            "resource_need": ExtractionType.RESOURCE_NEED,
-            "hosting_capacity": ExtractionType.HOSTING_CAPACITY,
-            "general_summary": ExtractionType.GENERAL_SUMMARY,
-        }
-
-        return ExtractedData(
-            extraction_type=etype_map.get(extraction_type, ExtractionType.GENERAL_SUMMARY),
-            data=data,
-            confidence=confidence,
-            raw_text_snippet=text[:500],
-            llm_model=model,
-            notes=f"Extracted via {model}",
-        )
-
+        data = _json_loads(json_text)
     except json.JSONDecodeError as e:
         logger.error(f"Failed to parse LLM JSON response: {e}")
         logger.debug(f"Raw response: {response_text[:500]}")
         return None
-    except Exception as e:
-        logger.error(f"LLM extraction failed: {e}")
+    if not isinstance(data, dict):
+        logger.error(
+            f"LLM {extraction_type} response is a JSON {type(data).__name__}, not an object"
+        )
         return None
 
+    # Determine confidence based on response characteristics
+    confidence = _assess_confidence(data, extraction_type)
+
+    return ExtractedData(
+        extraction_type=ETYPE_MAP.get(extraction_type, ExtractionType.GENERAL_SUMMARY),
+        data=data,
+        confidence=confidence,
+        raw_text_snippet=text[:500],
+        llm_model=model,
+        notes=f"Extracted via {model}",
+    )
+
 
 def extract_table_with_llm(
     table_text: str,
@@ -136,31 +488,86 @@ def extract_table_with_llm(
     return extract_with_llm(full_text, extraction_type, utility_name, model)
 
 
+def _build_request(
+    text: str,
+    prompt_template: str,
+    utility_name: Optional[str],
+    model: str,
+    max_tokens: int,
+) -> dict:
+    """Messages API parameters for one extraction.
+
+    The user turn is split into a cached document block followed by the
+    extraction prompt, so only the short prompt differs between types.
+    """
+    # Joined once: no intermediate copies of a possibly 100K-char text
+    prefix = f"Utility: {utility_name}\n\n" if utility_name else ""
+    document = "".join((prefix, "Document text:\n\n", text))
+    return {
+        "model": model,
+        "max_tokens": max_tokens,
+        "system": SYSTEM_BLOCKS,
+        "messages": [{
+            "role": "user",
+            "content": [
+                {"type": "text", "text": document, "cache_control": CACHE_CONTROL},
+                {"type": "text", "text": prompt_template},
+            ],
+        }],
+    }
+
+
+def _log_cache_usage(response, extraction_type: str) -> None:
+    """Log prompt-cache reads and writes reported in the response usage."""
+    usage = getattr(response, "usage", None)
+    if usage is None:
+        return
+    read = getattr(usage, "cache_read_input_tokens", 0) or 0
+    written = getattr(usage, "cache_creation_input_tokens", 0) or 0
+    logger.info(
+        f"LLM usage ({extraction_type}): input={getattr(usage, 'input_tokens', '?')}, "
+        f"cache_read={read}, cache_write={written}"
+    )
+
+
+_JSON_FENCE = re.compile(r"```json\s*(.*?)\s*```", re.DOTALL)
+_ANY_FENCE = re.compile(r"```\s*(.*?)\s*```", re.DOTALL)
+
+
 def _extract_json(text: str) -> str:
     """Extract JSON from a response that may contain markdown code blocks."""
-    # Try to find JSON in code blocks
-    if "```json" in text:
-        start = text.index("```json") + 7
-        end = text.index("```", start)
-        return text[start:end].strip()
-    elif "```" in text:
-        start = text.index("```") + 3
-        end = text.index("```", start)
-        return text[start:end].strip()
-
-    # Try to find raw JSON (starts with { or [)
-    for i, c in enumerate(text):
-        if c in ("{", "["):
-            # Find matching closing bracket
-            depth = 0
-            for j in range(i, len(text)):
-                if text[j] in ("{", "["):
-                    depth += 1
-                elif text[j] in ("}", "]"):
-                    depth -= 1
-                    if depth == 0:
-                        return text[i:j + 1]
-            break
+    # Try to find JSON in code blocks (an unclosed fence falls through)
+    m = _JSON_FENCE.search(text) or _ANY_FENCE.search(text)
+    if m:
+        return m.group(1)
+
+    # Try to find raw JSON (starts with { or [): one pass tracking nesting
+    # depth, skipping brackets inside strings
+    starts = [k for k in (text.find("{"), text.find("[")) if k >= 0]
+    if not starts:
+        return text
+    i = min(starts)
+
+    depth = 0
+    in_string = False
+    escape = False
+    for j in range(i, len(text)):
+        c = text[j]
+        if in_string:
+            if escape:
+                escape = False
+            elif c == "\\":
+                escape = True
+            elif c == '"':
+                in_string = False
+        elif c == '"':
+            in_string = True
+        elif c in "{[":
+            depth += 1
+        elif c in "}]":
+            depth -= 1
+            if depth == 0:
+                return text[i:j + 1]
 
     return text
 
@@ -6,49 +6,183 @@ Uses multiple extraction strategies with fallback:
   3. pdfplumber table detection as fallback
 """
 
+import io
 import logging
+import multiprocessing
+import os
+import threading
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from itertools import count, islice
 from pathlib import Path
-from typing import Optional
+from typing import Optional, Union
 
 import pandas as pd
 
+try:
+    import pdfplumber
+except ImportError:
+    pdfplumber = None
+
+try:
+    import tabula
+except ImportError:
+    tabula = None
+
 from .base import Confidence, ParsedTable
 
 logger = logging.getLogger(__name__)
 
+# Text extraction is CPU-bound in pdfminer; documents with more pages than
+# this are split into page ranges across worker processes
+PARALLEL_MIN_PAGES = 8
+TEXT_PROCESSES = min(os.cpu_count() or 1, 8)
+
+# One process pool shared by every caller (parse_documents runs several
+# documents on threads), so TEXT_PROCESSES bounds the total. Workers start
+# from a forkserver (spawn where unavailable): forking the threaded parent
+# could copy a lock held by another thread and deadlock the child.
+_text_pool: Optional[ProcessPoolExecutor] = None
+_text_pool_lock = threading.Lock()
+
+
+def open_pdf(pdf_path: Path, pdf_bytes: Optional[bytes] = None):
+    """Open a PDF once for several extract_text / extract_tables calls.
 
-def extract_text(pdf_path: Path, max_pages: Optional[int] = None) -> tuple[str, int]:
+    Returns a pdfplumber handle for the caller to close, or None if
+    pdfplumber is missing or cannot open the file (the extract functions
+    then open it themselves and apply their usual fallbacks).
+    """
+    if pdfplumber is None:
+        return None
+    try:
+        return _open_pdf(pdf_path, pdf_bytes)
+    except Exception as e:
+        logger.debug(f"pdfplumber could not open {pdf_path.name}: {e}")
+        return None
+
+
+def extract_text(
+    pdf_path: Path,
+    max_pages: Optional[int] = None,
+    pdf_bytes: Optional[bytes] = None,
+    pdf=None,
+) -> tuple[str, int]:
     """Extract text from a PDF file.
 
+    More than PARALLEL_MIN_PAGES pages are extracted in a shared pool of
+    TEXT_PROCESSES worker processes, each opening the document (pdf_bytes
+    if given, else the path) for its own page range.
+    Pass pdf (a handle from open_pdf) to reuse an already-parsed document,
+    or pdf_bytes (the file already read into memory) to parse from the
+    buffer instead of reopening the file.
+
     Returns (text, page_count).
     """
-    try:
-        import pdfplumber
-    except ImportError:
+    if pdfplumber is None:
         logger.warning("pdfplumber not installed, trying PyPDF2 fallback")
-        return _extract_text_pypdf2(pdf_path, max_pages)
-
-    text_parts = []
-    page_count = 0
+        return _extract_text_pypdf2(pdf_path, max_pages, pdf_bytes)
 
     try:
-        with pdfplumber.open(str(pdf_path)) as pdf:
-            page_count = len(pdf.pages)
-            limit = min(page_count, max_pages) if max_pages else page_count
-
-            for i, page in enumerate(pdf.pages[:limit]):
-                page_text = page.extract_text()
-                if page_text:
-                    text_parts.append(f"--- Page {i + 1} ---\n{page_text}")
+        if pdf is not None:
+            text_parts, page_count = _text_from_open(pdf, pdf_path, max_pages, pdf_bytes)
+        else:
+            with _open_pdf(pdf_path, pdf_bytes) as opened:
+                text_parts, page_count = _text_from_open(opened, pdf_path, max_pages, pdf_bytes)
 
     except Exception as e:
         logger.error(f"pdfplumber failed on {pdf_path.name}: {e}")
-        return _extract_text_pypdf2(pdf_path, max_pages)
+        return _extract_text_pypdf2(pdf_path, max_pages, pdf_bytes)
 
     return "\n\n".join(text_parts), page_count
 
 
-def _extract_text_pypdf2(pdf_path: Path, max_pages: Optional[int] = None) -> tuple[str, int]:
+def _open_pdf(pdf_path: Path, pdf_bytes: Optional[bytes] = None):
+    """Open with pdfplumber from the in-memory bytes if given, else the path."""
+    if pdf_bytes is not None:
+        return pdfplumber.open(io.BytesIO(pdf_bytes))
+    return pdfplumber.open(str(pdf_path))
+
+
+def _text_from_open(
+    pdf, pdf_path: Path, max_pages: Optional[int], pdf_bytes: Optional[bytes] = None,
+) -> tuple[list[str], int]:
+    """Labelled page texts and page count from an open pdfplumber document.
+
+    A pdfplumber handle cannot be pickled, so parallel workers get
+    pdf_bytes (the same document the caller opened) or else the path.
+    """
+    page_count = len(pdf.pages)
+    limit = min(page_count, max_pages) if max_pages else page_count
+    ranges = _page_ranges(limit, TEXT_PROCESSES) if limit > PARALLEL_MIN_PAGES else []
+
+    if len(ranges) > 1:
+        source = pdf_bytes if pdf_bytes is not None else str(pdf_path)
+        return _extract_text_parallel(source, ranges), page_count
+    return _page_texts(pdf, 0, limit), page_count
+
+
+def _page_ranges(limit: int, workers: int) -> list[tuple[int, int]]:
+    """Split pages [0, limit) into at most `workers` contiguous ranges."""
+    if limit <= 0 or workers <= 0:
+        return []
+    size = -(-limit // workers)
+    return [(start, min(start + size, limit)) for start in range(0, limit, size)]
+
+
+def _page_texts(pdf, start: int, end: int) -> list[str]:
+    """Labelled text of pages [start, end) of an open pdfplumber document."""
+    parts = []
+    for i, page in enumerate(pdf.pages[start:end], start):
+        page_text = page.extract_text()
+        if page_text:
+            parts.append(f"--- Page {i + 1} ---\n{page_text}")
+    return parts
+
+
+def _extract_page_range(source: Union[str, bytes], start: int, end: int) -> list[str]:
+    """Worker-process entry point: open the PDF and extract pages [start, end)."""
+    with pdfplumber.open(io.BytesIO(source) if isinstance(source, bytes) else source) as pdf:
+        return _page_texts(pdf, start, end)
+
+
+def _get_text_pool() -> ProcessPoolExecutor:
+    """The shared text-extraction process pool, created on first use."""
+    global _text_pool
+    with _text_pool_lock:
+        if _text_pool is None:
+            methods = multiprocessing.get_all_start_methods()
+            method = "forkserver" if "forkserver" in methods else "spawn"
+            _text_pool = ProcessPoolExecutor(
+                max_workers=TEXT_PROCESSES,
+                mp_context=multiprocessing.get_context(method),
+            )
+        return _text_pool
+
+
+def _extract_text_parallel(source: Union[str, bytes], ranges: list[tuple[int, int]]) -> list[str]:
+    """Extract page ranges in the shared worker pool, keeping page order."""
+    global _text_pool
+    pool = _get_text_pool()
+    try:
+        chunks = pool.map(
+            _extract_page_range,
+            [source] * len(ranges),
+            [start for start, _ in ranges],
+            [end for _, end in ranges],
+        )
+        return [part for chunk in chunks for part in chunk]
+    except BrokenProcessPool:
+        # A worker died; drop the pool so the next document gets a fresh one
+        with _text_pool_lock:
+            if _text_pool is pool:
+                _text_pool = None
+        raise
+
+
+def _extract_text_pypdf2(
+    pdf_path: Path, max_pages: Optional[int] = None, pdf_bytes: Optional[bytes] = None,
+) -> tuple[str, int]:
     """Fallback text extraction using PyPDF2."""
     try:
         from PyPDF2 import PdfReader
@@ -58,7 +192,7 @@ def _extract_text_pypdf2(pdf_path: Path, max_pages: Optional[int] = None) -> tup
 
     text_parts = []
     try:
-        reader = PdfReader(str(pdf_path))
+        reader = PdfReader(io.BytesIO(pdf_bytes) if pdf_bytes is not None else str(pdf_path))
         page_count = len(reader.pages)
         limit = min(page_count, max_pages) if max_pages else page_count
 
@@ -74,12 +208,21 @@ def _extract_text_pypdf2(pdf_path: Path, max_pages: Optional[int] = None) -> tup
     return "\n\n".join(text_parts), page_count
 
 
-def extract_tables(pdf_path: Path, pages: str = "all") -> list[ParsedTable]:
+def extract_tables(
+    pdf_path: Path,
+    pages: str = "all",
+    pdf_bytes: Optional[bytes] = None,
+    pdf=None,
+) -> list[ParsedTable]:
     """Extract tables from a PDF using tabula-py with pdfplumber fallback.
 
     Args:
         pdf_path: Path to the PDF file.
         pages: Page specification for tabula ("all", "1-5", "1,3,5").
+        pdf_bytes: The file already read into memory; the pdfplumber
+            fallback parses it instead of reopening the file (tabula
+            always reads the path).
+        pdf: Open handle from open_pdf, reused by the pdfplumber fallback.
 
     Returns:
         List of ParsedTable objects.
@@ -97,7 +240,7 @@ def extract_tables(pdf_path: Path, pages: str = "all") -> list[ParsedTable]:
 
     # Fallback to pdfplumber
     try:
-        tables = _extract_tables_pdfplumber(pdf_path)
+        tables = _extract_tables_pdfplumber(pdf_path, pdf_bytes, pdf)
         if tables:
             logger.info(f"pdfplumber extracted {len(tables)} tables from {pdf_path.name}")
             return tables
@@ -108,93 +251,120 @@ def extract_tables(pdf_path: Path, pages: str = "all") -> list[ParsedTable]:
 
 
 def _extract_tables_tabula(pdf_path: Path, pages: str = "all") -> list[ParsedTable]:
-    """Extract tables using tabula-py."""
-    import tabula
+    """Extract tables using tabula-py.
 
-    results = []
+    Lattice mode (bordered tables) is preferred, falling back to stream mode
+    (unbordered) when it finds nothing. Each read_pdf call pays for a JVM
+    start, so both modes run concurrently; the stream result is dropped
+    when lattice succeeds.
+    """
+    if tabula is None:
+        raise ImportError("tabula-py not installed")
 
-    # Try lattice mode first (bordered tables)
+    pool = ThreadPoolExecutor(max_workers=2)
+    try:
+        lattice = pool.submit(_tabula_read, pdf_path, pages, "lattice", Confidence.HIGH)
+        stream = pool.submit(_tabula_read, pdf_path, pages, "stream", Confidence.MEDIUM)
+        return lattice.result() or stream.result()
+    finally:
+        pool.shutdown(wait=False, cancel_futures=True)
+
+
+def _tabula_read(
+    pdf_path: Path, pages: str, mode: str, confidence: Confidence,
+) -> list[ParsedTable]:
+    """Valid tables from one tabula-py mode ("lattice" or "stream"); [] on failure."""
     try:
         dfs = tabula.read_pdf(
             str(pdf_path),
             pages=pages,
-            lattice=True,
             multiple_tables=True,
             silent=True,
+            **{mode: True},
         )
-        for i, df in enumerate(dfs):
-            if _is_valid_table(df):
-                results.append(ParsedTable(
-                    df=df,
-                    table_index=i,
-                    confidence=Confidence.HIGH,
-                    source_method="tabula_lattice",
-                ))
     except Exception:
-        pass
-
-    # If no lattice tables found, try stream mode (unbordered)
-    if not results:
-        try:
-            dfs = tabula.read_pdf(
-                str(pdf_path),
-                pages=pages,
-                stream=True,
-                multiple_tables=True,
-                silent=True,
-            )
-            for i, df in enumerate(dfs):
+        return []
+    return [
+        ParsedTable(
+            df=df,
+            table_index=i,
+            confidence=confidence,
+            source_method=f"tabula_{mode}",
+        )
+        for i, df in enumerate(dfs)
+        if _is_valid_table(df)
+    ]
+
+
+def _extract_tables_pdfplumber(
+    pdf_path: Path, pdf_bytes: Optional[bytes] = None, pdf=None,
+) -> list[ParsedTable]:
+    """Extract tables using pdfplumber."""
+    if pdfplumber is None:
+        raise ImportError("pdfplumber not installed")
+
+    if pdf is not None:
+        return _tables_from_open(pdf)
+    with _open_pdf(pdf_path, pdf_bytes) as opened:
+        return _tables_from_open(opened)
+
+
+def _tables_from_open(pdf) -> list[ParsedTable]:
+    """Valid tables from every page of an open pdfplumber document."""
+    results = []
+    table_idx = 0
+
+    for page_num, page in enumerate(pdf.pages, 1):
+        page_tables = page.extract_tables()
+        if not page_tables:
+            continue
+
+        for table in page_tables:
+            # Reject sparse or tiny tables before building a DataFrame
+            if not table or not _is_valid_raw_table(table):
+                continue
+
+            # Convert to DataFrame
+            # First row is typically the header; data rows stream straight
+            # from the pdfplumber list without a sliced copy
+            header = list(map(_header_label, table[0], count()))
+
+            try:
+                df = pd.DataFrame.from_records(
+                    islice(table, 1, None), columns=header, nrows=len(table) - 1,
+                )
                 if _is_valid_table(df):
                     results.append(ParsedTable(
                         df=df,
-                        table_index=i,
+                        page_number=page_num,
+                        table_index=table_idx,
                         confidence=Confidence.MEDIUM,
-                        source_method="tabula_stream",
+                        source_method="pdfplumber",
                     ))
-        except Exception:
-            pass
+                    table_idx += 1
+            except Exception as e:
+                logger.debug(f"Failed to create DataFrame from table on page {page_num}: {e}")
 
     return results
 
 
-def _extract_tables_pdfplumber(pdf_path: Path) -> list[ParsedTable]:
-    """Extract tables using pdfplumber."""
-    import pdfplumber
+def _header_label(cell, index: int) -> str:
+    """Column name for a header cell; blank cells become col_<index>."""
+    return str(cell).strip() if cell else f"col_{index}"
 
-    results = []
-    table_idx = 0
 
-    with pdfplumber.open(str(pdf_path)) as pdf:
-        for page_num, page in enumerate(pdf.pages, 1):
-            page_tables = page.extract_tables()
-            if not page_tables:
-                continue
+def _is_valid_raw_table(table: list[list]) -> bool:
+    """_is_valid_table's checks on a raw pdfplumber table (header row first).
 
-            for table in page_tables:
-                if not table or len(table) < 2:
-                    continue
-
-                # Convert to DataFrame
-                # First row is typically the header
-                header = [str(c).strip() if c else f"col_{j}"
-                          for j, c in enumerate(table[0])]
-                rows = table[1:]
-
-                try:
-                    df = pd.DataFrame(rows, columns=header)
-                    if _is_valid_table(df):
-                        results.append(ParsedTable(
-                            df=df,
-                            page_number=page_num,
-                            table_index=table_idx,
-                            confidence=Confidence.MEDIUM,
-                            source_method="pdfplumber",
-                        ))
-                        table_idx += 1
-                except Exception as e:
-                    logger.debug(f"Failed to create DataFrame from table on page {page_num}: {e}")
+    Cells are strings or None; None is what becomes NaN in the DataFrame.
+    """
+    n_rows = len(table) - 1
+    n_cols = len(table[0])
+    if n_rows < 2 or n_cols < 2:
+        return False
 
-    return results
+    non_null = sum(c is not None for row in islice(table, 1, None) for c in row)
+    return non_null / (n_rows * n_cols) >= 0.3
 
 
 def _is_valid_table(df: pd.DataFrame) -> bool:
@@ -206,8 +376,9 @@ def _is_valid_table(df: pd.DataFrame) -> bool:
     if len(df.columns) < 2:  # Need at least 2 columns
         return False
 
-    # Check that it's not all NaN
-    non_null_pct = df.notna().sum().sum() / (len(df) * len(df.columns))
+    # Check that it's not all NaN (one pass over the cell array)
+    arr = df.to_numpy()
+    non_null_pct = 1 - pd.isna(arr).sum() / arr.size
     if non_null_pct < 0.3:
         return False
 
@@ -8,6 +8,7 @@ Coordinates triage, parsing, and extraction across the full pipeline:
 """
 
 import logging
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import Optional
 
@@ -16,12 +17,20 @@ from .base import (
     ExtractionType, ExtractedData, ParsedTable,
 )
 from .triage import classify_document, estimate_relevance
-from .pdf_parser import extract_text, extract_tables
+from .pdf_parser import extract_text, extract_tables, open_pdf
 from .excel_parser import parse_excel, detect_table_type
-from .llm_extractor import extract_with_llm, extract_table_with_llm
+from .llm_extractor import extract_many_with_llm, extract_table_with_llm
 
 logger = logging.getLogger(__name__)
 
+# Documents parsed concurrently by parse_documents. Per-document work is
+# mostly waiting on the LLM API (PDF text runs in worker processes).
+DOCUMENT_PARALLELISM = 8
+
+# How long parse_document waits on an LLM Message Batch before cancelling it
+# and extracting type by type; the extractor's own default suits offline runs
+LLM_BATCH_TIMEOUT_S = 300
+
 
 def parse_document(
     file_path: Path,
@@ -56,9 +65,17 @@ def parse_document(
     suffix = file_path.suffix.lower()
     text = ""
     page_count = None
+    pdf_bytes = None
+    pdf = None
 
     if suffix == ".pdf":
-        text, page_count = extract_text(file_path, max_pages=max_pages or 5)
+        # Read and open once; every text/table pass below reuses the parsed
+        # document (closed after step 3)
+        pdf_bytes = file_path.read_bytes()
+        pdf = open_pdf(file_path, pdf_bytes)
+        text, page_count = extract_text(
+            file_path, max_pages=max_pages or 5, pdf_bytes=pdf_bytes, pdf=pdf,
+        )
         result.page_count = page_count
         result.text_length = len(text)
     elif suffix in (".xlsx", ".xls", ".csv", ".tsv"):
@@ -77,24 +94,28 @@ def parse_document(
 
         elif result.category == DocumentCategory.TABULAR_PDF:
             # Extract tables
-            result.tables = extract_tables(file_path)
+            result.tables = extract_tables(file_path, pdf_bytes=pdf_bytes, pdf=pdf)
 
             # Also get full text for LLM if needed
             if run_llm and not text:
-                text, page_count = extract_text(file_path, max_pages=max_pages)
+                text, page_count = extract_text(
+                    file_path, max_pages=max_pages, pdf_bytes=pdf_bytes, pdf=pdf,
+                )
                 result.page_count = page_count
                 result.text_length = len(text)
 
         elif result.category == DocumentCategory.NARRATIVE_PDF:
             # Full text extraction for LLM processing
             if not text:
-                text, page_count = extract_text(file_path, max_pages=max_pages)
+                text, page_count = extract_text(
+                    file_path, max_pages=max_pages, pdf_bytes=pdf_bytes, pdf=pdf,
+                )
                 result.page_count = page_count
                 result.text_length = len(text)
 
             # Also try table extraction (narratives sometimes have tables)
             try:
-                result.tables = extract_tables(file_path)
+                result.tables = extract_tables(file_path, pdf_bytes=pdf_bytes, pdf=pdf)
             except Exception:
                 pass
 
@@ -111,6 +132,10 @@ def parse_document(
         logger.error(f"Parsing failed for {file_path.name}: {e}")
         return result
 
+    finally:
+        if pdf is not None:
+            pdf.close()
+
     # Step 4: Auto-detect table types
     for table in result.tables:
         detected = detect_table_type(table.df)
@@ -124,18 +149,19 @@ def parse_document(
             result.tables, text, filing_type
         )
 
-        for etype in extraction_types:
-            logger.info(f"Running LLM extraction: {etype}")
-            try:
-                extracted = extract_with_llm(
-                    text=text,
-                    extraction_type=etype,
-                    utility_name=utility_name,
-                )
-                if extracted:
-                    result.extractions.append(extracted)
-            except Exception as e:
-                result.errors.append(f"LLM extraction ({etype}) failed: {e}")
+        logger.info(f"Running LLM extraction: {', '.join(extraction_types)}")
+        try:
+            extracted = extract_many_with_llm(
+                text=text,
+                extraction_types=extraction_types,
+                utility_name=utility_name,
+                timeout=LLM_BATCH_TIMEOUT_S,
+            )
+            for etype in extraction_types:
+                if extracted.get(etype):
+                    result.extractions.append(extracted[etype])
+        except Exception as e:
+            result.errors.append(f"LLM extraction ({', '.join(extraction_types)}) failed: {e}")
 
         if result.extractions:
             result.status = "extracted"
@@ -143,6 +169,34 @@ def parse_document(
     return result
 
 
+def parse_documents(
+    file_paths: list[Path],
+    concurrency: int = DOCUMENT_PARALLELISM,
+    **kwargs,
+) -> list[DocumentParseResult]:
+    """Parse several documents concurrently with parse_document.
+
+    Keyword arguments are passed to parse_document. Results come back in
+    file_paths order; a document that raises is returned as a failed
+    result rather than aborting the rest.
+    """
+    def parse_one(file_path: Path) -> DocumentParseResult:
+        try:
+            return parse_document(file_path, **kwargs)
+        except Exception as e:
+            logger.error(f"Parsing failed for {file_path.name}: {e}")
+            result = DocumentParseResult(file_path=str(file_path))
+            result.errors.append(f"Parsing failed: {e}")
+            result.status = "failed"
+            return result
+
+    workers = min(max(1, concurrency), len(file_paths))
+    if workers <= 1:
+        return [parse_one(f) for f in file_paths]
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        return list(pool.map(parse_one, file_paths))
+
+
 def _auto_detect_extraction_types(
     tables: list[ParsedTable],
     text: str,
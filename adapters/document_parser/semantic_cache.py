@@ -0,0 +1,107 @@
+"""Near-duplicate lookup of prior extractions.
+
+Successive filings from the same utility often differ by a few paragraphs,
+so an exact text-digest cache misses them. Each extracted document is
+embedded as a unit vector and kept with its result; a later document whose
+cosine similarity to a stored one reaches SIMILARITY_THRESHOLD reuses that
+result instead of another LLM call.
+
+Vectors are signed feature hashes of word 3-shingles (numpy only). Unlike
+a sentence embedding model, they cover the whole text rather than its
+first few hundred tokens, and unrelated documents land near cosine 0.
+"""
+
+import copy
+import re
+import threading
+from collections import OrderedDict
+from typing import Any, Hashable, Optional
+
+import numpy as np
+
+EMBEDDING_DIM = 4096
+SHINGLE_WORDS = 3
+SIMILARITY_THRESHOLD = 0.95
+
+_WORD_RE = re.compile(r"\w+")
+
+
+def embed_text(text: str) -> Optional[np.ndarray]:
+    """Unit vector of signed hashed word shingles; None if text has too few words."""
+    words = _WORD_RE.findall(text.lower())
+    if len(words) < SHINGLE_WORDS:
+        return None
+    hashes = np.fromiter(
+        (hash(s) for s in zip(*(words[i:] for i in range(SHINGLE_WORDS)))),
+        dtype=np.int64,
+    )
+    # Low bits pick the bucket, a higher bit the sign, so collisions cancel
+    # out in expectation instead of inflating similarity
+    signs = np.where(hashes & (1 << 32), 1.0, -1.0)
+    vec = np.bincount(hashes % EMBEDDING_DIM, weights=signs, minlength=EMBEDDING_DIM)
+    norm = np.linalg.norm(vec)
+    if norm == 0:
+        return None
+    return (vec / norm).astype(np.float32)
+
+
+class SemanticCache:
+    """Bounded store of (vector, value) pairs, searched per scope.
+
+    A scope groups entries that may stand in for each other (e.g. same
+    extraction type and options). Values are deep-copied in and out.
+    """
+
+    def __init__(self, max_entries: int = 1024, threshold: float = SIMILARITY_THRESHOLD):
+        self.max_entries = max_entries
+        self.threshold = threshold
+        self._lock = threading.Lock()
+        # scope -> (matrix of unit vectors, values); rows stay in insertion order
+        self._scopes: "OrderedDict[Hashable, tuple[np.ndarray, list]]" = OrderedDict()
+        self._size = 0
+
+    def __len__(self) -> int:
+        return self._size
+
+    def lookup(self, scope: Hashable, vector: Optional[np.ndarray]) -> Optional[Any]:
+        """A copy of the most similar stored value, or None below threshold."""
+        if vector is None:
+            return None
+        with self._lock:
+            entry = self._scopes.get(scope)
+            if entry is None:
+                return None
+            matrix, values = entry
+            sims = matrix @ vector
+            best = int(np.argmax(sims))
+            if sims[best] < self.threshold:
+                return None
+            hit = values[best]
+        return copy.deepcopy(hit)
+
+    def add(self, scope: Hashable, vector: Optional[np.ndarray], value: Any) -> None:
+        """Store value under vector, evicting the oldest entries past max_entries."""
+        if vector is None or value is None:
+            return
+        value = copy.deepcopy(value)
+        with self._lock:
+            matrix, values = self._scopes.pop(scope, (np.empty((0, vector.size), np.float32), []))
+            self._scopes[scope] = (np.vstack([matrix, vector]), values + [value])
+            self._size += 1
+            while self._size > self.max_entries:
+                self._evict_oldest()
+
+    def clear(self) -> None:
+        with self._lock:
+            self._scopes.clear()
+            self._size = 0
+
+    def _evict_oldest(self) -> None:
+        """Drop the first row of the least recently added-to scope."""
+        scope, (matrix, values) = next(iter(self._scopes.items()))
+        if len(values) <= 1:
+            del self._scopes[scope]
+        else:
+            self._scopes[scope] = (matrix[1:], values[1:])
+            self._scopes.move_to_end(scope, last=False)
+        self._size -= 1
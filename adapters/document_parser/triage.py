@@ -6,8 +6,14 @@ file type, page count, and content characteristics.
 
 import logging
 import mimetypes
+import re
 from pathlib import Path
-from typing import Optional
+from typing import Callable, Optional
+
+try:
+    import ahocorasick
+except ImportError:
+    ahocorasick = None
 
 from .base import DocumentCategory
 
@@ -33,6 +39,51 @@ PROCEDURAL_KEYWORDS = {
 }
 
 
+def _keyword_counter(keywords: set[str]) -> Callable[[str], int]:
+    """Build a function counting the distinct keywords in lowercased text.
+
+    Uses an Aho-Corasick automaton when pyahocorasick is installed, else one
+    precompiled regex alternation; either way a single pass over the text
+    instead of one substring scan per keyword.
+    """
+    if ahocorasick is not None:
+        automaton = ahocorasick.Automaton()
+        for kw in keywords:
+            automaton.add_word(kw, kw)
+        automaton.make_automaton()
+        return lambda text_lower: len({kw for _, kw in automaton.iter(text_lower)})
+
+    # Zero-width lookahead so overlapping keywords are all found, e.g.
+    # "resource plan" inside "distribution resource plan"
+    alternation = "|".join(re.escape(kw) for kw in sorted(keywords, key=len, reverse=True))
+    pattern = re.compile(f"(?=({alternation}))")
+    return lambda text_lower: len(set(pattern.findall(text_lower)))
+
+
+_count_high_value = _keyword_counter(HIGH_VALUE_KEYWORDS)
+_count_procedural = _keyword_counter(PROCEDURAL_KEYWORDS)
+
+# Energy/power units ("mw" also covers "mwh")
+_UNITS_RE = re.compile("mw|gwh|kwh")
+_DIGIT_RE = re.compile(r"\d")
+
+
+def _has_table_indicators(text_lower: str) -> bool:
+    """Whether text looks like it came from tables: many pipe or tab
+    separators, or energy units with digits near the start.
+
+    Checks run cheapest first and stop at the first positive.
+    """
+    return (
+        ("|" in text_lower and text_lower.count("|") > 10)
+        or ("\t" in text_lower and text_lower.count("\t") > 20)
+        or (
+            _DIGIT_RE.search(text_lower, 0, 500) is not None
+            and _UNITS_RE.search(text_lower) is not None
+        )
+    )
+
+
 def classify_document(
     file_path: Path,
     extracted_text: Optional[str] = None,
@@ -65,24 +116,17 @@ def classify_document(
         text_lower = extracted_text.lower()
 
         # Check for procedural content
-        procedural_hits = sum(1 for kw in PROCEDURAL_KEYWORDS if kw in text_lower)
+        procedural_hits = _count_procedural(text_lower)
         if procedural_hits >= 2:
             return DocumentCategory.PROCEDURAL
 
         # Check for tabular content indicators
-        table_indicators = (
-            text_lower.count("|") > 10 or
-            text_lower.count("\t") > 20 or
-            any(kw in text_lower for kw in ("mw", "gwh", "kwh", "mwh")) and
-            any(c.isdigit() for c in text_lower[:500])
-        )
-
-        if table_indicators:
+        if _has_table_indicators(text_lower):
             return DocumentCategory.TABULAR_PDF
 
         # Short PDFs with high-value keywords → tabular (likely has tables)
         if page_count and page_count <= 20:
-            value_hits = sum(1 for kw in HIGH_VALUE_KEYWORDS if kw in text_lower)
+            value_hits = _count_high_value(text_lower)
             if value_hits >= 2:
                 return DocumentCategory.TABULAR_PDF
 
@@ -125,10 +169,10 @@ def estimate_relevance(
     # Keyword analysis
     if extracted_text:
         text_lower = extracted_text[:5000].lower()
-        value_hits = sum(1 for kw in HIGH_VALUE_KEYWORDS if kw in text_lower)
+        value_hits = _count_high_value(text_lower)
         score += min(value_hits * 0.05, 0.3)
 
-        procedural_hits = sum(1 for kw in PROCEDURAL_KEYWORDS if kw in text_lower)
+        procedural_hits = _count_procedural(text_lower)
         score -= min(procedural_hits * 0.1, 0.4)
 
     return max(0.0, min(1.0, score))
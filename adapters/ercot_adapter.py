@@ -12,6 +12,7 @@ Data access: REST API with token authentication.
 
 import logging
 from pathlib import Path
+from typing import Optional
 
 import pandas as pd
 
@@ -34,7 +35,9 @@ class ERCOTAdapter(GridstatusAdapter):
     def __init__(self, config: ISOConfig, data_dir: Path):
         super().__init__(config, data_dir)
 
-    def pull_zone_lmps(self, year: int, force: bool = False) -> pd.DataFrame:
+    def pull_zone_lmps(
+        self, year: int, force: bool = False, columns: Optional[list[str]] = None,
+    ) -> pd.DataFrame:
         """
         Pull ERCOT zone SPPs and approximate congestion components.
 
@@ -43,11 +46,12 @@ class ERCOTAdapter(GridstatusAdapter):
           energy = hourly_hub_average (approximation)
           loss = 0 (unknown)
         """
-        df = super().pull_zone_lmps(year, force)
+        df = super().pull_zone_lmps(year, force, columns)
 
         if len(df) > 0 and self.config.congestion_approximated:
             # Add flag for downstream consumers
-            if "congestion_approximated" not in df.columns:
+            wanted = columns is None or "congestion_approximated" in columns
+            if wanted and "congestion_approximated" not in df.columns:
                 df["congestion_approximated"] = True
 
             logger.info(
@@ -0,0 +1,189 @@
+"""
+Shared HTTP plumbing for the federal_data clients.
+
+FERC714Parser and FERCeLibraryScraper talk to FERC HTTPS endpoints in long
+sequential runs (searches, then downloads). One process-wide session with
+a sized keep-alive pool lets every call reuse an open TLS connection, and
+its urllib3 retry policy absorbs throttling and transient 5xx responses.
+
+Large downloads (ISO planning files, PUDL) keep a <file>.meta.json sidecar
+with the server's ETag/Last-Modified so a repeat run revalidates with a
+conditional GET instead of fetching the body again.
+"""
+
+import hashlib
+import json
+import os
+import shutil
+import threading
+from functools import lru_cache
+from pathlib import Path
+from typing import Optional
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util import Retry
+
+USER_AGENT = "grid-constraint-classifier/2.0 (research)"
+
+HTTP_POOL_CONNECTIONS = 16  # Hosts kept alive
+HTTP_POOL_MAXSIZE = 32  # Connections per host
+
+# Idempotent GETs only; raise_for_status still reports the final response
+HTTP_RETRY = Retry(
+    total=3,
+    backoff_factor=0.5,
+    status_forcelist=[429, 500, 502, 503, 504],
+    allowed_methods=["GET"],
+    raise_on_status=False,
+)
+
+# Bulk file downloads (ISO planning documents, PUDL): more attempts with
+# jittered exponential backoff capped at 30 s, HEAD probes included, and a
+# 429/503 Retry-After from the server takes precedence over the backoff
+DOWNLOAD_RETRY = Retry(
+    total=5,
+    backoff_factor=1.0,
+    backoff_max=30,
+    backoff_jitter=1.0,
+    status_forcelist=[429, 500, 502, 503, 504],
+    allowed_methods=["GET", "HEAD"],
+    respect_retry_after_header=True,
+    raise_on_status=False,
+)
+
+DOWNLOAD_CHUNK_BYTES = 1 << 20
+
+_SESSION_LOCK = threading.Lock()
+
+
+def make_session(retry: Retry = HTTP_RETRY) -> requests.Session:
+    """A new session with the pooled, retrying adapter mounted."""
+    session = requests.Session()
+    session.headers.update({"User-Agent": USER_AGENT})
+    adapter = HTTPAdapter(
+        pool_connections=HTTP_POOL_CONNECTIONS,
+        pool_maxsize=HTTP_POOL_MAXSIZE,
+        max_retries=retry,
+    )
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    return session
+
+
+@lru_cache(maxsize=1)
+def _session_cached() -> requests.Session:
+    return make_session()
+
+
+def shared_session() -> requests.Session:
+    """The process-wide FERC session."""
+    with _SESSION_LOCK:
+        return _session_cached()
+
+
+class _HashingWriter:
+    """File wrapper that feeds every write into a running digest."""
+
+    def __init__(self, f, digest):
+        self._f = f
+        self._digest = digest
+
+    def write(self, data) -> int:
+        self._digest.update(data)
+        return self._f.write(data)
+
+
+def save_response(resp: requests.Response, dest_path: Path) -> str:
+    """Write a streamed response body to dest_path in 1 MiB copies.
+
+    The raw stream is read with content decoding on, so gzip-encoded
+    bodies are stored decoded, as iter_content would.
+
+    Returns:
+        SHA-256 hex digest of the bytes written
+    """
+    resp.raw.decode_content = True
+    digest = hashlib.sha256()
+    with open(dest_path, "wb") as f:
+        shutil.copyfileobj(resp.raw, _HashingWriter(f, digest), length=DOWNLOAD_CHUNK_BYTES)
+    return digest.hexdigest()
+
+
+def cache_meta_path(dest_path: Path) -> Path:
+    return dest_path.with_name(dest_path.name + ".meta.json")
+
+
+def read_cache_meta(dest_path: Path) -> Optional[dict]:
+    """Stored validators for dest_path, or None if absent or out of step with the file."""
+    try:
+        meta = json.loads(cache_meta_path(dest_path).read_text())
+        if meta.get("size") != dest_path.stat().st_size:
+            return None
+    except (OSError, ValueError, AttributeError):
+        return None
+    return meta
+
+
+def validator_headers(meta: Optional[dict]) -> dict:
+    """If-None-Match / If-Modified-Since headers for a conditional GET."""
+    headers = {}
+    if meta:
+        if meta.get("etag"):
+            headers["If-None-Match"] = meta["etag"]
+        if meta.get("last_modified"):
+            headers["If-Modified-Since"] = meta["last_modified"]
+    return headers
+
+
+def write_cache_meta(dest_path: Path, headers, sha256: str) -> None:
+    """Record the response validators for dest_path, replacing any old sidecar."""
+    meta = {
+        "etag": headers.get("etag"),
+        "last_modified": headers.get("last-modified"),
+        "size": dest_path.stat().st_size,
+        "sha256": sha256,
+    }
+    path = cache_meta_path(dest_path)
+    tmp = path.with_name(f"{path.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+    tmp.write_text(json.dumps(meta))
+    os.replace(tmp, path)
+
+
+def fetch_cached(
+    session: requests.Session, url: str, dest_path: Path, timeout: float,
+) -> bool:
+    """Download url to dest_path unless the copy there is still current.
+
+    With a valid sidecar the request is conditional and a 304 leaves the
+    file alone. A fresh body is written to a per-thread .partial file and
+    renamed into place, then its validators and SHA-256 are stored. A file
+    already at dest_path without a sidecar is kept as is (nothing to
+    revalidate with).
+
+    Returns:
+        True if the body was downloaded, False if the local copy was reused
+    """
+    meta = read_cache_meta(dest_path)
+    if meta is None and dest_path.exists():
+        return False
+
+    resp = session.get(url, headers=validator_headers(meta), timeout=timeout, stream=True)
+    try:
+        if resp.status_code == 304:
+            return False
+        resp.raise_for_status()
+        partial = dest_path.with_name(
+            f"{dest_path.name}.{os.getpid()}.{threading.get_ident()}.partial"
+        )
+        try:
+            sha256 = save_response(resp, partial)
+            os.replace(partial, dest_path)
+        except BaseException:
+            partial.unlink(missing_ok=True)
+            raise
+    finally:
+        resp.close()
+
+    write_cache_meta(dest_path, resp.headers, sha256)
+    return True
@@ -15,14 +15,26 @@ fills gaps, and integrates with EIA utility IDs.
 import csv
 import io
 import logging
+import os
+import threading
 import zipfile
 from dataclasses import dataclass, field
-from datetime import date
+from datetime import date, datetime
 from pathlib import Path
 from typing import Optional
 
 import requests
 
+try:
+    import pyarrow as pa
+    import pyarrow.compute as pc
+    import pyarrow.parquet as pq
+    from pyarrow import csv as pa_csv
+except ImportError:
+    pa = None
+
+from ._http import save_response, shared_session
+
 logger = logging.getLogger(__name__)
 
 # FERC Form 714 bulk data (all respondents)
@@ -32,8 +44,41 @@ FERC714_BULK_URL = "https://eforms.ferc.gov/eFormServer/EFormService/download/71
 PUDL_RELEASES_URL = "https://data.catalyst.coop"
 PUDL_GITHUB = "https://github.com/catalyst-cooperative/pudl"
 
-
-@dataclass
+# Respondent and planning-area CSV headers by vintage, in lookup order
+RESPONDENT_COLUMN_ALIASES = {
+    "respondent_id": ("respondent_id", "RespondentID"),
+    "respondent_name": ("respondent_name", "RespondentName"),
+    "eia_code": ("eia_code", "EIACode"),
+    "state": ("state", "State"),
+}
+PLANNING_AREA_COLUMN_ALIASES = {
+    "respondent_id": ("respondent_id", "RespondentID"),
+    "respondent_name": ("respondent_name", "RespondentName"),
+    "report_year": ("report_year", "ReportYear"),
+    "peak_demand_mw": ("peak_demand_mw", "PeakDemandMW"),
+    "net_energy_gwh": ("net_energy_gwh", "NetEnergyGWh"),
+    "summer_peak_mw": ("summer_peak_mw", "SummerPeakMW"),
+    "winter_peak_mw": ("winter_peak_mw", "WinterPeakMW"),
+}
+
+# Hourly-load CSV headers by vintage, in lookup order
+HOURLY_COLUMN_ALIASES = {
+    "respondent_id": ("respondent_id", "RespondentID"),
+    "report_year": ("report_year", "Year"),
+    "plan_date": ("plan_date", "PlanDate", "date"),
+    "hour": ("hour", "Hour"),
+    "load_mw": ("load_mw", "LoadMW"),
+}
+HOURLY_CSV_BLOCK_SIZE = 16 << 20  # Arrow CSV reader block (bytes)
+HOURLY_READ_BUFFER = 4 << 20  # Inflate buffer for the csv-module fallback
+
+# Parsed hourly loads are kept beside the bulk ZIP as Parquet and reused
+# while newer than the ZIP. Bump the version when the table layout changes.
+HOURLY_PARQUET_VERSION = 1
+HOURLY_PARQUET_ROW_GROUP = 256_000
+
+
+@dataclass(slots=True)
 class Form714Respondent:
     """A FERC Form 714 respondent (planning area / balancing authority)."""
     respondent_id: int
@@ -43,7 +88,7 @@ class Form714Respondent:
     respondent_type: Optional[str] = None  # utility, ba, rto
 
 
-@dataclass
+@dataclass(slots=True)
 class Form714HourlyLoad:
     """Hourly load data from FERC Form 714."""
     respondent_id: int
@@ -53,7 +98,7 @@ class Form714HourlyLoad:
     load_mw: float
 
 
-@dataclass
+@dataclass(slots=True)
 class Form714PlanningArea:
     """Planning area description from FERC Form 714."""
     respondent_id: int
@@ -69,12 +114,13 @@ class Form714PlanningArea:
 class FERC714Parser:
     """Parser for FERC Form 714 bulk data files."""
 
-    def __init__(self, data_dir: Optional[Path] = None):
+    def __init__(
+        self,
+        data_dir: Optional[Path] = None,
+        session: Optional[requests.Session] = None,
+    ):
         self.data_dir = data_dir or Path("data/ferc714")
-        self.session = requests.Session()
-        self.session.headers.update({
-            "User-Agent": "grid-constraint-classifier/2.0 (research)",
-        })
+        self.session = session or shared_session()
 
     def download_bulk_data(self, dest_dir: Optional[Path] = None) -> Optional[Path]:
         """Download FERC Form 714 bulk data ZIP file."""
@@ -90,9 +136,7 @@ class FERC714Parser:
         try:
             resp = self.session.get(FERC714_BULK_URL, timeout=300, stream=True)
             resp.raise_for_status()
-            with open(dest_path, "wb") as f:
-                for chunk in resp.iter_content(chunk_size=8192):
-                    f.write(chunk)
+            save_response(resp, dest_path)
             logger.info(f"Saved to {dest_path} ({dest_path.stat().st_size:,} bytes)")
             return dest_path
         except Exception as e:
@@ -116,12 +160,14 @@ class FERC714Parser:
 
                 with zf.open(respondent_files[0]) as f:
                     reader = csv.DictReader(io.TextIOWrapper(f, encoding="utf-8"))
+                    # Resolve header aliases once instead of per row
+                    col = _resolve_columns(reader.fieldnames, RESPONDENT_COLUMN_ALIASES)
                     for row in reader:
                         resp = Form714Respondent(
-                            respondent_id=int(row.get("respondent_id", row.get("RespondentID", 0))),
-                            respondent_name=row.get("respondent_name", row.get("RespondentName", "")),
-                            eia_code=_safe_int(row.get("eia_code", row.get("EIACode"))),
-                            state=row.get("state", row.get("State")),
+                            respondent_id=int(row[col["respondent_id"]]) if col["respondent_id"] else 0,
+                            respondent_name=row[col["respondent_name"]] if col["respondent_name"] else "",
+                            eia_code=_safe_int(row.get(col["eia_code"])),
+                            state=row.get(col["state"]) if col["state"] else None,
                         )
                         respondents.append(resp)
 
@@ -154,19 +200,20 @@ class FERC714Parser:
 
                 with zf.open(area_files[0]) as f:
                     reader = csv.DictReader(io.TextIOWrapper(f, encoding="utf-8"))
+                    col = _resolve_columns(reader.fieldnames, PLANNING_AREA_COLUMN_ALIASES)
                     for row in reader:
-                        report_year = _safe_int(row.get("report_year", row.get("ReportYear")))
+                        report_year = _safe_int(row.get(col["report_year"]))
                         if year and report_year != year:
                             continue
 
                         area = Form714PlanningArea(
-                            respondent_id=int(row.get("respondent_id", row.get("RespondentID", 0))),
-                            respondent_name=row.get("respondent_name", row.get("RespondentName", "")),
+                            respondent_id=int(row[col["respondent_id"]]) if col["respondent_id"] else 0,
+                            respondent_name=row[col["respondent_name"]] if col["respondent_name"] else "",
                             report_year=report_year or 0,
-                            peak_demand_mw=_safe_float(row.get("peak_demand_mw", row.get("PeakDemandMW"))),
-                            annual_energy_gwh=_safe_float(row.get("net_energy_gwh", row.get("NetEnergyGWh"))),
-                            summer_peak_mw=_safe_float(row.get("summer_peak_mw", row.get("SummerPeakMW"))),
-                            winter_peak_mw=_safe_float(row.get("winter_peak_mw", row.get("WinterPeakMW"))),
+                            peak_demand_mw=_safe_float(row.get(col["peak_demand_mw"])),
+                            annual_energy_gwh=_safe_float(row.get(col["net_energy_gwh"])),
+                            summer_peak_mw=_safe_float(row.get(col["summer_peak_mw"])),
+                            winter_peak_mw=_safe_float(row.get(col["winter_peak_mw"])),
                         )
                         areas.append(area)
 
@@ -183,75 +230,303 @@ class FERC714Parser:
         respondent_id: Optional[int] = None,
         year: Optional[int] = None,
         limit: Optional[int] = None,
+        sorted_by_respondent: bool = False,
     ) -> list[Form714HourlyLoad]:
         """Parse hourly load data from Form 714 ZIP file.
 
         Warning: This can be very large (millions of rows). Use filters.
+        With pyarrow installed the CSV is parsed and filtered columnar, and
+        records are built only for the matching rows.
+
+        sorted_by_respondent: the CSV is known to be ordered by respondent
+            (then year), so the row-by-row parser may stop at the end of
+            the requested respondent's block. Unsorted files would be
+            silently truncated, hence off by default.
         """
         loads = []
 
         try:
-            with zipfile.ZipFile(zip_path) as zf:
-                hourly_files = [
-                    n for n in zf.namelist()
-                    if ("hourly" in n.lower() or "part3" in n.lower())
-                    and n.endswith(".csv")
-                ]
-                if not hourly_files:
-                    logger.warning("No hourly load CSV found in ZIP")
+            if pa is not None:
+                table = self._hourly_table(zip_path, respondent_id, year)
+                if table is None:
                     return []
+                if limit:
+                    table = table.slice(0, limit)
+                loads = _hourly_records(table)
+            else:
+                with zipfile.ZipFile(zip_path) as zf:
+                    member = _hourly_member(zf)
+                    if member is None:
+                        logger.warning("No hourly load CSV found in ZIP")
+                        return []
+                    with zf.open(member) as f:
+                        loads = _parse_hourly_rows(
+                            f, respondent_id, year, limit, sorted_by_respondent,
+                        )
 
-                with zf.open(hourly_files[0]) as f:
-                    reader = csv.DictReader(io.TextIOWrapper(f, encoding="utf-8"))
-                    for row in reader:
-                        rid = int(row.get("respondent_id", row.get("RespondentID", 0)))
-                        if respondent_id and rid != respondent_id:
-                            continue
-
-                        ryear = _safe_int(row.get("report_year", row.get("Year")))
-                        if year and ryear != year:
-                            continue
-
-                        # Parse date and hour
-                        date_str = row.get("plan_date", row.get("PlanDate", row.get("date", "")))
-                        hour = _safe_int(row.get("hour", row.get("Hour"))) or 0
-                        load_val = _safe_float(row.get("load_mw", row.get("LoadMW")))
-
-                        if not date_str or load_val is None:
-                            continue
-
-                        try:
-                            from datetime import datetime
-                            dt = datetime.strptime(date_str[:10], "%Y-%m-%d").date()
-                        except (ValueError, TypeError):
-                            try:
-                                from datetime import datetime
-                                dt = datetime.strptime(date_str[:10], "%m/%d/%Y").date()
-                            except (ValueError, TypeError):
-                                continue
-
-                        loads.append(Form714HourlyLoad(
-                            respondent_id=rid,
-                            report_year=ryear or dt.year,
-                            report_date=dt,
-                            hour=hour,
-                            load_mw=load_val,
-                        ))
-
-                        if limit and len(loads) >= limit:
-                            break
-
-                logger.info(f"Parsed {len(loads)} hourly load records")
+            logger.info(f"Parsed {len(loads)} hourly load records")
 
         except Exception as e:
             logger.error(f"Failed to parse hourly loads: {e}")
 
         return loads
 
+    def _hourly_table(
+        self,
+        zip_path: Path,
+        respondent_id: Optional[int],
+        year: Optional[int],
+    ) -> Optional["pa.Table"]:
+        """Filtered hourly-load table, from the Parquet sidecar when it is fresh.
+
+        On a miss the whole CSV is parsed once and written to the sidecar,
+        so later calls with any filters read only matching row groups.
+        """
+        sidecar = _hourly_sidecar(zip_path)
+        try:
+            fresh = sidecar.stat().st_mtime_ns >= zip_path.stat().st_mtime_ns
+        except OSError:
+            fresh = False
+        if fresh:
+            filters = []
+            if respondent_id:
+                filters.append(("respondent_id", "=", respondent_id))
+            if year:
+                filters.append(("report_year", "=", year))
+            try:
+                return pq.read_table(sidecar, filters=filters or None)
+            except Exception as e:
+                logger.debug(f"Hourly sidecar read failed for {sidecar}: {e}")
+
+        with zipfile.ZipFile(zip_path) as zf:
+            member = _hourly_member(zf)
+            if member is None:
+                logger.warning("No hourly load CSV found in ZIP")
+                return None
+            with zf.open(member) as f:
+                table = _read_hourly_table(f)
+
+        _write_hourly_sidecar(table, sidecar)
+        return _filter_hourly_table(table, respondent_id, year)
+
     def __repr__(self) -> str:
         return f"<FERC714Parser(data_dir={self.data_dir})>"
 
 
+def _resolve_columns(
+    fieldnames: Optional[list[str]], aliases: dict[str, tuple[str, ...]],
+) -> dict[str, Optional[str]]:
+    """Header actually used for each field (first alias present), or None."""
+    present = set(fieldnames or ())
+    return {
+        name: next((a for a in options if a in present), None)
+        for name, options in aliases.items()
+    }
+
+
+def _hourly_member(zf: zipfile.ZipFile) -> Optional[str]:
+    """Name of the hourly-load CSV in a bulk ZIP, or None."""
+    hourly_files = [
+        n for n in zf.namelist()
+        if ("hourly" in n.lower() or "part3" in n.lower())
+        and n.endswith(".csv")
+    ]
+    return hourly_files[0] if hourly_files else None
+
+
+def _hourly_sidecar(zip_path: Path) -> Path:
+    return zip_path.with_name(f"{zip_path.stem}.hourly.v{HOURLY_PARQUET_VERSION}.parquet")
+
+
+def _write_hourly_sidecar(table: "pa.Table", sidecar: Path) -> None:
+    """Write the sidecar under a temporary name, then rename into place."""
+    tmp = sidecar.with_name(f"{sidecar.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+    try:
+        pq.write_table(
+            table, tmp, compression="zstd", row_group_size=HOURLY_PARQUET_ROW_GROUP,
+        )
+        os.replace(tmp, sidecar)
+    except Exception as e:
+        logger.debug(f"Hourly sidecar write failed for {sidecar}: {e}")
+        tmp.unlink(missing_ok=True)
+
+
+def _read_hourly_table(f) -> "pa.Table":
+    """Hourly loads from a Form 714 CSV stream, normalized with Arrow kernels.
+
+    Columns: respondent_id, report_year (null when not reported),
+    report_date, hour, load_mw. Rows without a parseable date or a load
+    value are dropped, as in the row-by-row parser.
+    """
+    types = {
+        "respondent_id": pa.float64(), "report_year": pa.float64(),
+        "plan_date": pa.string(), "hour": pa.float64(), "load_mw": pa.float64(),
+    }
+    raw = pa_csv.read_csv(
+        f,
+        read_options=pa_csv.ReadOptions(block_size=HOURLY_CSV_BLOCK_SIZE),
+        convert_options=pa_csv.ConvertOptions(
+            include_columns=[a for aliases in HOURLY_COLUMN_ALIASES.values() for a in aliases],
+            include_missing_columns=True,
+            column_types={
+                a: types[name] for name, aliases in HOURLY_COLUMN_ALIASES.items() for a in aliases
+            },
+        ),
+    )
+
+    def column(name: str):
+        return pc.coalesce(*(raw[a] for a in HOURLY_COLUMN_ALIASES[name]))
+
+    def to_int(values):
+        return pc.cast(values, pa.int64(), safe=False)
+
+    day = pc.utf8_slice_codeunits(column("plan_date"), 0, 10)
+    report_date = pc.cast(pc.coalesce(
+        pc.strptime(day, format="%Y-%m-%d", unit="s", error_is_null=True),
+        pc.strptime(day, format="%m/%d/%Y", unit="s", error_is_null=True),
+    ), pa.date32())
+    load_mw = column("load_mw")
+
+    table = pa.table({
+        "respondent_id": to_int(pc.fill_null(column("respondent_id"), 0)),
+        "report_year": to_int(column("report_year")),
+        "report_date": report_date,
+        "hour": to_int(pc.fill_null(column("hour"), 0)),
+        "load_mw": load_mw,
+    })
+    return table.filter(pc.and_(pc.is_valid(report_date), pc.is_valid(load_mw)))
+
+
+def _filter_hourly_table(
+    table: "pa.Table", respondent_id: Optional[int], year: Optional[int],
+) -> "pa.Table":
+    """Rows for one respondent and/or report year (unreported years never match)."""
+    mask = None
+    if respondent_id:
+        mask = pc.equal(table["respondent_id"], respondent_id)
+    if year:
+        by_year = pc.equal(table["report_year"], year)
+        mask = by_year if mask is None else pc.and_(mask, by_year)
+    return table if mask is None else table.filter(mask)
+
+
+def _hourly_records(table: "pa.Table") -> list[Form714HourlyLoad]:
+    """Form714HourlyLoad objects for a normalized hourly table.
+
+    Missing (or zero) report years fall back to the year of the date.
+    """
+    reported = table["report_year"]
+    report_year = pc.if_else(
+        pc.fill_null(pc.not_equal(reported, 0), False),
+        reported,
+        pc.cast(pc.year(table["report_date"]), pa.int64()),
+    )
+    return [
+        Form714HourlyLoad(
+            respondent_id=rid, report_year=ryear, report_date=dt, hour=hour, load_mw=load,
+        )
+        for rid, ryear, dt, hour, load in zip(
+            table["respondent_id"].to_pylist(),
+            report_year.to_pylist(),
+            table["report_date"].to_pylist(),
+            table["hour"].to_pylist(),
+            table["load_mw"].to_pylist(),
+        )
+    ]
+
+
+def _parse_hourly_rows(
+    f,
+    respondent_id: Optional[int],
+    year: Optional[int],
+    limit: Optional[int],
+    sorted_by_respondent: bool = False,
+) -> list[Form714HourlyLoad]:
+    """Row-by-row hourly-load parse, used when pyarrow is not installed.
+
+    The member is inflated through a large buffer and read with csv.reader
+    at header positions resolved once, instead of a dict per row.
+    """
+    text = io.TextIOWrapper(
+        io.BufferedReader(f, buffer_size=HOURLY_READ_BUFFER), encoding="utf-8", newline="",
+    )
+    reader = csv.reader(text)
+    header = next(reader, None)
+    if header is None:
+        return []
+    positions = {name: i for i, name in enumerate(header)}
+    rid_i, year_i, date_i, hour_i, load_i = (
+        next((positions[a] for a in aliases if a in positions), None)
+        for aliases in HOURLY_COLUMN_ALIASES.values()
+    )
+
+    def cell(row: list[str], i: Optional[int]) -> Optional[str]:
+        return row[i] if i is not None and i < len(row) else None
+
+    # On sorted input the matching rows form one contiguous block
+    stop_after_block = sorted_by_respondent and bool(respondent_id)
+    in_block = False
+
+    loads = []
+    dates: dict[str, Optional[date]] = {}
+    for row in reader:
+        rid = int(cell(row, rid_i) or 0)
+        if respondent_id and rid != respondent_id:
+            if in_block:
+                break
+            continue
+
+        ryear = _safe_int(cell(row, year_i))
+        if year and ryear != year:
+            if in_block:
+                break
+            continue
+        in_block = stop_after_block
+
+        # Parse date and hour
+        date_str = cell(row, date_i)
+        hour = _safe_int(cell(row, hour_i)) or 0
+        load_val = _safe_float(cell(row, load_i))
+
+        if not date_str or load_val is None:
+            continue
+
+        # Each date repeats for every hour of the day, so parse it once
+        day = date_str[:10]
+        if day in dates:
+            dt = dates[day]
+        else:
+            dt = dates[day] = _parse_plan_date(day)
+        if dt is None:
+            continue
+
+        loads.append(Form714HourlyLoad(
+            respondent_id=rid,
+            report_year=ryear or dt.year,
+            report_date=dt,
+            hour=hour,
+            load_mw=load_val,
+        ))
+
+        if limit and len(loads) >= limit:
+            break
+
+    return loads
+
+
+def _parse_plan_date(day: str) -> Optional[date]:
+    """A YYYY-MM-DD (C fast path) or MM/DD/YYYY date; None if neither fits."""
+    if len(day) == 10 and day[4] == "-":
+        try:
+            return date.fromisoformat(day)
+        except ValueError:
+            pass
+    try:
+        return datetime.strptime(day, "%m/%d/%Y").date()
+    except ValueError:
+        return None
+
+
 def _safe_int(val) -> Optional[int]:
     """Safely convert to int."""
     if val is None or val == "":
@@ -24,6 +24,9 @@ Docket prefixes:
 
 import logging
 import re
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass, field
 from datetime import date, datetime
 from pathlib import Path
@@ -31,14 +34,28 @@ from typing import Optional
 
 import requests
 
+try:
+    import lxml  # noqa: F401  (C parser for BeautifulSoup)
+    HTML_PARSER = "lxml"
+except ImportError:
+    HTML_PARSER = "html.parser"
+
+from ._http import save_response, shared_session
+
 logger = logging.getLogger(__name__)
 
 FERC_ELIBRARY_URL = "https://elibrary.ferc.gov/eLibrary"
 FERC_SEARCH_URL = f"{FERC_ELIBRARY_URL}/filelist"
 FERC_DOWNLOAD_URL = f"{FERC_ELIBRARY_URL}/filedownload"
 
+DOWNLOAD_PARALLELISM = 8  # Filings downloaded at once by download_documents
+
+_ACCESSION_RE = re.compile(r"(\d{8}-\d{4})")
+# One scan of a row's cell text finds both the accession and docket numbers
+_ROW_IDS_RE = re.compile(r"(?P<accession>\d{8}-\d{4})|(?P<docket>[A-Z]{2}\d{2}-\d+)")
 
-@dataclass
+
+@dataclass(slots=True)
 class FERCFiling:
     """A FERC eLibrary filing result."""
     accession_number: str
@@ -52,26 +69,38 @@ class FERCFiling:
 
 
 class FERCeLibraryScraper:
-    """Scraper for the FERC eLibrary filing system."""
+    """Scraper for the FERC eLibrary filing system.
+
+    Safe to share across threads: request starts are spaced rate_limit_sec
+    apart globally, so concurrent downloads only overlap transfer time.
+    """
 
-    def __init__(self, rate_limit_sec: float = 1.0, timeout: int = 60):
-        self.session = requests.Session()
-        self.session.headers.update({
-            "User-Agent": "grid-constraint-classifier/2.0 (research)",
-        })
+    def __init__(
+        self,
+        rate_limit_sec: float = 1.0,
+        timeout: int = 60,
+        session: Optional[requests.Session] = None,
+    ):
+        self.session = session or shared_session()
         self.rate_limit_sec = rate_limit_sec
         self.timeout = timeout
-        self._last_request = 0.0
+        self._throttle_lock = threading.Lock()
+        self._next_request_at = 0.0
+
+    def _throttle(self) -> None:
+        """Block until this caller may start a request."""
+        with self._throttle_lock:
+            now = time.monotonic()
+            wait = self._next_request_at - now
+            self._next_request_at = max(now, self._next_request_at) + self.rate_limit_sec
+        if wait > 0:
+            time.sleep(wait)
 
     def _rate_limited_get(self, url: str, **kwargs) -> requests.Response:
         """Rate-limited GET request."""
-        import time
-        elapsed = time.time() - self._last_request
-        if elapsed < self.rate_limit_sec:
-            time.sleep(self.rate_limit_sec - elapsed)
+        self._throttle()
         kwargs.setdefault("timeout", self.timeout)
         resp = self.session.get(url, **kwargs)
-        self._last_request = time.time()
         resp.raise_for_status()
         return resp
 
@@ -173,15 +202,35 @@ class FERCeLibraryScraper:
 
         try:
             resp = self._rate_limited_get(url, stream=True)
-            with open(dest_path, "wb") as f:
-                for chunk in resp.iter_content(chunk_size=8192):
-                    f.write(chunk)
+            save_response(resp, dest_path)
             logger.info(f"Saved to {dest_path}")
             return dest_path
         except Exception as e:
             logger.error(f"Download failed for {accession_number}: {e}")
             return None
 
+    def download_documents(
+        self,
+        accession_numbers: list[str],
+        dest_dir: Path,
+        max_workers: int = DOWNLOAD_PARALLELISM,
+    ) -> dict[str, Optional[Path]]:
+        """Download several filings concurrently (still rate limited).
+
+        Returns:
+            {accession_number: saved path, or None if that download failed}
+        """
+        accession_numbers = list(dict.fromkeys(accession_numbers))
+        workers = min(max_workers, len(accession_numbers))
+        if workers <= 1:
+            paths = [self.download_document(a, dest_dir) for a in accession_numbers]
+        else:
+            with ThreadPoolExecutor(max_workers=workers) as pool:
+                paths = list(pool.map(
+                    lambda a: self.download_document(a, dest_dir), accession_numbers,
+                ))
+        return dict(zip(accession_numbers, paths))
+
     def _parse_json_results(self, data) -> list[FERCFiling]:
         """Parse JSON search results."""
         results = []
@@ -212,11 +261,15 @@ class FERCeLibraryScraper:
         return results
 
     def _parse_html_results(self, html: str) -> list[FERCFiling]:
-        """Parse HTML search results from FERC eLibrary."""
-        from bs4 import BeautifulSoup
+        """Parse HTML search results from FERC eLibrary.
+
+        Only <tr> elements are built into the tree; nothing else is read.
+        """
+        from bs4 import BeautifulSoup, SoupStrainer
 
-        soup = BeautifulSoup(html, "html.parser")
+        soup = BeautifulSoup(html, HTML_PARSER, parse_only=SoupStrainer("tr"))
         results = []
+        accession_seen: set[str] = set()
 
         # FERC eLibrary renders results in table rows
         for row in soup.find_all("tr"):
@@ -224,12 +277,15 @@ class FERCeLibraryScraper:
             if len(cells) < 3:
                 continue
 
+            texts = [c.get_text(strip=True) for c in cells]
+            text_accession, docket = _row_ids(" ".join(texts))
+
             # Try to extract accession number (typically a link)
             accession = None
             for link in row.find_all("a", href=True):
                 href = link["href"]
                 if "accession" in href.lower():
-                    match = re.search(r"(\d{8}-\d{4})", href)
+                    match = _ACCESSION_RE.search(href)
                     if match:
                         accession = match.group(1)
                     else:
@@ -237,21 +293,19 @@ class FERCeLibraryScraper:
                     break
 
             if not accession:
-                # Try text patterns
-                text = row.get_text()
-                match = re.search(r"(\d{8}-\d{4})", text)
-                if match:
-                    accession = match.group(1)
-                else:
+                # Fall back to an accession number in the cell text
+                accession = text_accession
+                if not accession:
                     continue
 
-            # Extract other fields from cells
-            texts = [c.get_text(strip=True) for c in cells]
-            docket_match = re.search(r"([A-Z]{2}\d{2}-\d+)", " ".join(texts))
+            # Keep the first row per filing
+            if accession in accession_seen:
+                continue
+            accession_seen.add(accession)
 
             filing = FERCFiling(
                 accession_number=accession,
-                docket_number=docket_match.group(1) if docket_match else None,
+                docket_number=docket,
                 description=texts[1][:500] if len(texts) > 1 else None,
             )
 
@@ -263,10 +317,22 @@ class FERCeLibraryScraper:
                 except (ValueError, TypeError):
                     continue
 
-            if not any(r.accession_number == accession for r in results):
-                results.append(filing)
+            results.append(filing)
 
         return results
 
     def __repr__(self) -> str:
         return "<FERCeLibraryScraper>"
+
+
+def _row_ids(text: str) -> tuple[Optional[str], Optional[str]]:
+    """First accession and docket numbers in a row's text, in one pass."""
+    accession = docket = None
+    for match in _ROW_IDS_RE.finditer(text):
+        if match.lastgroup == "accession":
+            accession = accession or match.group()
+        else:
+            docket = docket or match.group()
+        if accession and docket:
+            break
+    return accession, docket
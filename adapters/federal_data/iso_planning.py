@@ -14,15 +14,22 @@ for each ISO/RTO's publicly available planning data.
 """
 
 import logging
-from dataclasses import dataclass, field
+import sys
+import threading
+import time
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
 from enum import Enum
 from typing import Optional
 from pathlib import Path
-
-import requests
+from urllib.parse import urlsplit
 
 logger = logging.getLogger(__name__)
 
+DOWNLOAD_PARALLELISM = 8  # Downloads in flight per download_many call
+HOST_CONCURRENCY = 4  # Simultaneous transfers from any one ISO host
+
 
 class ISOCode(str, Enum):
     CAISO = "CAISO"
@@ -34,7 +41,7 @@ class ISOCode(str, Enum):
     SPP = "SPP"
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class PlanningDataSource:
     """A planning data source published by an ISO/RTO."""
     iso_code: str
@@ -44,9 +51,16 @@ class PlanningDataSource:
     data_type: str  # report, dataset, api, portal
     format: str  # pdf, xlsx, csv, json, html
     frequency: str  # annual, quarterly, monthly, ad-hoc
-    categories: list[str] = field(default_factory=list)
+    categories: tuple[str, ...] = ()
     notes: Optional[str] = None
 
+    def __post_init__(self):
+        # Keys of the registry indexes repeat across entries; intern them so
+        # every entry shares one object and lookups compare by identity
+        for name in ("iso_code", "data_type", "format", "frequency"):
+            object.__setattr__(self, name, sys.intern(getattr(self, name)))
+        object.__setattr__(self, "categories", tuple(sys.intern(c) for c in self.categories))
+
 
 # Registry of all known ISO/RTO planning data sources
 ISO_PLANNING_SOURCES: list[PlanningDataSource] = [
@@ -60,7 +74,7 @@ ISO_PLANNING_SOURCES: list[PlanningDataSource] = [
         data_type="report",
         format="pdf",
         frequency="annual",
-        categories=["transmission_plan", "grid_constraint", "resource_need"],
+        categories=("transmission_plan", "grid_constraint", "resource_need"),
     ),
     PlanningDataSource(
         iso_code="CAISO",
@@ -71,7 +85,7 @@ ISO_PLANNING_SOURCES: list[PlanningDataSource] = [
         data_type="report",
         format="pdf",
         frequency="annual",
-        categories=["grid_constraint", "resource_need"],
+        categories=("grid_constraint", "resource_need"),
     ),
     PlanningDataSource(
         iso_code="CAISO",
@@ -81,7 +95,7 @@ ISO_PLANNING_SOURCES: list[PlanningDataSource] = [
         data_type="dataset",
         format="xlsx",
         frequency="monthly",
-        categories=["interconnection_queue"],
+        categories=("interconnection_queue",),
     ),
     PlanningDataSource(
         iso_code="CAISO",
@@ -91,7 +105,7 @@ ISO_PLANNING_SOURCES: list[PlanningDataSource] = [
         data_type="dataset",
         format="xlsx",
         frequency="annual",
-        categories=["load_forecast"],
+        categories=("load_forecast",),
     ),
     # === PJM ===
     PlanningDataSource(
@@ -103,7 +117,7 @@ ISO_PLANNING_SOURCES: list[PlanningDataSource] = [
         data_type="report",
         format="pdf",
         frequency="annual",
-        categories=["transmission_plan", "grid_constraint"],
+        categories=("transmission_plan", "grid_constraint"),
     ),
     PlanningDataSource(
         iso_code="PJM",
@@ -113,7 +127,7 @@ ISO_PLANNING_SOURCES: list[PlanningDataSource] = [
         data_type="dataset",
         format="xlsx",
         frequency="annual",
-        categories=["load_forecast"],
+        categories=("load_forecast",),
     ),
     PlanningDataSource(
         iso_code="PJM",
@@ -123,7 +137,7 @@ ISO_PLANNING_SOURCES: list[PlanningDataSource] = [
         data_type="dataset",
         format="xlsx",
         frequency="monthly",
-        categories=["interconnection_queue"],
+        categories=("interconnection_queue",),
     ),
     PlanningDataSource(
         iso_code="PJM",
@@ -133,7 +147,7 @@ ISO_PLANNING_SOURCES: list[PlanningDataSource] = [
         data_type="dataset",
         format="xlsx",
         frequency="annual",
-        categories=["resource_need"],
+        categories=("resource_need",),
     ),
     # === ERCOT ===
     PlanningDataSource(
@@ -144,7 +158,7 @@ ISO_PLANNING_SOURCES: list[PlanningDataSource] = [
         data_type="report",
         format="pdf",
         frequency="annual",
-        categories=["load_forecast", "resource_need"],
+        categories=("load_forecast", "resource_need"),
     ),
     PlanningDataSource(
         iso_code="ERCOT",
@@ -154,7 +168,7 @@ ISO_PLANNING_SOURCES: list[PlanningDataSource] = [
         data_type="report",
         format="pdf",
         frequency="semi-annual",
-        categories=["load_forecast", "resource_need"],
+        categories=("load_forecast", "resource_need"),
     ),
     PlanningDataSource(
         iso_code="ERCOT",
@@ -164,7 +178,7 @@ ISO_PLANNING_SOURCES: list[PlanningDataSource] = [
         data_type="dataset",
         format="xlsx",
         frequency="monthly",
-        categories=["interconnection_queue"],
+        categories=("interconnection_queue",),
     ),
     PlanningDataSource(
         iso_code="ERCOT",
@@ -174,7 +188,7 @@ ISO_PLANNING_SOURCES: list[PlanningDataSource] = [
         data_type="report",
         format="pdf",
         frequency="annual",
-        categories=["transmission_plan", "grid_constraint"],
+        categories=("transmission_plan", "grid_constraint"),
     ),
     # === NYISO ===
     PlanningDataSource(
@@ -185,7 +199,7 @@ ISO_PLANNING_SOURCES: list[PlanningDataSource] = [
         data_type="dataset",
         format="xlsx",
         frequency="annual",
-        categories=["load_forecast"],
+        categories=("load_forecast",),
     ),
     PlanningDataSource(
         iso_code="NYISO",
@@ -195,7 +209,7 @@ ISO_PLANNING_SOURCES: list[PlanningDataSource] = [
         data_type="report",
         format="pdf",
         frequency="biennial",
-        categories=["grid_constraint", "resource_need"],
+        categories=("grid_constraint", "resource_need"),
     ),
     PlanningDataSource(
         iso_code="NYISO",
@@ -206,7 +220,7 @@ ISO_PLANNING_SOURCES: list[PlanningDataSource] = [
         data_type="report",
         format="pdf",
         frequency="biennial",
-        categories=["grid_constraint"],
+        categories=("grid_constraint",),
     ),
     PlanningDataSource(
         iso_code="NYISO",
@@ -216,7 +230,7 @@ ISO_PLANNING_SOURCES: list[PlanningDataSource] = [
         data_type="dataset",
         format="xlsx",
         frequency="monthly",
-        categories=["interconnection_queue"],
+        categories=("interconnection_queue",),
     ),
     # === ISO-NE ===
     PlanningDataSource(
@@ -227,7 +241,7 @@ ISO_PLANNING_SOURCES: list[PlanningDataSource] = [
         data_type="report",
         format="pdf",
         frequency="biennial",
-        categories=["transmission_plan", "grid_constraint", "load_forecast"],
+        categories=("transmission_plan", "grid_constraint", "load_forecast"),
     ),
     PlanningDataSource(
         iso_code="ISO-NE",
@@ -238,7 +252,7 @@ ISO_PLANNING_SOURCES: list[PlanningDataSource] = [
         data_type="dataset",
         format="xlsx",
         frequency="annual",
-        categories=["load_forecast"],
+        categories=("load_forecast",),
     ),
     PlanningDataSource(
         iso_code="ISO-NE",
@@ -248,7 +262,7 @@ ISO_PLANNING_SOURCES: list[PlanningDataSource] = [
         data_type="dataset",
         format="xlsx",
         frequency="annual",
-        categories=["resource_need"],
+        categories=("resource_need",),
     ),
     PlanningDataSource(
         iso_code="ISO-NE",
@@ -258,7 +272,7 @@ ISO_PLANNING_SOURCES: list[PlanningDataSource] = [
         data_type="dataset",
         format="xlsx",
         frequency="monthly",
-        categories=["interconnection_queue"],
+        categories=("interconnection_queue",),
     ),
     # === MISO ===
     PlanningDataSource(
@@ -269,7 +283,7 @@ ISO_PLANNING_SOURCES: list[PlanningDataSource] = [
         data_type="report",
         format="pdf",
         frequency="annual",
-        categories=["transmission_plan", "grid_constraint"],
+        categories=("transmission_plan", "grid_constraint"),
     ),
     PlanningDataSource(
         iso_code="MISO",
@@ -279,7 +293,7 @@ ISO_PLANNING_SOURCES: list[PlanningDataSource] = [
         data_type="report",
         format="pdf",
         frequency="annual",
-        categories=["resource_need", "load_forecast"],
+        categories=("resource_need", "load_forecast"),
     ),
     PlanningDataSource(
         iso_code="MISO",
@@ -289,7 +303,7 @@ ISO_PLANNING_SOURCES: list[PlanningDataSource] = [
         data_type="dataset",
         format="xlsx",
         frequency="monthly",
-        categories=["interconnection_queue"],
+        categories=("interconnection_queue",),
     ),
     # === SPP ===
     PlanningDataSource(
@@ -300,7 +314,7 @@ ISO_PLANNING_SOURCES: list[PlanningDataSource] = [
         data_type="report",
         format="pdf",
         frequency="annual",
-        categories=["transmission_plan", "grid_constraint"],
+        categories=("transmission_plan", "grid_constraint"),
     ),
     PlanningDataSource(
         iso_code="SPP",
@@ -310,7 +324,7 @@ ISO_PLANNING_SOURCES: list[PlanningDataSource] = [
         data_type="dataset",
         format="xlsx",
         frequency="monthly",
-        categories=["interconnection_queue"],
+        categories=("interconnection_queue",),
     ),
     PlanningDataSource(
         iso_code="SPP",
@@ -320,36 +334,57 @@ ISO_PLANNING_SOURCES: list[PlanningDataSource] = [
         data_type="report",
         format="pdf",
         frequency="annual",
-        categories=["resource_need", "load_forecast"],
+        categories=("resource_need", "load_forecast"),
     ),
 ]
 
 
+# Lookup indexes over the registry, built once at import. Accessors return
+# copies so callers cannot mutate them.
+def _build_indexes(sources: list[PlanningDataSource]):
+    by_iso = defaultdict(list)
+    by_category = defaultdict(list)
+    by_format = defaultdict(list)
+    datasets = []
+    for s in sources:
+        by_iso[s.iso_code].append(s)
+        for category in dict.fromkeys(s.categories):
+            by_category[category].append(s)
+        by_format[s.format].append(s)
+        if s.data_type == "dataset":
+            datasets.append(s)
+    return dict(by_iso), dict(by_category), dict(by_format), datasets
+
+
+_BY_ISO, _BY_CATEGORY, _BY_FORMAT, _DATASETS = _build_indexes(ISO_PLANNING_SOURCES)
+
+
 def get_sources_for_iso(iso_code: str) -> list[PlanningDataSource]:
     """Get all planning data sources for a given ISO/RTO."""
-    return [s for s in ISO_PLANNING_SOURCES if s.iso_code == iso_code]
+    # ISOCode members hash by name, not value, so look up by the plain string
+    return list(_BY_ISO.get(getattr(iso_code, "value", iso_code), ()))
 
 
 def get_sources_by_category(category: str) -> list[PlanningDataSource]:
     """Get all planning data sources that include a given category."""
-    return [s for s in ISO_PLANNING_SOURCES if category in s.categories]
+    return list(_BY_CATEGORY.get(category, ()))
 
 
 def get_sources_by_format(fmt: str) -> list[PlanningDataSource]:
     """Get all sources with a given file format (xlsx, csv, pdf, etc.)."""
-    return [s for s in ISO_PLANNING_SOURCES if s.format == fmt]
+    return list(_BY_FORMAT.get(fmt, ()))
 
 
 def get_downloadable_datasets() -> list[PlanningDataSource]:
     """Get all sources that are structured datasets (xlsx/csv), not PDFs."""
-    return [s for s in ISO_PLANNING_SOURCES if s.data_type == "dataset"]
+    return list(_DATASETS)
 
 
 def summarize_coverage() -> dict:
     """Summarize coverage across ISOs and categories."""
     summary = {}
     for iso_code in ISOCode:
-        sources = get_sources_for_iso(iso_code.value)
+        sources = _BY_ISO.get(iso_code.value, ())
         cats = set()
         for s in sources:
             cats.update(s.categories)
@@ -364,16 +399,49 @@ def summarize_coverage() -> dict:
 
 
 class ISOPlanningDownloader:
-    """Generic downloader for ISO/RTO planning documents."""
+    """Generic downloader for ISO/RTO planning documents.
+
+    Politeness is per host: request starts to the same host are spaced
+    rate_limit_sec apart and at most HOST_CONCURRENCY transfers run against
+    it at once, while different ISOs download in parallel (download_many).
+
+    The session is built on the first download (importing requests only
+    then, so the registry alone stays cheap) with a pooled keep-alive
+    adapter that retries 429/5xx and connection errors per DOWNLOAD_RETRY.
+    """
 
     def __init__(self, rate_limit_sec: float = 2.0, timeout: int = 120):
-        self.session = requests.Session()
-        self.session.headers.update({
-            "User-Agent": "grid-constraint-classifier/2.0 (research)",
-        })
+        self.session = None
         self.rate_limit_sec = rate_limit_sec
         self.timeout = timeout
-        self._last_request = 0.0
+        self._throttle_lock = threading.Lock()
+        self._next_request_at: dict[str, float] = {}
+        self._host_slots: dict[str, threading.BoundedSemaphore] = {}
+
+    def _get_session(self):
+        with self._throttle_lock:
+            if self.session is None:
+                from ._http import DOWNLOAD_RETRY, make_session
+
+                self.session = make_session(retry=DOWNLOAD_RETRY)
+            return self.session
+
+    def _host_slot(self, host: str) -> threading.BoundedSemaphore:
+        with self._throttle_lock:
+            slot = self._host_slots.get(host)
+            if slot is None:
+                slot = self._host_slots[host] = threading.BoundedSemaphore(HOST_CONCURRENCY)
+            return slot
+
+    def _throttle(self, host: str) -> None:
+        """Block until a request to host may start."""
+        with self._throttle_lock:
+            now = time.monotonic()
+            next_at = self._next_request_at.get(host, 0.0)
+            wait = next_at - now
+            self._next_request_at[host] = max(now, next_at) + self.rate_limit_sec
+        if wait > 0:
+            time.sleep(wait)
 
     def download(
         self,
@@ -381,8 +449,12 @@ class ISOPlanningDownloader:
         dest_dir: Path,
         filename: Optional[str] = None,
     ) -> Optional[Path]:
-        """Download a file from an ISO/RTO planning source."""
-        import time
+        """Download a file from an ISO/RTO planning source.
+
+        A file downloaded before with validators (see _http.fetch_cached) is
+        revalidated with a conditional GET; one without is reused as is.
+        """
+        from ._http import fetch_cached, read_cache_meta
 
         dest_dir.mkdir(parents=True, exist_ok=True)
 
@@ -391,24 +463,20 @@ class ISOPlanningDownloader:
 
         dest_path = dest_dir / filename
 
-        if dest_path.exists():
+        if dest_path.exists() and read_cache_meta(dest_path) is None:
             logger.info(f"Already downloaded: {filename}")
             return dest_path
 
-        elapsed = time.time() - self._last_request
-        if elapsed < self.rate_limit_sec:
-            time.sleep(self.rate_limit_sec - elapsed)
-
-        logger.info(f"Downloading: {url}")
+        host = urlsplit(url).netloc
         try:
-            resp = self.session.get(url, timeout=self.timeout, stream=True)
-            resp.raise_for_status()
-
-            with open(dest_path, "wb") as f:
-                for chunk in resp.iter_content(chunk_size=8192):
-                    f.write(chunk)
-
-            self._last_request = time.time()
+            with self._host_slot(host):
+                self._throttle(host)
+                logger.info(f"Downloading: {url}")
+                fetched = fetch_cached(self._get_session(), url, dest_path, self.timeout)
+
+            if not fetched:
+                logger.info(f"Not modified: {filename}")
+                return dest_path
             logger.info(f"Saved to {dest_path} ({dest_path.stat().st_size:,} bytes)")
             return dest_path
 
@@ -416,5 +484,25 @@ class ISOPlanningDownloader:
             logger.error(f"Download failed: {e}")
             return None
 
+    def download_many(
+        self,
+        urls: list[str],
+        dest_dir: Path,
+        max_workers: int = DOWNLOAD_PARALLELISM,
+    ) -> dict[str, Optional[Path]]:
+        """Download several files concurrently, keeping per-host politeness.
+
+        Returns:
+            {url: saved path, or None if that download failed}
+        """
+        urls = list(dict.fromkeys(urls))
+        workers = min(max_workers, len(urls))
+        if workers <= 1:
+            paths = [self.download(url, dest_dir) for url in urls]
+        else:
+            with ThreadPoolExecutor(max_workers=workers) as pool:
+                paths = list(pool.map(lambda url: self.download(url, dest_dir), urls))
+        return dict(zip(urls, paths))
+
     def __repr__(self) -> str:
         return "<ISOPlanningDownloader>"
@@ -20,20 +20,51 @@ Key tables:
 Reference: https://catalystcoop.github.io/pudl/
 """
 
+import hashlib
 import logging
+import os
+import sqlite3
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Optional
+from typing import TYPE_CHECKING, Optional, Union
 
-import requests
+if TYPE_CHECKING:
+    import requests
+
+try:
+    import pyarrow as pa
+except ImportError:
+    pa = None
 
 logger = logging.getLogger(__name__)
 
 PUDL_NIGHTLY_URL = "https://data.catalyst.coop/pudl/nightly"
 PUDL_STABLE_URL = "https://data.catalyst.coop/pudl"
 
+# download_sqlite splits files of at least RANGE_MIN_BYTES into this many
+# concurrent HTTP Range requests when the server advertises byte ranges
+RANGE_PARALLELISM = 8
+RANGE_MIN_BYTES = 64 * 1024 * 1024
+
+# Seconds between progress log lines during download_sqlite
+PROGRESS_INTERVAL_SEC = 2.0
+
+# Applied once to each cached read-only SQLite connection: 64 MB page cache
+# and 256 MB of the database memory-mapped instead of read() per page
+SQLITE_PRAGMAS = (
+    "PRAGMA cache_size=-65536",
+    "PRAGMA mmap_size=268435456",
+    "PRAGMA query_only=1",
+)
+
+# Rows fetched per Arrow record batch in query_arrow
+SQLITE_ARROW_BATCH_ROWS = 65536
 
-@dataclass
+
+@dataclass(slots=True, frozen=True)
 class PUDLTable:
     """Metadata about a PUDL table."""
     name: str
@@ -94,53 +125,204 @@ class PUDLClient:
     def __init__(self, data_dir: Optional[Path] = None, use_nightly: bool = False):
         self.data_dir = data_dir or Path("data/pudl")
         self.base_url = PUDL_NIGHTLY_URL if use_nightly else PUDL_STABLE_URL
-        self.session = requests.Session()
-        self.session.headers.update({
-            "User-Agent": "grid-constraint-classifier/2.0 (research)",
-        })
+        self.session = None  # Built on first download, see _get_session
+        self._session_lock = threading.Lock()
+        self._conns: dict[Path, sqlite3.Connection] = {}
+        self._conn_lock = threading.Lock()
+
+    def _get_session(self) -> "requests.Session":
+        """The HTTP session, importing requests on first use."""
+        with self._session_lock:
+            if self.session is None:
+                from ._http import DOWNLOAD_RETRY, make_session
+
+                self.session = make_session(retry=DOWNLOAD_RETRY)
+            return self.session
 
     def download_sqlite(self) -> Optional[Path]:
-        """Download the full PUDL SQLite database (~2GB)."""
+        """Download the full PUDL SQLite database (~2GB).
+
+        When the server accepts byte ranges and gives a validator (a strong
+        ETag or Last-Modified) the file is fetched as RANGE_PARALLELISM
+        concurrent Range requests, each writing its own slice of a
+        preallocated file; otherwise it is streamed over one connection.
+        Every range is sent with If-Range, so a file rebuilt mid-download
+        fails the download instead of mixing slices of two builds. Data
+        lands in a .part file that is renamed on success.
+
+        A copy downloaded before is revalidated against its stored
+        ETag/Last-Modified (see _http.write_cache_meta) and kept on a 304;
+        a copy without stored validators is reused as is.
+        """
+        from . import _http
+
         self.data_dir.mkdir(parents=True, exist_ok=True)
         dest = self.data_dir / "pudl.sqlite"
 
-        if dest.exists():
+        meta = _http.read_cache_meta(dest)
+        if dest.exists() and meta is None:
             logger.info(f"PUDL SQLite already exists: {dest} ({dest.stat().st_size:,} bytes)")
             return dest
 
         url = f"{self.base_url}/pudl.sqlite"
+        conditional = _http.validator_headers(meta)
         logger.info(f"Downloading PUDL SQLite from {url} (this may take a while)...")
 
+        part = dest.with_name(dest.name + ".part")
         try:
-            resp = self.session.get(url, timeout=600, stream=True)
-            resp.raise_for_status()
-
-            total = int(resp.headers.get("content-length", 0))
-            downloaded = 0
-
-            with open(dest, "wb") as f:
-                for chunk in resp.iter_content(chunk_size=65536):
-                    f.write(chunk)
-                    downloaded += len(chunk)
-                    if total and downloaded % (50 * 1024 * 1024) == 0:
-                        pct = (downloaded / total) * 100
-                        logger.info(f"  {downloaded:,} / {total:,} bytes ({pct:.0f}%)")
+            head = self._head(url, conditional)
+            if head is not None and head.status_code == 304:
+                logger.info(f"PUDL SQLite is up to date: {dest}")
+                return dest
+
+            total = _range_length(head)
+            if total is not None and total >= RANGE_MIN_BYTES and _if_range_validator(head):
+                self._download_ranges(url, part, head)
+                headers = head.headers
+                with open(part, "rb") as f:
+                    sha256 = hashlib.file_digest(f, "sha256").hexdigest()
+            else:
+                streamed = self._download_stream(url, part, conditional)
+                if streamed is None:
+                    logger.info(f"PUDL SQLite is up to date: {dest}")
+                    return dest
+                headers, sha256 = streamed
+            os.replace(part, dest)
+            _http.write_cache_meta(dest, headers, sha256)
 
             logger.info(f"Downloaded PUDL SQLite: {dest} ({dest.stat().st_size:,} bytes)")
             return dest
 
         except Exception as e:
             logger.error(f"PUDL download failed: {e}")
-            if dest.exists():
-                dest.unlink()
+            if part.exists():
+                part.unlink()
+            return None
+
+    def _head(self, url: str, headers: dict) -> Optional["requests.Response"]:
+        """HEAD url, conditional if headers carry validators; None on failure."""
+        try:
+            resp = self._get_session().head(url, headers=headers, timeout=60, allow_redirects=True)
+            resp.raise_for_status()
+        except Exception as e:
+            logger.debug(f"HEAD {url} failed, streaming instead: {e}")
             return None
+        return resp
+
+    def _download_stream(
+        self, url: str, dest: Path, headers: dict,
+    ) -> Optional[tuple["requests.structures.CaseInsensitiveDict", str]]:
+        """Stream url into dest over a single connection.
+
+        Returns:
+            (response headers, SHA-256 hex digest), or None on a 304
+        """
+        from . import _http
+
+        resp = self._get_session().get(url, headers=headers, timeout=600, stream=True)
+        if resp.status_code == 304:
+            resp.close()
+            return None
+        resp.raise_for_status()
+
+        total = int(resp.headers.get("content-length", 0))
+        downloaded = 0
+        digest = hashlib.sha256()
+        next_report = time.monotonic() + PROGRESS_INTERVAL_SEC
+
+        with open(dest, "wb") as f:
+            for chunk in resp.iter_content(chunk_size=_http.DOWNLOAD_CHUNK_BYTES):
+                f.write(chunk)
+                digest.update(chunk)
+                downloaded += len(chunk)
+                if time.monotonic() >= next_report:
+                    next_report += PROGRESS_INTERVAL_SEC
+                    _log_progress(downloaded, total)
+        return resp.headers, digest.hexdigest()
+
+    def _download_ranges(self, url: str, dest: Path, head: "requests.Response") -> None:
+        """Fetch url as concurrent byte ranges into a preallocated dest.
+
+        Each range carries If-Range with the HEAD's validator and must come
+        back as a 206 whose Content-Range total (and ETag, if any) matches
+        the HEAD; anything else means the file changed and raises IOError.
+        """
+        from . import _http
+
+        total = _range_length(head)
+        validator = _if_range_validator(head)
+        etag = head.headers.get("etag")
+        with open(dest, "wb") as f:
+            if hasattr(os, "posix_fallocate"):
+                os.posix_fallocate(f.fileno(), 0, total)
+            else:
+                f.truncate(total)
+
+        step = -(-total // RANGE_PARALLELISM)
+        ranges = [(lo, min(lo + step, total) - 1) for lo in range(0, total, step)]
+        lock = threading.Lock()
+        done = [0]
+        next_report = [time.monotonic() + PROGRESS_INTERVAL_SEC]
+        # Set by the first failing range so the others stop reading
+        abort = threading.Event()
+
+        def fetch(bounds: tuple[int, int]) -> None:
+            lo, hi = bounds
+            try:
+                resp = self._get_session().get(
+                    url, headers={"Range": f"bytes={lo}-{hi}", "If-Range": validator},
+                    timeout=600, stream=True,
+                )
+                resp.raise_for_status()
+                if resp.status_code != 206:
+                    raise IOError(
+                        f"{url} changed during download or ignored Range "
+                        f"bytes={lo}-{hi} (HTTP {resp.status_code})"
+                    )
+                content_range = resp.headers.get("content-range", "")
+                if content_range != f"bytes {lo}-{hi}/{total}":
+                    raise IOError(f"unexpected Content-Range {content_range!r} for bytes={lo}-{hi}/{total}")
+                if etag and resp.headers.get("etag") != etag:
+                    raise IOError(f"{url} changed during download (ETag {resp.headers.get('etag')})")
+
+                written = 0
+                with open(dest, "r+b") as f:
+                    f.seek(lo)
+                    for chunk in resp.iter_content(chunk_size=_http.DOWNLOAD_CHUNK_BYTES):
+                        if abort.is_set():
+                            resp.close()
+                            return
+                        f.write(chunk)
+                        written += len(chunk)
+                        with lock:
+                            done[0] += len(chunk)
+                            report = time.monotonic() >= next_report[0]
+                            if report:
+                                next_report[0] += PROGRESS_INTERVAL_SEC
+                                downloaded = done[0]
+                        if report:
+                            _log_progress(downloaded, total)
+                if written != hi - lo + 1:
+                    raise IOError(f"short read for bytes={lo}-{hi}: {written:,} bytes")
+            except BaseException:
+                abort.set()
+                raise
+
+        with ThreadPoolExecutor(max_workers=len(ranges)) as pool:
+            list(pool.map(fetch, ranges))
 
     def download_parquet(self, table_name: str) -> Optional[Path]:
-        """Download a single PUDL table as Parquet file."""
+        """Download a single PUDL table as Parquet file.
+
+        Revalidated with a conditional GET when downloaded before, as in
+        download_sqlite.
+        """
+        from . import _http
+
         self.data_dir.mkdir(parents=True, exist_ok=True)
         dest = self.data_dir / f"{table_name}.parquet"
 
-        if dest.exists():
+        if dest.exists() and _http.read_cache_meta(dest) is None:
             logger.info(f"Already downloaded: {dest}")
             return dest
 
@@ -148,12 +330,9 @@ class PUDLClient:
         logger.info(f"Downloading {table_name}.parquet...")
 
         try:
-            resp = self.session.get(url, timeout=300, stream=True)
-            resp.raise_for_status()
-
-            with open(dest, "wb") as f:
-                for chunk in resp.iter_content(chunk_size=8192):
-                    f.write(chunk)
+            if not _http.fetch_cached(self._get_session(), url, dest, timeout=300):
+                logger.info(f"Not modified: {dest}")
+                return dest
 
             logger.info(f"Downloaded: {dest} ({dest.stat().st_size:,} bytes)")
             return dest
@@ -162,49 +341,158 @@ class PUDLClient:
             logger.error(f"Download failed for {table_name}: {e}")
             return None
 
-    def query_sqlite(self, sql: str, db_path: Optional[Path] = None):
+    def query_sqlite(self, sql: str, params: tuple = (), db_path: Optional[Path] = None):
         """Run a SQL query against the PUDL SQLite database.
 
-        Returns list of dicts. Requires sqlite3 (stdlib).
-        """
-        import sqlite3
+        Values go in params as ? placeholders, never formatted into sql, so
+        SQLite can reuse the prepared statement. The read-only connection is
+        opened once per database and reused until close().
 
+        Returns list of dicts.
+        """
         db = db_path or (self.data_dir / "pudl.sqlite")
         if not db.exists():
             logger.error(f"PUDL SQLite not found at {db}. Run download_sqlite() first.")
             return []
 
-        conn = sqlite3.connect(str(db))
-        conn.row_factory = sqlite3.Row
-        try:
-            rows = conn.execute(sql).fetchall()
-            return [dict(r) for r in rows]
-        except Exception as e:
-            logger.error(f"Query failed: {e}")
-            return []
-        finally:
-            conn.close()
+        with self._conn_lock:
+            try:
+                conn = self._connection(db)
+                rows = conn.execute(sql, params).fetchall()
+                return [dict(r) for r in rows]
+            except Exception as e:
+                logger.error(f"Query failed: {e}")
+                return []
+
+    def query_arrow(self, sql: str, params: tuple = (), db_path: Optional[Path] = None) -> "pa.Table":
+        """Run a SQL query and return a pyarrow Table.
+
+        Rows are pulled as plain tuples in SQLITE_ARROW_BATCH_ROWS batches
+        and converted column-wise, so only one batch is ever held as Python
+        objects; large tables (e.g. hourly demand) stay columnar. Returns an
+        empty table if the database is missing or the query fails.
+        """
+        if pa is None:
+            raise ImportError("query_arrow requires pyarrow")
 
-    def get_utilities(self, state: Optional[str] = None, db_path: Optional[Path] = None) -> list[dict]:
-        """Get utility list from PUDL with optional state filter."""
+        db = db_path or (self.data_dir / "pudl.sqlite")
+        if not db.exists():
+            logger.error(f"PUDL SQLite not found at {db}. Run download_sqlite() first.")
+            return pa.table({})
+
+        with self._conn_lock:
+            try:
+                cur = self._connection(db).cursor()
+                cur.row_factory = None
+                cur.execute(sql, params)
+                names = [d[0] for d in cur.description or ()]
+                batches = []
+                while rows := cur.fetchmany(SQLITE_ARROW_BATCH_ROWS):
+                    batches.append(pa.table([pa.array(col) for col in zip(*rows)], names=names))
+            except Exception as e:
+                logger.error(f"Query failed: {e}")
+                return pa.table({})
+
+        if not batches:
+            return pa.table([pa.array([], pa.null()) for _ in names], names=names)
+        # A column that is all NULL in one batch but typed in another is
+        # promoted rather than rejected
+        return pa.concat_tables(batches, promote_options="permissive")
+
+    def _query(self, sql: str, params: tuple, db_path: Optional[Path], return_type: str):
+        if return_type == "dict":
+            return self.query_sqlite(sql, params, db_path)
+        if return_type == "arrow":
+            return self.query_arrow(sql, params, db_path)
+        raise ValueError(f"return_type must be 'dict' or 'arrow', not {return_type!r}")
+
+    def _connection(self, db: Path) -> sqlite3.Connection:
+        """Cached read-only connection to db; caller holds _conn_lock."""
+        conn = self._conns.get(db)
+        if conn is None:
+            conn = sqlite3.connect(
+                f"{db.resolve().as_uri()}?mode=ro", uri=True, check_same_thread=False,
+            )
+            conn.row_factory = sqlite3.Row
+            for pragma in SQLITE_PRAGMAS:
+                conn.execute(pragma)
+            self._conns[db] = conn
+        return conn
+
+    def close(self) -> None:
+        """Close cached SQLite connections."""
+        with self._conn_lock:
+            for conn in self._conns.values():
+                conn.close()
+            self._conns.clear()
+
+    def get_utilities(
+        self,
+        state: Optional[str] = None,
+        db_path: Optional[Path] = None,
+        return_type: str = "dict",
+    ) -> Union[list[dict], "pa.Table"]:
+        """Get utility list from PUDL with optional state filter.
+
+        return_type: "dict" for a list of row dicts, "arrow" for a pyarrow Table.
+        """
         sql = "SELECT * FROM core_eia__entity_utilities"
+        params: tuple = ()
         if state:
-            sql += f" WHERE state = '{state}'"
-        return self.query_sqlite(sql, db_path)
+            sql += " WHERE state = ?"
+            params = (state,)
+        return self._query(sql, params, db_path, return_type)
 
     def get_plants(
         self,
         state: Optional[str] = None,
         utility_id: Optional[int] = None,
         db_path: Optional[Path] = None,
-    ) -> list[dict]:
-        """Get power plant list from PUDL."""
+        return_type: str = "dict",
+    ) -> Union[list[dict], "pa.Table"]:
+        """Get power plant list from PUDL.
+
+        return_type: "dict" for a list of row dicts, "arrow" for a pyarrow Table.
+        """
         sql = "SELECT * FROM core_eia__entity_plants WHERE 1=1"
+        params: tuple = ()
         if state:
-            sql += f" AND state = '{state}'"
+            sql += " AND state = ?"
+            params += (state,)
         if utility_id:
-            sql += f" AND utility_id_eia = {utility_id}"
-        return self.query_sqlite(sql, db_path)
+            sql += " AND utility_id_eia = ?"
+            params += (utility_id,)
+        return self._query(sql, params, db_path, return_type)
 
     def __repr__(self) -> str:
         return f"<PUDLClient(data_dir={self.data_dir})>"
+
+
+def _log_progress(downloaded: int, total: int) -> None:
+    if total:
+        logger.info(f"  {downloaded:,} / {total:,} bytes ({downloaded / total * 100:.0f}%)")
+    else:
+        logger.info(f"  {downloaded:,} bytes")
+
+
+def _if_range_validator(head: Optional["requests.Response"]) -> Optional[str]:
+    """The HEAD's strong ETag, else its Last-Modified, for If-Range; None if neither.
+
+    If-Range only accepts strong validators, so a weak (W/) ETag is skipped.
+    """
+    if head is None:
+        return None
+    etag = head.headers.get("etag")
+    if etag and not etag.startswith("W/"):
+        return etag
+    return head.headers.get("last-modified")
+
+
+def _range_length(head: Optional["requests.Response"]) -> Optional[int]:
+    """Content length if the HEAD response advertises byte ranges, else None."""
+    if head is None or head.headers.get("accept-ranges", "").lower() != "bytes":
+        return None
+    try:
+        return int(head.headers["content-length"])
+    except (KeyError, ValueError):
+        return None
@@ -210,7 +210,9 @@ class GridstatusAdapter(ISOAdapter):
             market="DAY_AHEAD_HOURLY",
         )
 
-    def pull_zone_lmps(self, year: int, force: bool = False) -> pd.DataFrame:
+    def pull_zone_lmps(
+        self, year: int, force: bool = False, columns: Optional[list[str]] = None,
+    ) -> pd.DataFrame:
         """
         Pull zone-level day-ahead hourly LMPs for a full year via gridstatus.
 
@@ -220,7 +222,7 @@ class GridstatusAdapter(ISOAdapter):
 
         if cache_path.exists() and not force:
             logger.info(f"Loading cached zone LMPs from {cache_path}")
-            return pd.read_parquet(cache_path)
+            return self._read_cache(cache_path, columns)
 
         iso = self._get_gridstatus_iso()
 
@@ -268,14 +270,18 @@ class GridstatusAdapter(ISOAdapter):
         if self.config.congestion_approximated:
             df = self._approximate_congestion(df)
 
-        cache_path.parent.mkdir(parents=True, exist_ok=True)
-        df.to_parquet(cache_path, index=False)
+        self._write_cache(df, cache_path)
         logger.info(f"Cached {len(df)} rows to {cache_path}")
 
-        return df
+        return self._select_columns(df, columns)
 
     def pull_node_lmps(
-        self, zone: str, year: int, month: int, force: bool = False
+        self,
+        zone: str,
+        year: int,
+        month: int,
+        force: bool = False,
+        columns: Optional[list[str]] = None,
     ) -> pd.DataFrame:
         """
         Pull node-level LMPs for a specific zone and month via gridstatus.
@@ -295,7 +301,7 @@ class GridstatusAdapter(ISOAdapter):
 
         if cache_path.exists() and not force:
             logger.info(f"Loading cached node LMPs from {cache_path}")
-            return pd.read_parquet(cache_path)
+            return self._read_cache(cache_path, columns)
 
         iso = self._get_gridstatus_iso()
 
@@ -326,11 +332,10 @@ class GridstatusAdapter(ISOAdapter):
 
         df = self._normalize_node_lmps(df)
 
-        cache_path.parent.mkdir(parents=True, exist_ok=True)
-        df.to_parquet(cache_path, index=False)
+        self._write_cache(df, cache_path)
         logger.info(f"Cached {len(df)} rows to {cache_path}")
 
-        return df
+        return self._select_columns(df, columns)
 
     def _approximate_congestion(self, df: pd.DataFrame) -> pd.DataFrame:
         """
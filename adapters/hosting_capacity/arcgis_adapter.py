@@ -8,6 +8,7 @@ URL rotation.
 
 import json
 import logging
+import math
 from pathlib import Path
 from typing import Optional
 
@@ -18,6 +19,17 @@ from adapters.arcgis_client import ArcGISClient
 from .base import HostingCapacityAdapter, UtilityHCConfig
 from .normalizer import normalize_hosting_capacity
 
+try:
+    import orjson
+
+    def _dumps(v) -> str:
+        return orjson.dumps(v).decode()
+
+    _loads = orjson.loads
+except ImportError:
+    _dumps = json.dumps
+    _loads = json.loads
+
 logger = logging.getLogger(__name__)
 
 
@@ -33,7 +45,7 @@ class ArcGISHostingCapacityAdapter(HostingCapacityAdapter):
             for col in ("geometry_json", "raw_attributes"):
                 if col in df.columns:
                     df[col] = df[col].apply(
-                        lambda v: json.loads(v) if isinstance(v, str) else v
+                        lambda v: _loads(v) if isinstance(v, str) else v
                     )
             return df
 
@@ -46,6 +58,7 @@ class ArcGISHostingCapacityAdapter(HostingCapacityAdapter):
             url=url,
             page_size=self.config.page_size,
             out_sr=self.config.out_sr,
+            force=force,
         )
 
         if not features:
@@ -61,7 +74,7 @@ class ArcGISHostingCapacityAdapter(HostingCapacityAdapter):
         for col in ("geometry_json", "raw_attributes"):
             if col in df_cache.columns:
                 df_cache[col] = df_cache[col].apply(
-                    lambda v: json.dumps(v) if isinstance(v, (dict, list)) else v
+                    lambda v: _dumps(v) if isinstance(v, (dict, list)) else v
                 )
         df_cache.to_parquet(cache, index=False)
         logger.info(
@@ -71,18 +84,17 @@ class ArcGISHostingCapacityAdapter(HostingCapacityAdapter):
 
     def _features_to_dataframe(self, features: list[dict]) -> pd.DataFrame:
         """Convert raw ArcGIS features to DataFrame with geometry columns."""
-        records = []
-        for feat in features:
-            attrs = feat.get("attributes", {})
-            geom = feat.get("geometry")
+        geoms = [feat.get("geometry") for feat in features]
+        centroids = ArcGISClient.compute_centroids_batch(geoms).round(6)
 
-            row = dict(attrs)
+        records = []
+        for feat, geom, (lat, lon) in zip(features, geoms, centroids.tolist()):
+            row = dict(feat.get("attributes", {}))
             if geom:
                 row["_geometry"] = geom
                 row["_geometry_type"] = self._detect_geometry_type(geom)
-                lat, lon = ArcGISClient.compute_centroid(geom)
-                row["_centroid_lat"] = round(lat, 6) if lat else None
-                row["_centroid_lon"] = round(lon, 6) if lon else None
+                row["_centroid_lat"] = lat if lat and not math.isnan(lat) else None
+                row["_centroid_lon"] = lon if lon and not math.isnan(lon) else None
 
             records.append(row)
 
@@ -59,7 +59,9 @@ def get_hc_adapter(
     if data_dir is None:
         data_dir = Path(__file__).parent.parent.parent / "data"
     if client is None:
-        client = ArcGISClient()
+        client = ArcGISClient(
+            cache_dir=data_dir / "hosting_capacity" / ".arcgis_cache",
+        )
 
     adapter = adapter_cls(config=config, data_dir=data_dir, arcgis_client=client)
     logger.info(
@@ -12,6 +12,7 @@ Set environment variables:
 import logging
 import os
 from pathlib import Path
+from typing import Optional
 
 import pandas as pd
 
@@ -45,10 +46,19 @@ class ISONEAdapter(GridstatusAdapter):
             return False
         return True
 
-    def pull_zone_lmps(self, year: int, force: bool = False) -> pd.DataFrame:
+    def pull_zone_lmps(
+        self, year: int, force: bool = False, columns: Optional[list[str]] = None,
+    ) -> pd.DataFrame:
         self._check_credentials()
-        return super().pull_zone_lmps(year, force)
+        return super().pull_zone_lmps(year, force, columns)
 
-    def pull_node_lmps(self, zone: str, year: int, month: int, force: bool = False) -> pd.DataFrame:
+    def pull_node_lmps(
+        self,
+        zone: str,
+        year: int,
+        month: int,
+        force: bool = False,
+        columns: Optional[list[str]] = None,
+    ) -> pd.DataFrame:
         self._check_credentials()
-        return super().pull_node_lmps(zone, year, month, force)
+        return super().pull_node_lmps(zone, year, month, force, columns)
@@ -8,6 +8,7 @@ Fallback: gridstatus (returns only 8 market hubs).
 
 import logging
 from pathlib import Path
+from typing import Optional
 
 import pandas as pd
 
@@ -35,20 +36,24 @@ class MISOAdapter(GridstatusAdapter):
             self._miso_client = MISOClient()
         return self._miso_client
 
-    def pull_zone_lmps(self, year: int, force: bool = False) -> pd.DataFrame:
+    def pull_zone_lmps(
+        self, year: int, force: bool = False, columns: Optional[list[str]] = None,
+    ) -> pd.DataFrame:
         """Pull MISO loadzone LMPs, preferring custom client over gridstatus."""
         cache_path = self.data_dir / "zone_lmps" / f"zone_lmps_{year}.parquet"
 
         if cache_path.exists() and not force:
             logger.info(f"Loading cached zone LMPs from {cache_path}")
-            return pd.read_parquet(cache_path)
+            return self._read_cache(cache_path, columns)
 
         # Try custom MISO client first
         try:
-            return self._pull_zone_lmps_miso(year, cache_path)
+            return self._select_columns(
+                self._pull_zone_lmps_miso(year, cache_path), columns,
+            )
         except Exception as e:
             logger.warning(f"MISO custom pull failed ({e}), falling back to gridstatus")
-            return super().pull_zone_lmps(year, force=True)
+            return super().pull_zone_lmps(year, force=True, columns=columns)
 
     def _pull_zone_lmps_miso(
         self, year: int, cache_path: Path
@@ -82,8 +87,7 @@ class MISOAdapter(GridstatusAdapter):
                 )
                 df = filtered
 
-        cache_path.parent.mkdir(parents=True, exist_ok=True)
-        df.to_parquet(cache_path, index=False)
+        self._write_cache(df, cache_path)
         logger.info(f"Cached {len(df)} rows to {cache_path}")
 
         return df
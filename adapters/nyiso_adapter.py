@@ -13,6 +13,7 @@ Data access: CSV files, no authentication required.
 
 import logging
 from pathlib import Path
+from typing import Optional
 
 import pandas as pd
 
@@ -35,7 +36,12 @@ class NYISOAdapter(GridstatusAdapter):
         super().__init__(config, data_dir)
 
     def pull_node_lmps(
-        self, zone: str, year: int, month: int, force: bool = False
+        self,
+        zone: str,
+        year: int,
+        month: int,
+        force: bool = False,
+        columns: Optional[list[str]] = None,
     ) -> pd.DataFrame:
         """NYISO does not have bus-level pricing. Returns empty DataFrame."""
         logger.info(
@@ -40,7 +40,9 @@ class PJMAdapter(GridstatusAdapter):
             self._pjm_client = PJMClient(key)
         return self._pjm_client
 
-    def pull_zone_lmps(self, year: int, force: bool = False) -> pd.DataFrame:
+    def pull_zone_lmps(
+        self, year: int, force: bool = False, columns: Optional[list[str]] = None,
+    ) -> pd.DataFrame:
         """
         Pull PJM zone LMPs, preferring custom client over gridstatus.
         """
@@ -48,15 +50,17 @@ class PJMAdapter(GridstatusAdapter):
 
         if cache_path.exists() and not force:
             logger.info(f"Loading cached zone LMPs from {cache_path}")
-            return pd.read_parquet(cache_path)
+            return self._read_cache(cache_path, columns)
 
         # Use custom PJM client if API key available
         if self._has_api_key():
-            return self._pull_zone_lmps_custom(year, cache_path)
+            return self._select_columns(
+                self._pull_zone_lmps_custom(year, cache_path), columns,
+            )
 
         # Otherwise use gridstatus
         logger.info("No PJM_SUBSCRIPTION_KEY set, using gridstatus")
-        return super().pull_zone_lmps(year, force=True)
+        return super().pull_zone_lmps(year, force=True, columns=columns)
 
     def _pull_zone_lmps_custom(
         self, year: int, cache_path: Path
@@ -87,14 +91,18 @@ class PJMAdapter(GridstatusAdapter):
             if col in df.columns:
                 df[col] = pd.to_numeric(df[col], errors="coerce")
 
-        cache_path.parent.mkdir(parents=True, exist_ok=True)
-        df.to_parquet(cache_path, index=False)
+        self._write_cache(df, cache_path)
         logger.info(f"Cached {len(df)} rows to {cache_path}")
 
         return df
 
     def pull_node_lmps(
-        self, zone: str, year: int, month: int, force: bool = False
+        self,
+        zone: str,
+        year: int,
+        month: int,
+        force: bool = False,
+        columns: Optional[list[str]] = None,
     ) -> pd.DataFrame:
         """
         Pull PJM node LMPs, preferring custom client over gridstatus.
@@ -106,12 +114,14 @@ class PJMAdapter(GridstatusAdapter):
 
         if cache_path.exists() and not force:
             logger.info(f"Loading cached node LMPs from {cache_path}")
-            return pd.read_parquet(cache_path)
+            return self._read_cache(cache_path, columns)
 
         if self._has_api_key():
-            return self._pull_node_lmps_custom(zone, year, month, cache_path)
+            return self._select_columns(
+                self._pull_node_lmps_custom(zone, year, month, cache_path), columns,
+            )
 
-        return super().pull_node_lmps(zone, year, month, force=True)
+        return super().pull_node_lmps(zone, year, month, force=True, columns=columns)
 
     def _pull_node_lmps_custom(
         self, zone: str, year: int, month: int, cache_path: Path
@@ -136,8 +146,7 @@ class PJMAdapter(GridstatusAdapter):
                 if col in df.columns:
                     df[col] = pd.to_numeric(df[col], errors="coerce")
 
-        cache_path.parent.mkdir(parents=True, exist_ok=True)
-        df.to_parquet(cache_path, index=False)
+        self._write_cache(df, cache_path)
         logger.info(f"Cached {len(df)} rows to {cache_path}")
 
         return df
@@ -251,7 +251,8 @@ def cmd_ingest_lmp(args):
         logger.error(f"{rto} is currently disabled: historical DA LMP downloads are unavailable.")
         sys.exit(1)
 
-    adapter = GridStatusLMPAdapter(rto=rto)
+    cache_dir = Path(__file__).resolve().parent.parent / "data" / "congestion_lmp" / ".chunk_cache"
+    adapter = GridStatusLMPAdapter(rto=rto, cache_dir=cache_dir)
     db = SessionLocal()
 
     start_date = date(year, 1, 1)
@@ -291,7 +292,7 @@ def cmd_ingest_lmp(args):
         # Fetch interface node LMPs
         for node_id in sorted(node_ids):
             logger.info(f"=== {rto}/{node_id} ===")
-            df = adapter.fetch_node_lmp(node_id, start_date, end_date)
+            df = adapter.fetch_node_lmp(node_id, start_date, end_date, force=args.force)
 
             if df.empty:
                 logger.warning(f"No LMP data for {node_id}")
@@ -303,7 +304,9 @@ def cmd_ingest_lmp(args):
         # Fetch hub baselines
         for hub in hub_names:
             logger.info(f"=== {rto} {hub} baseline ===")
-            df = adapter.fetch_hub_baseline(start_date, end_date, hub=hub)
+            df = adapter.fetch_hub_baseline(
+                start_date, end_date, hub=hub, force=args.force,
+            )
 
             if df.empty:
                 logger.warning(f"No baseline LMP data for {rto}/{hub}")
@@ -598,6 +601,10 @@ def main():
         "--node",
         help="Specific node ID (default: all verified nodes for the RTO)",
     )
+    sub_lmp.add_argument(
+        "--force", action="store_true",
+        help="Re-fetch chunks already in the on-disk chunk cache",
+    )
 
     # estimate-limits
     sub_limits = subparsers.add_parser(
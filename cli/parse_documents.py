@@ -22,7 +22,7 @@ from pathlib import Path
 
 sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
 
-from adapters.document_parser.pipeline import parse_document
+from adapters.document_parser.pipeline import DOCUMENT_PARALLELISM, parse_documents
 from adapters.document_parser.base import DocumentParseResult
 
 logging.basicConfig(
@@ -55,6 +55,10 @@ def main():
         help="Queue low-confidence extractions for human review instead of skipping",
     )
     parser.add_argument("--output-json", type=Path, help="Save results to JSON file")
+    parser.add_argument(
+        "--workers", type=int, default=DOCUMENT_PARALLELISM,
+        help=f"Documents parsed concurrently (default {DOCUMENT_PARALLELISM})",
+    )
 
     args = parser.parse_args()
 
@@ -72,25 +76,24 @@ def main():
         logger.error("No files to process")
         return
 
-    results = []
-    for file_path in files:
-        logger.info(f"\n{'='*60}")
-        logger.info(f"Processing: {file_path.name}")
-
-        if args.triage_only:
-            result = _triage_only(file_path, args.filing_type)
-        else:
-            result = parse_document(
-                file_path=file_path,
-                utility_name=args.utility,
-                filing_type=args.filing_type,
-                run_llm=args.llm,
-                llm_extraction_types=args.extract,
-                max_pages=args.max_pages,
-            )
+    if args.triage_only:
+        results = [_triage_only(f, args.filing_type) for f in files]
+    else:
+        logger.info(f"Processing {len(files)} documents ({args.workers} at a time)")
+        results = parse_documents(
+            files,
+            concurrency=args.workers,
+            utility_name=args.utility,
+            filing_type=args.filing_type,
+            run_llm=args.llm,
+            llm_extraction_types=args.extract,
+            max_pages=args.max_pages,
+        )
 
+    for file_path, result in zip(files, results):
+        logger.info(f"\n{'='*60}")
+        logger.info(f"Result: {file_path.name}")
         _print_result(result)
-        results.append(result)
 
     # Summary
     if len(results) > 1:
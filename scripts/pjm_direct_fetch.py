@@ -24,6 +24,8 @@ sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
 from dotenv import load_dotenv
 load_dotenv(Path(__file__).resolve().parent.parent / ".env")
 
+from adapters.congestion_lmp.gridstatus_lmp import first_row_per_timestamp
+
 logging.basicConfig(
     level=logging.INFO,
     format="%(asctime)s %(levelname)-7s %(message)s",
@@ -140,10 +142,11 @@ def normalize_pjm(df: pd.DataFrame, node_id: str) -> pd.DataFrame:
     out["congestion_component"] = df["congestion_price_da"].astype(float)
     out["loss_component"] = df["marginal_loss_price_da"].astype(float)
 
-    # Drop NaT timestamps and deduplicate
+    # Drop NaT timestamps, then deduplicate and sort in one pass (node_id
+    # is constant, so timestamps alone are the key)
     out = out.dropna(subset=["timestamp_utc"])
-    out = out.drop_duplicates(subset=["timestamp_utc", "node_id"], keep="first")
-    out = out.sort_values("timestamp_utc").reset_index(drop=True)
+    keep = first_row_per_timestamp(out["timestamp_utc"].to_numpy().view("i8"))
+    out = out.iloc[keep].reset_index(drop=True)
 
     return out
 
@@ -10,22 +10,27 @@ Pivots LMP_TYPE (LMP, MCC, MCL, MCE) into separate columns.
 
 import io
 import logging
+import threading
 import time
 import zipfile
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
 from typing import Optional
 
 import pandas as pd
 import requests
+from requests.adapters import HTTPAdapter
 
 logger = logging.getLogger(__name__)
 
 BASE_URL = "https://oasis.caiso.com/oasisapi/SingleZip"
 MAX_DAYS_PER_REQUEST = 14  # Keep chunks small enough for OASIS volume limit
-REQUEST_DELAY_S = 5  # Polite delay between requests
+REQUEST_DELAY_S = 5  # Polite minimum spacing between request starts
 MAX_RETRIES = 3
 RETRY_BACKOFF_S = 10  # Base backoff for 429/empty responses
 MAX_NODES_PER_REQUEST = 10  # OASIS can reject too many nodes
+HTTP_POOL_SIZE = 16  # Keep-alive connections shared by concurrent callers
+QUERY_PARALLELISM = 4  # Requests in flight per query_lmps call
 
 # All 23 CAISO Sub-LAPs
 ALL_SUB_LAPS = [
@@ -46,12 +51,40 @@ ALL_SUB_LAPS = [
 
 
 class CAISOClient:
-    """Rate-limited client for CAISO OASIS API (Sub-LAP LMPs)."""
+    """Rate-limited client for CAISO OASIS API (Sub-LAP LMPs).
+
+    Safe to share across threads: one pooled keep-alive session serves all
+    callers, and request starts are spaced REQUEST_DELAY_S apart globally
+    so concurrent callers overlap response latency without exceeding the
+    polite request rate.
+    """
 
     def __init__(self):
         self.session = requests.Session()
         self.session.headers.update({"User-Agent": "grid-constraint-classifier/1.0"})
+        pool = HTTPAdapter(pool_connections=HTTP_POOL_SIZE, pool_maxsize=HTTP_POOL_SIZE)
+        self.session.mount("https://", pool)
+        self.session.mount("http://", pool)
         self._request_count = 0
+        self._throttle_lock = threading.Lock()
+        self._next_request_at = 0.0
+
+    def _throttle(self) -> int:
+        """Block until this caller may start a request; returns its request number."""
+        with self._throttle_lock:
+            self._request_count += 1
+            request_num = self._request_count
+            now = time.monotonic()
+            wait = self._next_request_at - now
+            self._next_request_at = max(now, self._next_request_at) + REQUEST_DELAY_S
+        if wait > 0:
+            time.sleep(wait)
+        return request_num
+
+    def _defer_requests(self, delay: float) -> None:
+        """Hold back every caller's next request start by at least delay seconds."""
+        with self._throttle_lock:
+            self._next_request_at = max(self._next_request_at, time.monotonic() + delay)
 
     def _fetch_zip_csv(self, params: dict) -> pd.DataFrame:
         """
@@ -60,16 +93,18 @@ class CAISOClient:
         OASIS returns a ZIP file containing one CSV. The CSV has columns like:
         NODE, LMP_TYPE, OPR_DT, OPR_HR, INTERVAL_NUM, MW, VALUE, ...
 
-        Retries on 429 (rate limit) and empty ZIP responses.
+        Retries on 429 (rate limit) and empty ZIP responses. Every attempt
+        takes its own throttle slot, so retries stay within the shared
+        request-start rate; a 429 also pushes back all callers' next start.
         """
-        self._request_count += 1
-        logger.info(
-            f"OASIS request #{self._request_count}: "
-            f"{params.get('startdatetime', '?')} to {params.get('enddatetime', '?')} "
-            f"({params.get('node', 'all nodes')[:60]}...)"
-        )
-
         for attempt in range(MAX_RETRIES):
+            request_num = self._throttle()
+            logger.info(
+                f"OASIS request #{request_num}"
+                f"{f' (retry {attempt})' if attempt else ''}: "
+                f"{params.get('startdatetime', '?')} to {params.get('enddatetime', '?')} "
+                f"({params.get('node', 'all nodes')[:60]}...)"
+            )
             try:
                 resp = self.session.get(BASE_URL, params=params, timeout=120)
             except requests.RequestException as e:
@@ -84,7 +119,8 @@ class CAISOClient:
             if resp.status_code == 429:
                 wait = RETRY_BACKOFF_S * (attempt + 1)
                 logger.warning(f"Rate limited (429), waiting {wait}s before retry...")
-                time.sleep(wait)
+                # The next _throttle() waits this out, along with every other caller
+                self._defer_requests(wait)
                 continue
 
             resp.raise_for_status()
@@ -151,6 +187,7 @@ class CAISOClient:
         start_date: str,
         end_date: str,
         nodes: Optional[list[str]] = None,
+        max_workers: int = QUERY_PARALLELISM,
     ) -> pd.DataFrame:
         """
         Query day-ahead LMPs for CAISO Sub-LAPs.
@@ -160,6 +197,7 @@ class CAISOClient:
             end_date: "YYYY-MM-DD"
             nodes: List of OASIS node names (e.g. ["SLAP_PGCC-APND"]).
                    Defaults to all 23 Sub-LAPs.
+            max_workers: Requests kept in flight at once (1 = serial).
 
         Returns:
             DataFrame with columns: NODE, datetime_beginning_ept,
@@ -169,14 +207,13 @@ class CAISOClient:
         if nodes is None:
             nodes = ALL_SUB_LAPS
 
-        frames = []
-
+        queries = []
         for batch in self._node_batches(nodes, MAX_NODES_PER_REQUEST):
             node_str = ",".join(batch)
             logger.info(f"Pulling batch of {len(batch)} nodes: {batch[0]}...{batch[-1]}")
 
             for chunk_start, chunk_end in self._date_chunks(start_date, end_date):
-                params = {
+                queries.append({
                     "queryname": "PRC_LMP",
                     "market_run_id": "DAM",
                     "version": "12",
@@ -184,13 +221,18 @@ class CAISOClient:
                     "startdatetime": chunk_start,
                     "enddatetime": chunk_end,
                     "node": node_str,
-                }
+                })
 
-                df = self._fetch_zip_csv(params)
-                if len(df) > 0:
-                    frames.append(df)
+        # Node-batch x date-chunk requests run concurrently; _throttle still
+        # spaces request starts globally, so this only overlaps response latency
+        workers = min(max_workers, len(queries))
+        if workers <= 1:
+            results = [self._fetch_zip_csv(params) for params in queries]
+        else:
+            with ThreadPoolExecutor(max_workers=workers) as pool:
+                results = list(pool.map(self._fetch_zip_csv, queries))
 
-                time.sleep(REQUEST_DELAY_S)
+        frames = [df for df in results if len(df) > 0]
 
         if not frames:
             logger.warning("No CAISO LMP data returned across all chunks")
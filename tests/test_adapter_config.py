@@ -106,3 +106,117 @@ class TestUtilityHCConfigFromYaml:
         assert duke_config.data_source_type in (
             "arcgis_feature", "arcgis_map", "exelon", "custom", "unavailable",
         )
+
+
+class TestISOConfigYamlCache:
+    """ISOConfig.from_yaml parses each file version once."""
+
+    def _write(self, path, name):
+        path.write_text(f"iso_id: test\niso_name: {name}\nvalidation_zones:\n  A: transmission\n")
+
+    def test_mutation_does_not_leak_between_loads(self, tmp_path):
+        p = tmp_path / "test.yaml"
+        self._write(p, "Test ISO")
+        first = ISOConfig.from_yaml(p)
+        first.validation_zones["B"] = "generation"
+        second = ISOConfig.from_yaml(p)
+        assert "B" not in second.validation_zones
+
+    def test_modified_file_is_reparsed(self, tmp_path):
+        import os
+
+        p = tmp_path / "test.yaml"
+        self._write(p, "Before")
+        assert ISOConfig.from_yaml(p).iso_name == "Before"
+        self._write(p, "After")
+        st = p.stat()
+        os.utime(p, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000))
+        assert ISOConfig.from_yaml(p).iso_name == "After"
+
+
+class TestConcatFrames:
+    def test_matches_pd_concat(self):
+        import pandas as pd
+        from adapters.base import concat_frames
+
+        a = pd.DataFrame({"pnode_id": pd.array([1, 2], dtype="int32"), "lmp": [1.0, 2.0]})
+        b = pd.DataFrame({"pnode_id": [3], "lmp": [3.0]})
+        out = concat_frames([a, b])
+        assert out["pnode_id"].tolist() == [1, 2, 3]
+        assert out["lmp"].tolist() == [1.0, 2.0, 3.0]
+        assert list(out.index) == [0, 1, 2]
+
+    def test_falls_back_on_mixed_object_columns(self):
+        import pandas as pd
+        from adapters.base import concat_frames
+
+        a = pd.DataFrame({"x": [1, "a"]})
+        out = concat_frames([a, a])
+        assert len(out) == 4
+
+
+class TestWriteCacheDirs:
+    def test_write_cache_recreates_removed_directory(self, tmp_path):
+        import shutil
+
+        import pandas as pd
+
+        from adapters.base import ISOAdapter
+
+        df = pd.DataFrame({"a": [1, 2]})
+        path = tmp_path / "zone_lmps" / "zone_lmps_2024.parquet"
+        ISOAdapter._write_cache(df, path)
+        shutil.rmtree(path.parent)
+        ISOAdapter._write_cache(df, path)
+        assert pd.read_parquet(path)["a"].tolist() == [1, 2]
+
+
+class TestConstrainedZonePnodes:
+    def _adapter(self, tmp_path, fail_zone=None):
+        import threading
+        import time
+
+        import pandas as pd
+
+        from adapters.base import ISOAdapter
+
+        class _FakeAdapter(ISOAdapter):
+            def __init__(self, config, data_dir):
+                super().__init__(config, data_dir)
+                self.active = 0
+                self.peak = 0
+                self._lock = threading.Lock()
+
+            def pull_zone_lmps(self, year, force=False, columns=None):
+                return pd.DataFrame()
+
+            def pull_node_lmps(self, zone, year, month, force=False, columns=None):
+                if zone == fail_zone:
+                    raise RuntimeError("vendor down")
+                with self._lock:
+                    self.active += 1
+                    self.peak = max(self.peak, self.active)
+                time.sleep(0.002)
+                with self._lock:
+                    self.active -= 1
+                if zone == "EMPTY":
+                    return pd.DataFrame()
+                return pd.DataFrame({"zone": [zone], "month": [month]})
+
+        config = ISOConfig.from_yaml(PROJECT_ROOT / "adapters" / "configs" / "pjm.yaml")
+        return _FakeAdapter(config, tmp_path)
+
+    def test_zones_fetched_concurrently_in_input_order(self, tmp_path):
+        adapter = self._adapter(tmp_path, fail_zone="BAD")
+        summary = {"zone_scores": [
+            {"zone": z, "transmission_score": 0.9}
+            for z in ["Z1", "BAD", "Z2", "EMPTY", "Z3"]
+        ] + [{"zone": "CALM", "transmission_score": 0.1}]}
+        out = adapter.pull_constrained_zone_pnodes(summary, year=2024)
+        assert list(out) == ["Z1", "Z2", "Z3"]
+        assert len(out["Z1"]) == 12
+        assert adapter.peak > 1
+
+    def test_no_constrained_zones(self, tmp_path):
+        adapter = self._adapter(tmp_path)
+        assert adapter.pull_constrained_zone_pnodes({"zone_scores": []}) == {}
@@ -0,0 +1,395 @@
+"""Tests for adapters.arcgis_client (pagination and geometry helpers)."""
+
+import re
+import sys
+from pathlib import Path
+from urllib.parse import parse_qsl
+
+import numpy as np
+import pytest
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from adapters.arcgis_client import ArcGISClient, ArcGISQueryError, _encode_query
+
+
+class _FakeLayerClient(ArcGISClient):
+    """ArcGISClient with the HTTP layer replaced by an in-memory layer."""
+
+    def __init__(self, n_records: int, supports_statistics: bool = False, **kwargs):
+        kwargs.setdefault("rate_limit_sec", 0)
+        super().__init__(**kwargs)
+        self.records = [
+            {"attributes": {"OBJECTID": i + 1}, "geometry": {"x": i, "y": i}}
+            for i in range(n_records)
+        ]
+        self.supports_statistics = supports_statistics
+        self.calls: list[dict] = []
+
+    def _request_with_retry(self, url, params, **kwargs):
+        if isinstance(params, str):
+            params = dict(parse_qsl(params))
+        self.calls.append(dict(params))
+        if not url.endswith("/query"):
+            return {
+                "objectIdField": "OBJECTID",
+                "advancedQueryCapabilities": {
+                    "supportsPagination": True,
+                    "supportsStatistics": self.supports_statistics,
+                },
+            }
+        if "outStatistics" in params:
+            oids = [r["attributes"]["OBJECTID"] for r in self.records]
+            return {"features": [{"attributes": {"MIN_OID": min(oids), "MAX_OID": max(oids)}}]}
+        if params.get("returnCountOnly") == "true":
+            return {"count": len(self.records)}
+        if "OBJECTID >=" in params["where"]:
+            lo, hi = re.findall(r"\d+", params["where"].split("OBJECTID >=")[1])[:2]
+            return {"features": [
+                r for r in self.records
+                if int(lo) <= r["attributes"]["OBJECTID"] <= int(hi)
+            ]}
+        offset = int(params.get("resultOffset", 0))
+        size = int(params["resultRecordCount"])
+        page = self.records[offset:offset + size]
+        return {
+            "features": page,
+            "exceededTransferLimit": offset + size < len(self.records),
+        }
+
+
+class TestQueryFeaturesPagination:
+    def test_concurrent_pages_preserve_order(self):
+        client = _FakeLayerClient(n_records=95, concurrency=4)
+        features = client.query_features("http://x/query", page_size=10)
+        ids = [f["attributes"]["OBJECTID"] for f in features]
+        assert ids == list(range(1, 96))
+
+    def test_serial_pages_when_concurrency_is_one(self):
+        client = _FakeLayerClient(n_records=25, concurrency=1)
+        features = client.query_features("http://x/query", page_size=10)
+        assert len(features) == 25
+        assert not any(c.get("returnCountOnly") for c in client.calls)
+
+    def test_max_records_caps_result(self):
+        client = _FakeLayerClient(n_records=95, concurrency=4)
+        features = client.query_features(
+            "http://x/query", page_size=10, max_records=33,
+        )
+        assert len(features) == 33
+
+    def test_small_capped_query_skips_count(self):
+        client = _FakeLayerClient(n_records=95, concurrency=4)
+        features = client.query_features(
+            "http://x/query", page_size=5, max_records=5,
+        )
+        assert len(features) == 5
+        assert not any(c.get("returnCountOnly") for c in client.calls)
+
+    def test_oid_range_paging_when_statistics_supported(self):
+        client = _FakeLayerClient(n_records=95, supports_statistics=True)
+        features = client.query_features("http://x/query", page_size=10)
+        ids = [f["attributes"]["OBJECTID"] for f in features]
+        assert ids == list(range(1, 96))
+        page_wheres = [c["where"] for c in client.calls if "OBJECTID >=" in c.get("where", "")]
+        assert len(page_wheres) == 10
+        assert page_wheres[0] == "OBJECTID >= 1 AND OBJECTID <= 10"
+        assert not any("resultOffset" in c for c in client.calls)
+
+    def test_oid_range_combines_user_where(self):
+        client = _FakeLayerClient(n_records=5, supports_statistics=True)
+        client.query_features("http://x/query", where="STATE='CA'", page_size=10)
+        page_wheres = [c["where"] for c in client.calls if "OBJECTID >=" in c.get("where", "")]
+        assert page_wheres == ["(STATE='CA') AND OBJECTID >= 1 AND OBJECTID <= 5"]
+
+    def test_failed_oid_page_raises(self):
+        client = _FakeLayerClient(n_records=95, supports_statistics=True)
+        orig = client._request_with_retry
+
+        def flaky(url, params, **kwargs):
+            if isinstance(params, dict) and "OBJECTID >= 41 " in params.get("where", ""):
+                return None
+            return orig(url, params, **kwargs)
+
+        client._request_with_retry = flaky
+        with pytest.raises(ArcGISQueryError, match="Page 5/10"):
+            client.query_features("http://x/query", page_size=10)
+
+    def test_failed_concurrent_offset_page_raises(self):
+        client = _FakeLayerClient(n_records=95, concurrency=4)
+        orig = client._request_with_retry
+
+        def flaky(url, params, **kwargs):
+            if isinstance(params, str) and "resultOffset=30" in params:
+                return None
+            return orig(url, params, **kwargs)
+
+        client._request_with_retry = flaky
+        with pytest.raises(ArcGISQueryError):
+            client.query_features("http://x/query", page_size=10, pagination_strategy="offset")
+
+    def test_offset_strategy_skips_probe(self):
+        client = _FakeLayerClient(n_records=25, supports_statistics=True)
+        features = client.query_features(
+            "http://x/query", page_size=10, pagination_strategy="offset",
+        )
+        assert len(features) == 25
+        assert not any("outStatistics" in c for c in client.calls)
+
+
+class TestComputeCentroid:
+    def test_esri_point(self):
+        assert ArcGISClient.compute_centroid({"x": -120.0, "y": 37.0}) == (37.0, -120.0)
+
+    def test_esri_polygon(self):
+        geom = {"rings": [[[0, 0], [2, 0], [2, 2], [0, 2]]]}
+        assert ArcGISClient.compute_centroid(geom) == pytest.approx((1.0, 1.0))
+
+    def test_geojson_multipolygon(self):
+        geom = {
+            "type": "MultiPolygon",
+            "coordinates": [[[[0, 0], [2, 0]]], [[[4, 4], [6, 4]]]],
+        }
+        assert ArcGISClient.compute_centroid(geom) == pytest.approx((2.0, 3.0))
+
+    def test_mixed_dimension_rings(self):
+        geom = {"rings": [[[0, 0, 5], [2, 0]], [[2, 2], [0, 2, 1]]]}
+        assert ArcGISClient.compute_centroid(geom) == pytest.approx((1.0, 1.0))
+
+    def test_empty(self):
+        assert ArcGISClient.compute_centroid({}) == (None, None)
+        assert ArcGISClient.compute_centroid({"rings": []}) == (None, None)
+
+
+class TestResponseCache:
+    @pytest.fixture()
+    def client(self, tmp_path):
+        client = ArcGISClient(cache_dir=tmp_path, feature_ttl_sec=60)
+        client.http_calls = 0
+
+        def fake_get(url, params):
+            client.http_calls += 1
+            return {"fields": [{"name": "OBJECTID"}], "n": client.http_calls}
+
+        client._get_with_retry = fake_get
+        return client
+
+    def test_schema_served_from_cache(self, client):
+        first = client.get_field_schema("http://x/FeatureServer/0")
+        second = client.get_field_schema("http://x/FeatureServer/0")
+        assert first == second
+        assert client.http_calls == 1
+
+    def test_force_bypasses_cache(self, client):
+        client.get_field_schema("http://x/FeatureServer/0")
+        client.get_field_schema("http://x/FeatureServer/0", force=True)
+        assert client.http_calls == 2
+
+    def test_key_ignores_param_order_and_token(self, client):
+        a = client._cache_path("http://x/query", {"where": "1=1", "f": "json", "token": "a"})
+        b = client._cache_path("http://x/query", {"f": "json", "where": "1=1", "token": "b"})
+        assert a == b
+
+    def test_encoded_query_key_ignores_token(self, client):
+        params = {"where": "STATE='CA'", "f": "json", "resultRecordCount": 2000}
+        a = client._cache_path(
+            "http://x/query", _encode_query({**params, "token": "a"}) + "&resultOffset=0",
+        )
+        b = client._cache_path(
+            "http://x/query", _encode_query({**params, "token": "b"}) + "&resultOffset=0",
+        )
+        assert a == b
+        assert a == client._cache_path("http://x/query", {**params, "resultOffset": 0})
+
+    def test_expired_entry_refetched(self, client):
+        client.schema_ttl_sec = 1e-9
+        client.get_field_schema("http://x/FeatureServer/0")
+        client.get_field_schema("http://x/FeatureServer/0")
+        assert client.http_calls == 2
+
+    def test_no_cache_dir_never_caches(self):
+        client = ArcGISClient()
+        calls = []
+        client._get_with_retry = lambda url, params: calls.append(url) or {"fields": []}
+        client.get_field_schema("http://x/FeatureServer/0")
+        client.get_field_schema("http://x/FeatureServer/0")
+        assert len(calls) == 2
+
+
+class TestComputeCentroidsBatch:
+    def test_matches_scalar_path(self):
+        geoms = [
+            {"x": -120.0, "y": 37.0},
+            {"rings": [[[0, 0], [2, 0], [2, 2], [0, 2]]]},
+            {"paths": [[[1, 1], [3, 5]], [[5, 3]]]},
+            {"type": "Point", "coordinates": [-80.0, 40.0]},
+            {"type": "LineString", "coordinates": [[0, 0, 9], [4, 2, 9]]},
+        ]
+        batch = ArcGISClient.compute_centroids_batch(geoms)
+        for geom, row in zip(geoms, batch):
+            assert tuple(row) == pytest.approx(ArcGISClient.compute_centroid(geom))
+
+    def test_empty_geometries_are_nan(self):
+        batch = ArcGISClient.compute_centroids_batch([None, {}, {"rings": []}])
+        assert batch.shape == (3, 2)
+        assert np.isnan(batch).all()
+
+
+class _FakeResponse:
+    def __init__(self, status_code, body=b"{}", headers=None):
+        self.status_code = status_code
+        self.content = body
+        self.headers = headers or {}
+
+    def raise_for_status(self):
+        if self.status_code >= 400:
+            import requests
+            raise requests.exceptions.HTTPError(f"HTTP {self.status_code}")
+
+
+class TestRetryBackoff:
+    def _client(self, responses, **kwargs):
+        client = ArcGISClient(max_retries=3, **kwargs)
+        queue = list(responses)
+        client.sleeps = []
+        client.session.get = lambda url, params=None, timeout=None: queue.pop(0)
+        return client
+
+    def test_client_error_not_retried(self, monkeypatch):
+        client = self._client([_FakeResponse(404)])
+        monkeypatch.setattr("adapters.arcgis_client.time.sleep", client.sleeps.append)
+        assert client._get_with_retry("http://x", {}) is None
+        assert client.sleeps == []
+
+    def test_retry_after_honored_on_429(self, monkeypatch):
+        client = self._client([
+            _FakeResponse(429, headers={"Retry-After": "7"}),
+            _FakeResponse(200, b'{"ok": true}'),
+        ])
+        monkeypatch.setattr("adapters.arcgis_client.time.sleep", client.sleeps.append)
+        assert client._get_with_retry("http://x", {}) == {"ok": True}
+        assert client.sleeps == [7.0]
+
+    def test_server_error_retried_with_jittered_backoff(self, monkeypatch):
+        client = self._client(
+            [_FakeResponse(500), _FakeResponse(502), _FakeResponse(200, b"{}")],
+            base_delay=2.0, jitter=0.5,
+        )
+        monkeypatch.setattr("adapters.arcgis_client.time.sleep", client.sleeps.append)
+        assert client._get_with_retry("http://x", {}) == {}
+        assert 1.0 <= client.sleeps[0] <= 3.0
+        assert 2.0 <= client.sleeps[1] <= 6.0
+
+    def test_backoff_capped(self):
+        client = ArcGISClient(base_delay=1.0, max_delay=5.0, jitter=0.0)
+        assert client._backoff_delay(10) == 5.0
+        assert client._backoff_delay(0, retry_after=120) == 5.0
+
+    def test_parse_retry_after(self):
+        from adapters.arcgis_client import _parse_retry_after
+
+        assert _parse_retry_after("3") == 3.0
+        assert _parse_retry_after(None) is None
+        assert _parse_retry_after("garbage") is None
+        assert _parse_retry_after("Wed, 21 Oct 2015 07:28:00 GMT") == 0.0
+
+
+class TestQueryFeaturesStreaming:
+    def test_yields_all_features_with_projection(self):
+        client = _FakeLayerClient(n_records=25)
+        for r in client.records:
+            r["attributes"]["NAME"] = "x"
+        feats = list(client.query_features_streaming(
+            "http://x/query", fields_to_keep={"OBJECTID"}, page_size=10,
+        ))
+        assert [f["attributes"] for f in feats] == [
+            {"OBJECTID": i} for i in range(1, 26)
+        ]
+
+    def test_short_server_pages_still_read_completely(self):
+        client = _FakeLayerClient(n_records=25)
+        # Server caps pages at 7 records regardless of resultRecordCount
+        orig = client._request_with_retry
+
+        def capped(url, params, **kwargs):
+            return orig(url, {**dict(parse_qsl(params)), "resultRecordCount": 7}, **kwargs)
+
+        client._request_with_retry = capped
+        feats = list(client.query_features_streaming("http://x/query", page_size=10))
+        assert len(feats) == 25
+
+    def test_short_page_ends_without_extra_request(self):
+        client = _FakeLayerClient(n_records=25)
+        assert len(list(client.query_features_streaming("http://x/query", page_size=10))) == 25
+        assert len(client.calls) == 3
+
+    def test_offset_ignored_stops_on_repeated_page(self):
+        client = _FakeLayerClient(n_records=3)
+        client._request_with_retry = lambda url, params, **kw: {
+            "features": [dict(r) for r in client.records], "exceededTransferLimit": True,
+        }
+        feats = list(client.query_features_streaming("http://x/query", page_size=10))
+        assert len(feats) == 3
+
+    def test_failed_page_raises(self):
+        client = _FakeLayerClient(n_records=25)
+        orig = client._request_with_retry
+
+        def flaky(url, params, **kwargs):
+            if "resultOffset=10" in params:
+                return None
+            return orig(url, params, **kwargs)
+
+        client._request_with_retry = flaky
+        with pytest.raises(ArcGISQueryError, match="offset 10"):
+            list(client.query_features_streaming("http://x/query", page_size=10))
+
+    def test_geojson_stream(self):
+        client = _FakeLayerClient(n_records=3)
+        fc = client.query_features_geojson("http://x/query", stream=True, max_records=2)
+        assert len(fc["features"]) == 2
+        assert fc["features"][0]["geometry"] == {"type": "Point", "coordinates": [0, 0]}
+
+    def test_geojson_uses_paged_query(self):
+        client = _FakeLayerClient(n_records=25, supports_statistics=True)
+        for r in client.records:
+            r["attributes"]["NAME"] = "x"
+        fc = client.query_features_geojson(
+            "http://x/query", fields_to_keep={"OBJECTID"}, page_size=10,
+        )
+        assert [f["properties"] for f in fc["features"]] == [
+            {"OBJECTID": i} for i in range(1, 26)
+        ]
+        assert any("OBJECTID >=" in c.get("where", "") for c in client.calls)
+
+    def test_geojson_accepts_pagination_strategy(self):
+        client = _FakeLayerClient(n_records=25, supports_statistics=True)
+        fc = client.query_features_geojson(
+            "http://x/query", page_size=10, pagination_strategy="offset",
+        )
+        assert len(fc["features"]) == 25
+        assert not any("outStatistics" in c for c in client.calls)
+
+
+class TestCentroidKernel:
+    def test_numpy_fallback_matches_segment_means(self):
+        from adapters._geom_numba import _centroids_from_flat_numpy, centroids_from_flat
+
+        flat = np.array([[0, 0], [2, 2], [4, 4], [10, 0]], dtype=np.float64)
+        offsets = np.array([0, 3, 4])
+        expected = np.array([[2.0, 2.0], [10.0, 0.0]])
+        np.testing.assert_allclose(_centroids_from_flat_numpy(flat, offsets), expected)
+        np.testing.assert_allclose(centroids_from_flat(flat, offsets), expected)
+
+
+class TestConnectionPool:
+    def test_pool_sized_for_concurrency(self):
+        client = ArcGISClient(concurrency=12)
+        adapter = client.session.get_adapter("https://example.com")
+        assert adapter._pool_maxsize >= 24
+
+    def test_context_manager_closes_session(self):
+        with ArcGISClient() as client:
+            closed = []
+            client.session.close = lambda: closed.append(True)
+        assert closed == [True]
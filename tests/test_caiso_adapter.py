@@ -0,0 +1,286 @@
+"""Tests for adapters.caiso_adapter PNode batch pulls (OASIS client faked)."""
+
+import json
+import os
+import sys
+from pathlib import Path
+
+import pandas as pd
+import pytest
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from adapters.base import ISOConfig
+from adapters.caiso_adapter import CAISOAdapter
+
+PROJECT_ROOT = Path(__file__).resolve().parent.parent
+
+
+class _FakeOASISClient:
+    """Returns one row per node per day; optionally fails named nodes."""
+
+    def __init__(self, fail_nodes=(), exc=RuntimeError):
+        self.fail_nodes = set(fail_nodes)
+        self.exc = exc
+        self.calls: list[list[str]] = []
+        self.ranges: list[tuple[str, str, list[str]]] = []
+        self.empty_nodes: set[str] = set()
+
+    def query_lmps(self, start_date, end_date, nodes):
+        self.calls.append(list(nodes))
+        self.ranges.append((start_date, end_date, list(nodes)))
+        if self.fail_nodes & set(nodes):
+            raise self.exc("OASIS unavailable")
+        ts = pd.date_range(start_date, end_date, freq="D")
+        rows = [
+            {
+                "pnode_name": n,
+                "datetime_beginning_ept": t,
+                "total_lmp_da": 30.0,
+                "congestion_price_da": 1.5,
+                "marginal_loss_price_da": 0.5,
+                "system_energy_price_da": 28.0,
+                "hour": t.hour,
+                "month": t.month,
+            }
+            for n in nodes
+            if n not in self.empty_nodes
+            for t in ts
+        ]
+        return pd.DataFrame(rows)
+
+
+@pytest.fixture()
+def adapter(tmp_path):
+    config = ISOConfig.from_yaml(PROJECT_ROOT / "adapters" / "configs" / "caiso.yaml")
+    adapter = CAISOAdapter(config, tmp_path)
+    registry = {"np15": [f"NODE_{i:03d}" for i in range(25)], "total": 25}
+    (adapter.data_dir / "pge_pnode_registry.json").write_text(json.dumps(registry))
+    return adapter
+
+
+class TestPullNodeLmps:
+    def test_combines_all_batches(self, adapter):
+        adapter._caiso_client = _FakeOASISClient()
+        df = adapter.pull_node_lmps("PGE_ALL", 2025, 2)
+        assert df["pnode_name"].nunique() == 25
+        assert len(df) == 25 * 28
+        assert "pnode_id" in df.columns
+        assert (adapter.data_dir / "node_lmps" / "node_lmps_PGE_ALL_2025_02.parquet").exists()
+        assert not (adapter.data_dir / "node_lmps" / "_batches_PGE_ALL_2025_02").exists()
+
+    def test_pnode_id_is_stable_per_name(self, adapter):
+        adapter._caiso_client = _FakeOASISClient()
+        df = adapter.pull_node_lmps("PGE_ALL", 2025, 2)
+        ids = df.groupby("pnode_name")["pnode_id"].nunique()
+        assert (ids == 1).all()
+        assert df["pnode_id"].nunique() == 25
+        assert df["pnode_id"].between(0, 10**8 - 1).all()
+        expected = pd.util.hash_array(pd.Series(["NODE_000"]).to_numpy()) % 100_000_000
+        assert df.loc[df["pnode_name"] == "NODE_000", "pnode_id"].iloc[0] == expected[0]
+
+    def test_failed_batch_is_skipped(self, adapter):
+        # NODE_012 lands in batch 1 (nodes 10-19)
+        adapter._caiso_client = _FakeOASISClient(fail_nodes={"NODE_012"})
+        df = adapter.pull_node_lmps("PGE_ALL", 2025, 2)
+        assert df["pnode_name"].nunique() == 15
+
+    def test_interrupted_pull_resumes_from_completed_batches(self, adapter):
+        adapter.oasis_parallelism = 1
+        adapter._caiso_client = _FakeOASISClient(
+            fail_nodes={"NODE_012"}, exc=KeyboardInterrupt,
+        )
+        with pytest.raises(KeyboardInterrupt):
+            adapter.pull_node_lmps("PGE_ALL", 2025, 2)
+
+        retry_client = _FakeOASISClient()
+        adapter._caiso_client = retry_client
+        df = adapter.pull_node_lmps("PGE_ALL", 2025, 2)
+        assert retry_client.calls == [
+            [f"NODE_{i:03d}" for i in range(10, 20)],
+            [f"NODE_{i:03d}" for i in range(20, 25)],
+        ]
+        assert df["pnode_name"].nunique() == 25
+        assert len(df) == 25 * 28
+
+    def test_cached_month_skips_client(self, adapter):
+        adapter._caiso_client = _FakeOASISClient()
+        adapter.pull_node_lmps("PGE_ALL", 2025, 2)
+        adapter._caiso_client = None
+        df = adapter.pull_node_lmps("PGE_ALL", 2025, 2)
+        assert len(df) == 25 * 28
+
+    def test_columns_projected_on_fresh_and_cached_reads(self, adapter):
+        adapter._caiso_client = _FakeOASISClient()
+        cols = ["datetime_beginning_ept", "congestion_price_da", "not_a_column"]
+        fresh = adapter.pull_node_lmps("PGE_ALL", 2025, 2, columns=cols)
+        cached = adapter.pull_node_lmps("PGE_ALL", 2025, 2, columns=cols)
+        assert list(fresh.columns) == cols[:2]
+        assert list(cached.columns) == cols[:2]
+        assert len(cached) == 25 * 28
+
+
+class TestPnodeRegistry:
+    def test_registry_parsed_once_until_file_changes(self, adapter, monkeypatch):
+        import adapters.caiso_adapter as mod
+
+        mod._pnode_registry_cached.cache_clear()
+        reads = []
+        real_loads = mod._json_loads
+        monkeypatch.setattr(mod, "_json_loads", lambda b: reads.append(1) or real_loads(b))
+
+        first = adapter._load_pnode_registry()
+        second = adapter._load_pnode_registry()
+        assert first == second == [f"NODE_{i:03d}" for i in range(25)]
+        assert len(reads) == 1
+
+        path = adapter.data_dir / "pge_pnode_registry.json"
+        path.write_text(json.dumps({"np15": ["NODE_A"], "zp26": ["NODE_B"]}))
+        st = path.stat()
+        os.utime(path, ns=(st.st_atime_ns, st.st_mtime_ns + 10**9))
+        assert adapter._load_pnode_registry() == ["NODE_A", "NODE_B"]
+        assert len(reads) == 2
+
+    def test_missing_registry_raises(self, tmp_path):
+        config = ISOConfig.from_yaml(PROJECT_ROOT / "adapters" / "configs" / "caiso.yaml")
+        with pytest.raises(FileNotFoundError):
+            CAISOAdapter(config, tmp_path)._load_pnode_registry()
+
+
+class TestSharedClient:
+    def test_adapters_share_one_oasis_client(self, tmp_path):
+        import adapters.caiso_adapter as caiso_adapter
+
+        caiso_adapter._caiso_client_cached.cache_clear()
+        config = ISOConfig.from_yaml(PROJECT_ROOT / "adapters" / "configs" / "caiso.yaml")
+        try:
+            a = CAISOAdapter(config, tmp_path / "a")._get_caiso_client()
+            b = CAISOAdapter(config, tmp_path / "b")._get_caiso_client()
+            assert a is b
+        finally:
+            caiso_adapter._caiso_client_cached.cache_clear()
+
+
+class TestCoercePrices:
+    def test_coerces_present_price_columns_only(self):
+        from adapters.caiso_adapter import _coerce_prices
+
+        df = pd.DataFrame({
+            "total_lmp_da": ["30.5", "bad"],
+            "congestion_price_da": [1, 2],
+            "pnode_name": ["A", "B"],
+        })
+        out = _coerce_prices(df)
+        assert out["total_lmp_da"].dtype == "float64"
+        assert pd.isna(out["total_lmp_da"].iloc[1])
+        assert out["pnode_name"].tolist() == ["A", "B"]
+
+
+class _NoClient:
+    def query_lmps(self, *args, **kwargs):
+        raise AssertionError("OASIS should not be called")
+
+
+class TestZoneLmpDataset:
+    def test_first_pull_writes_partitions_then_reads_from_cache(self, adapter):
+        client = _FakeOASISClient()
+        adapter._caiso_client = client
+        nodes = list(adapter.config.zones)
+        df = adapter.pull_zone_lmps(2024)
+        assert len(client.calls) == 1
+        assert df["pnode_name"].nunique() == len(nodes)
+        assert len(df) == 366 * len(nodes)
+        assert "year" not in df.columns
+        root = adapter.data_dir / "zone_lmps" / "oasis" / "year=2024"
+        assert (root / f"pnode_name={nodes[0]}" / "month=2").is_dir()
+
+        adapter._caiso_client = _NoClient()
+        cached = adapter.pull_zone_lmps(2024)
+        pd.testing.assert_frame_equal(df, cached)
+
+    def test_only_missing_partitions_are_fetched(self, adapter):
+        import shutil
+
+        adapter._caiso_client = _FakeOASISClient()
+        full = adapter.pull_zone_lmps(2024)
+        node = list(adapter.config.zones)[3]
+        root = adapter.data_dir / "zone_lmps" / "oasis" / "year=2024"
+        shutil.rmtree(root / f"pnode_name={node}" / "month=5")
+
+        client = _FakeOASISClient()
+        adapter._caiso_client = client
+        df = adapter.pull_zone_lmps(2024)
+        assert client.calls == [[node]]
+        assert len(df) == len(full)
+
+    def test_columns_projection(self, adapter):
+        adapter._caiso_client = _FakeOASISClient()
+        cols = ["pnode_name", "congestion_price_da", "not_a_column"]
+        df = adapter.pull_zone_lmps(2024, columns=cols)
+        assert list(df.columns) == cols[:2]
+
+    def test_legacy_single_file_still_served(self, adapter):
+        legacy = adapter.data_dir / "zone_lmps" / "zone_lmps_2024.parquet"
+        legacy.parent.mkdir(parents=True)
+        pd.DataFrame({"pnode_name": ["TH_NP15"], "total_lmp_da": [1.0]}).to_parquet(legacy)
+        adapter._caiso_client = _NoClient()
+        df = adapter.pull_zone_lmps(2024)
+        assert df["pnode_name"].tolist() == ["TH_NP15"]
+
+    def test_gaps_refetched_per_node_month_run(self, adapter):
+        import shutil
+
+        adapter._caiso_client = _FakeOASISClient()
+        adapter.pull_zone_lmps(2024)
+        a, b = list(adapter.config.zones)[:2]
+        root = adapter.data_dir / "zone_lmps" / "oasis" / "year=2024"
+        shutil.rmtree(root / f"pnode_name={a}" / "month=1")
+        shutil.rmtree(root / f"pnode_name={b}" / "month=12")
+
+        client = _FakeOASISClient()
+        adapter._caiso_client = client
+        adapter.pull_zone_lmps(2024)
+        assert sorted(client.ranges) == [
+            ("2024-01-01", "2024-01-31", [a]),
+            ("2024-12-01", "2024-12-31", [b]),
+        ]
+
+    def test_empty_partitions_not_requested_again(self, adapter):
+        node = list(adapter.config.zones)[0]
+        client = _FakeOASISClient()
+        client.empty_nodes = {node}
+        adapter._caiso_client = client
+        df = adapter.pull_zone_lmps(2024)
+        assert node not in set(df["pnode_name"])
+
+        adapter._caiso_client = _NoClient()
+        pd.testing.assert_frame_equal(adapter.pull_zone_lmps(2024), df)
+
+    def test_months_not_yet_started_are_skipped(self, adapter, monkeypatch):
+        import adapters.caiso_adapter as caiso_adapter
+        from datetime import date
+
+        monkeypatch.setattr(caiso_adapter, "_today", lambda: date(2024, 3, 15))
+        client = _FakeOASISClient()
+        adapter._caiso_client = client
+        adapter.pull_zone_lmps(2024)
+        assert [(s, e) for s, e, _ in client.ranges] == [("2024-01-01", "2024-03-31")]
+
+        # The current month had data, so it is cached and nothing is re-pulled
+        adapter._caiso_client = _NoClient()
+        adapter.pull_zone_lmps(2024)
+
+    def test_current_month_without_data_is_retried(self, adapter, monkeypatch):
+        import adapters.caiso_adapter as caiso_adapter
+        from datetime import date
+
+        monkeypatch.setattr(caiso_adapter, "_today", lambda: date(2024, 3, 15))
+        client = _FakeOASISClient()
+        client.empty_nodes = set(adapter.config.zones)
+        adapter._caiso_client = client
+        adapter.pull_zone_lmps(2024)
+
+        client = _FakeOASISClient()
+        adapter._caiso_client = client
+        adapter.pull_zone_lmps(2024)
+        assert [(s, e) for s, e, _ in client.ranges] == [("2024-03-01", "2024-03-31")]
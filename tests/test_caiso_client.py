@@ -0,0 +1,128 @@
+"""Tests for src.caiso_client request fan-out (HTTP faked)."""
+
+import io
+import sys
+import threading
+import time
+import zipfile
+from types import SimpleNamespace
+from pathlib import Path
+
+import pandas as pd
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+import src.caiso_client as caiso_client
+from src.caiso_client import CAISOClient
+
+
+def _oasis_rows(params: dict) -> pd.DataFrame:
+    """Raw OASIS CSV rows: one LMP_TYPE set per node for the chunk's first hour."""
+    day = params["startdatetime"][:8]
+    rows = []
+    for node in params["node"].split(","):
+        for lmp_type, value in (("LMP", 30.0), ("MCC", 2.0), ("MCL", 1.0), ("MCE", 27.0)):
+            rows.append({
+                "NODE": node, "LMP_TYPE": lmp_type, "OPR_DT": day,
+                "OPR_HR": 1, "VALUE": value,
+            })
+    return pd.DataFrame(rows)
+
+
+class _SlowClient(CAISOClient):
+    """Fakes _fetch_zip_csv with a fixed latency and tracks concurrency."""
+
+    def __init__(self, latency: float = 0.05):
+        super().__init__()
+        self.latency = latency
+        self.calls: list[dict] = []
+        self.in_flight = 0
+        self.peak = 0
+        self._lock = threading.Lock()
+
+    def _fetch_zip_csv(self, params):
+        with self._lock:
+            self.calls.append(params)
+            self.in_flight += 1
+            self.peak = max(self.peak, self.in_flight)
+        time.sleep(self.latency)
+        with self._lock:
+            self.in_flight -= 1
+        return _oasis_rows(params)
+
+
+class TestQueryLmps:
+    def test_requests_overlap(self, monkeypatch):
+        monkeypatch.setattr(caiso_client, "REQUEST_DELAY_S", 0)
+        client = _SlowClient()
+        nodes = [f"NODE_{i:02d}" for i in range(25)]
+
+        df = client.query_lmps("2024-01-01", "2024-01-31", nodes=nodes)
+
+        # 3 node batches x 3 date chunks
+        assert len(client.calls) == 9
+        assert client.peak > 1
+        assert set(df["pnode_name"]) == set(nodes)
+
+    def test_serial_matches_concurrent(self, monkeypatch):
+        monkeypatch.setattr(caiso_client, "REQUEST_DELAY_S", 0)
+        nodes = [f"NODE_{i:02d}" for i in range(12)]
+
+        serial_client = _SlowClient(latency=0)
+        serial = serial_client.query_lmps("2024-01-01", "2024-01-31", nodes=nodes, max_workers=1)
+        concurrent = _SlowClient(latency=0).query_lmps("2024-01-01", "2024-01-31", nodes=nodes)
+
+        assert serial_client.peak == 1
+        pd.testing.assert_frame_equal(serial, concurrent)
+
+    def test_request_starts_stay_spaced(self, monkeypatch):
+        monkeypatch.setattr(caiso_client, "REQUEST_DELAY_S", 0.02)
+        client = _SlowClient(latency=0)
+        starts = []
+        original = client._throttle
+
+        def throttle():
+            num = original()
+            starts.append(time.monotonic())
+            return num
+
+        client._throttle = throttle
+        client._fetch_zip_csv = lambda params: (client._throttle(), _oasis_rows(params))[1]
+
+        client.query_lmps("2024-01-01", "2024-02-15", nodes=["NODE_00"])
+
+        assert len(starts) == 4
+        assert max(starts) - min(starts) >= 0.055
+
+
+def _zip_response(status_code: int = 200) -> SimpleNamespace:
+    buf = io.BytesIO()
+    with zipfile.ZipFile(buf, "w") as zf:
+        zf.writestr("lmp.csv", "NODE,VALUE\nA,1\n")
+    return SimpleNamespace(
+        status_code=status_code, content=buf.getvalue(), raise_for_status=lambda: None,
+    )
+
+
+class TestFetchRetries:
+    def test_each_attempt_is_throttled(self, monkeypatch):
+        monkeypatch.setattr(caiso_client, "REQUEST_DELAY_S", 0)
+        monkeypatch.setattr(caiso_client, "RETRY_BACKOFF_S", 0.05)
+        client = CAISOClient()
+        responses = [_zip_response(429), _zip_response()]
+        client.session.get = lambda *a, **kw: responses.pop(0)
+        starts = []
+        original = client._throttle
+
+        def throttle():
+            num = original()
+            starts.append(time.monotonic())
+            return num
+
+        client._throttle = throttle
+        df = client._fetch_zip_csv({"node": "A"})
+
+        assert list(df["NODE"]) == ["A"]
+        assert len(starts) == 2
+        # The 429 backoff is applied through the shared schedule
+        assert starts[1] - starts[0] >= 0.045
@@ -0,0 +1,240 @@
+"""Tests for adapters.eia_client pagination (HTTP faked)."""
+
+import sys
+import threading
+import time
+from pathlib import Path
+
+import pandas as pd
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+import adapters.eia_client as eia_client
+from adapters.eia_client import EIAClient
+
+
+class _PagedClient(EIAClient):
+    """Fakes _request_with_retry over a fixed row set and tracks concurrency."""
+
+    def __init__(self, total: int, fail_offsets=(), latency: float = 0.03, **kwargs):
+        super().__init__(api_key="test", rate_limit_sec=0.0, **kwargs)
+        self.rows = [{"period": f"p{i}", "value": str(i)} for i in range(total)]
+        self.fail_offsets = set(fail_offsets)
+        self.latency = latency
+        self.offsets: list[int] = []
+        self.in_flight = 0
+        self.peak = 0
+        self._lock = threading.Lock()
+
+    def _request_with_retry(self, url, params):
+        offset, length = params["offset"], params["length"]
+        with self._lock:
+            self.offsets.append(offset)
+            self.in_flight += 1
+            self.peak = max(self.peak, self.in_flight)
+        time.sleep(self.latency)
+        with self._lock:
+            self.in_flight -= 1
+        if offset in self.fail_offsets:
+            return None
+        page = self.rows[offset:offset + length]
+        return {"response": {"total": str(len(self.rows)), "data": page}}
+
+
+def _paginate(client: EIAClient, page_size: int) -> list[dict]:
+    return client._paginate("https://example/", {"length": page_size}, page_size)
+
+
+class TestPaginate:
+    def test_pages_concatenated_in_order(self):
+        client = _PagedClient(total=23)
+        rows = _paginate(client, page_size=5)
+
+        assert [r["value"] for r in rows] == [str(i) for i in range(23)]
+        assert sorted(client.offsets) == [0, 5, 10, 15, 20]
+
+    def test_pages_fetched_concurrently(self):
+        client = _PagedClient(total=50, max_workers=4)
+        _paginate(client, page_size=5)
+        assert client.peak > 1
+
+    def test_serial_when_one_worker(self):
+        client = _PagedClient(total=20, max_workers=1)
+        assert len(_paginate(client, page_size=5)) == 20
+        assert client.peak == 1
+
+    def test_stops_at_first_failed_page(self):
+        client = _PagedClient(total=30, fail_offsets={15})
+        rows = _paginate(client, page_size=5)
+        assert [r["value"] for r in rows] == [str(i) for i in range(15)]
+
+    def test_empty_first_page(self):
+        client = _PagedClient(total=0)
+        assert _paginate(client, page_size=5) == []
+        assert client.offsets == [0]
+
+
+class TestThrottle:
+    def test_request_starts_spaced(self):
+        client = EIAClient(api_key="test", rate_limit_sec=0.05)
+        starts = []
+        for _ in range(3):
+            client._throttle()
+            starts.append(time.monotonic())
+        assert starts[2] - starts[0] >= 0.09
+
+    def test_work_between_requests_counts_toward_interval(self):
+        client = EIAClient(api_key="test", rate_limit_sec=0.05)
+        client._throttle()
+        time.sleep(0.04)  # e.g. decoding the previous page
+        t0 = time.monotonic()
+        client._throttle()
+        waited = time.monotonic() - t0
+        assert waited < 0.03
+
+        time.sleep(0.06)
+        t0 = time.monotonic()
+        client._throttle()
+        assert time.monotonic() - t0 < 0.01
+
+
+class _RowsClient(EIAClient):
+    def __init__(self, rows):
+        super().__init__(api_key="test", rate_limit_sec=0.0)
+        self._rows = rows
+
+    def _paginate(self, endpoint, params, page_size):
+        return self._rows
+
+
+class TestRegionData:
+    ROWS = [
+        {"period": "2024-01-01T01", "respondent": "BANC", "type": t, "type-name": name,
+         "value": v, "value-units": "megawatthours"}
+        for t, name, v in (("D", "Demand", "1500"), ("NG", "Net generation", 1400),
+                           ("TI", "Total interchange", -100))
+    ] + [
+        {"period": "2024-01-01T00", "type-name": "Demand", "value": "x"},
+        {"period": "2024-01-01T00", "type-name": "Demand", "value": "1490"},
+        {"period": "2024-01-01T02", "type-name": "Demand", "value": None},
+    ]
+
+    def test_pivot_one_row_per_hour(self):
+        df = _RowsClient(self.ROWS).fetch_region_data("BANC", "2024-01-01", "2024-01-02")
+
+        assert list(df.columns) == [
+            "timestamp_utc", "demand_mw", "net_generation_mw",
+            "total_interchange_mw", "net_imports_mw",
+        ]
+        assert list(df["timestamp_utc"]) == [
+            pd.Timestamp("2024-01-01 00:00", tz="UTC"), pd.Timestamp("2024-01-01 01:00", tz="UTC"),
+        ]
+        # First non-null value wins for duplicated (period, type) rows, and
+        # hours with no values at all are dropped
+        assert df["demand_mw"].tolist() == [1490.0, 1500.0]
+        assert df.loc[1, "net_imports_mw"] == 100.0
+
+    def test_absent_types_are_none(self):
+        rows = [{"period": "2024-01-01T00", "type-name": "Demand", "value": 5}]
+        df = _RowsClient(rows).fetch_region_data("BANC", "2024-01-01", "2024-01-02")
+
+        assert df.loc[0, "demand_mw"] == 5
+        assert df.loc[0, "net_generation_mw"] is None
+        assert df.loc[0, "net_imports_mw"] is None
+
+    def test_parse_periods_falls_back_to_inference(self):
+        from adapters.eia_client import _parse_periods
+        parsed = _parse_periods(pd.Series(["2024-01-01T05", "2024-01-02T06"]))
+        assert parsed.iloc[1] == pd.Timestamp("2024-01-02 06:00", tz="UTC")
+        daily = _parse_periods(pd.Series(["2024-01-01"]))
+        assert daily.iloc[0] == pd.Timestamp("2024-01-01", tz="UTC")
+
+
+class _FakeResponse:
+    def __init__(self, content: bytes):
+        self.content = content
+
+    def raise_for_status(self):
+        pass
+
+
+class TestRequestDecoding:
+    def _client(self, *bodies):
+        client = EIAClient(api_key="test", rate_limit_sec=0.0, max_retries=len(bodies))
+        responses = iter(_FakeResponse(b) for b in bodies)
+        client.session.get = lambda url, params, timeout: next(responses)
+        return client
+
+    def test_decodes_response_bytes(self):
+        client = self._client(b'{"response": {"total": "1", "data": [{"value": 5}]}}')
+        assert client._request_with_retry("u", {})["response"]["data"] == [{"value": 5}]
+
+    def test_malformed_body_is_retried(self, monkeypatch):
+        monkeypatch.setattr(time, "sleep", lambda s: None)
+        client = self._client(b"<html>bad gateway</html>", b'{"response": {}}')
+        assert client._request_with_retry("u", {}) == {"response": {}}
+
+
+class TestInterchangePairs:
+    def test_frame(self):
+        rows = [
+            {"period": "2024-01-01T01", "fromba": "BANC", "toba": "CISO", "value": "-50",
+             "fromba-name": "x", "toba-name": "y", "value-units": "MWh"},
+            {"period": "2024-01-01T00", "fromba": "BANC", "toba": "TIDC", "value": 20},
+        ]
+        df = _RowsClient(rows).fetch_interchange_pairs("BANC", "2024-01-01", "2024-01-02")
+
+        assert list(df.columns) == ["timestamp_utc", "from_ba", "to_ba", "value_mw"]
+        assert df["to_ba"].tolist() == ["TIDC", "CISO"]
+        assert df["value_mw"].tolist() == [20.0, -50.0]
+
+    def test_missing_ba_fields_default(self):
+        rows = [{"period": "2024-01-01T00", "value": 1}]
+        df = _RowsClient(rows).fetch_interchange_pairs("BANC", "2024-01-01", "2024-01-02")
+        assert df.loc[0, "from_ba"] == "BANC"
+        assert df.loc[0, "to_ba"] == ""
+
+    def test_empty(self):
+        assert _RowsClient([]).fetch_interchange_pairs("BANC", "a", "b").empty
+
+
+class TestSession:
+    def test_pool_covers_page_workers(self):
+        client = EIAClient(api_key="test", max_workers=24)
+        adapter = client.session.get_adapter("https://api.eia.gov/v2/")
+        assert adapter._pool_maxsize == 24 * eia_client.BA_PARALLELISM
+        assert EIAClient(api_key="test", max_workers=1).session.get_adapter(
+            "https://x"
+        )._pool_maxsize == 10
+
+
+class _BulkClient(EIAClient):
+    """Fakes per-BA region fetches with latency; one BA fails."""
+
+    def __init__(self):
+        super().__init__(api_key="test", rate_limit_sec=0.0)
+        self.in_flight = 0
+        self.peak = 0
+        self._lock = threading.Lock()
+
+    def fetch_region_data(self, ba_code, start, end, page_size=5000):
+        with self._lock:
+            self.in_flight += 1
+            self.peak = max(self.peak, self.in_flight)
+        time.sleep(0.03)
+        with self._lock:
+            self.in_flight -= 1
+        if ba_code == "BAD":
+            raise RuntimeError("boom")
+        return pd.DataFrame({"ba": [ba_code]})
+
+
+class TestRegionDataBulk:
+    def test_fans_out_and_maps_results(self):
+        client = _BulkClient()
+        out = client.fetch_region_data_bulk(["A", "BAD", "B", "C", "A"], "s", "e")
+
+        assert list(out) == ["A", "BAD", "B", "C"]
+        assert out["B"]["ba"].tolist() == ["B"]
+        assert out["BAD"].empty
+        assert client.peak > 1
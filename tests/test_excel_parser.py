@@ -0,0 +1,185 @@
+"""Tests for adapters.document_parser.excel_parser."""
+
+import sys
+from pathlib import Path
+
+import pandas as pd
+import pytest
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+import adapters.document_parser.excel_parser as excel_parser
+from adapters.document_parser.base import Confidence
+from adapters.document_parser.excel_parser import parse_excel
+
+
+@pytest.fixture(autouse=True)
+def _parse_cache(tmp_path, monkeypatch):
+    cache = tmp_path / "parse_cache"
+    monkeypatch.setattr(excel_parser, "PARSE_CACHE_DIR", cache)
+    return cache
+
+
+def _write_workbook(path: Path, n_sheets: int) -> None:
+    pytest.importorskip("openpyxl")
+    with pd.ExcelWriter(path) as writer:
+        for i in range(n_sheets):
+            pd.DataFrame({
+                "year": [2024 + i, 2025 + i, None],
+                "peak mw": [1.5, 2, None],
+                "blank": [None] * 3,
+            }).to_excel(writer, sheet_name=f"Sheet{i}", index=False)
+        pd.DataFrame().to_excel(writer, sheet_name="Empty", index=False)
+
+
+class TestParseExcel:
+    def test_sheets_parsed_in_order_and_cleaned(self, tmp_path):
+        path = tmp_path / "forecast.xlsx"
+        _write_workbook(path, 4)
+        tables = parse_excel(path)
+        assert [t.title for t in tables] == ["Sheet0", "Sheet1", "Sheet2", "Sheet3"]
+        assert [t.table_index for t in tables] == [0, 1, 2, 3]
+        df = tables[1].df
+        assert list(df.columns) == ["year", "peak mw"]
+        assert df["year"].tolist() == ["2025", "2026"]
+
+    def test_single_named_sheet(self, tmp_path):
+        path = tmp_path / "forecast.xlsx"
+        _write_workbook(path, 3)
+        tables = parse_excel(path, sheet_name="Sheet2")
+        assert [t.title for t in tables] == ["Sheet2"]
+
+    def test_max_sheets(self, tmp_path):
+        path = tmp_path / "forecast.xlsx"
+        _write_workbook(path, 5)
+        assert len(parse_excel(path, max_sheets=2)) == 2
+
+    def test_csv(self, tmp_path):
+        path = tmp_path / "needs.csv"
+        pd.DataFrame({"feeder": ["A", None], "mw": [1.0, None]}).to_csv(path, index=False)
+        tables = parse_excel(path)
+        assert len(tables) == 1
+        assert tables[0].title == "needs"
+        assert len(tables[0].df) == 1
+
+
+class TestParseCache:
+    def _count_parses(self, monkeypatch):
+        calls = []
+        real = excel_parser._parse_file
+
+        def counting(*args):
+            calls.append(args)
+            return real(*args)
+
+        monkeypatch.setattr(excel_parser, "_parse_file", counting)
+        return calls
+
+    def test_repeat_parse_served_from_cache(self, tmp_path, monkeypatch, _parse_cache):
+        calls = self._count_parses(monkeypatch)
+        path = tmp_path / "forecast.xlsx"
+        _write_workbook(path, 2)
+        first = parse_excel(path)
+        second = parse_excel(path)
+        assert len(calls) == 1
+        assert len(list(_parse_cache.iterdir())) == 1
+        assert [t.title for t in second] == ["Sheet0", "Sheet1"]
+        assert second[0].confidence == Confidence.HIGH
+        assert second[0].source_method == "openpyxl"
+        assert list(second[0].df.columns) == list(first[0].df.columns)
+        assert second[0].df["year"].tolist() == first[0].df["year"].tolist()
+
+    def test_changed_file_or_options_miss(self, tmp_path, monkeypatch):
+        calls = self._count_parses(monkeypatch)
+        path = tmp_path / "needs.csv"
+        pd.DataFrame({"feeder": ["A"], 2030: [1.0]}).to_csv(path, index=False)
+        parse_excel(path)
+        parse_excel(path, max_sheets=3)
+        assert len(calls) == 2
+
+        pd.DataFrame({"feeder": ["A", "B"], 2030: [1.0, 2.0]}).to_csv(path, index=False)
+        tables = parse_excel(path)
+        assert len(calls) == 3
+        assert tables[0].df["feeder"].tolist() == ["A", "B"]
+
+    def test_disabled(self, tmp_path, monkeypatch):
+        monkeypatch.setattr(excel_parser, "PARSE_CACHE_DIR", None)
+        calls = self._count_parses(monkeypatch)
+        path = tmp_path / "needs.csv"
+        pd.DataFrame({"feeder": ["A"]}).to_csv(path, index=False)
+        parse_excel(path)
+        parse_excel(path)
+        assert len(calls) == 2
+
+
+class TestDetectTableType:
+    @pytest.mark.parametrize("columns, expected", [
+        (["Year", "Peak Demand (MW)"], "load_forecast"),
+        (["forecast_gwh"], "load_forecast"),
+        (["forecast notes"], None),
+        (["Feeder", "Hosting Capacity kW"], "hosting_capacity"),
+        (["Circuit ID", "Overload %"], "grid_constraint"),
+        (["Thermal rating"], "grid_constraint"),
+        (["Procurement Need MW"], "resource_need"),
+        (["Resource type"], None),
+        (["Avoided Cost $/kWh"], "avoided_cost"),
+        (["Marginal price"], "avoided_cost"),
+        ([2030, "notes"], None),
+    ])
+    def test_classification(self, columns, expected):
+        from adapters.document_parser.excel_parser import detect_table_type
+
+        assert detect_table_type(pd.DataFrame(columns=columns)) == expected
+
+
+class TestSheetProbe:
+    def test_boilerplate_sheets_skipped_without_full_read(self, tmp_path, monkeypatch):
+        pytest.importorskip("openpyxl")
+        path = tmp_path / "filing.xlsx"
+        with pd.ExcelWriter(path) as writer:
+            pd.DataFrame(columns=["Cover page title"]).to_excel(
+                writer, sheet_name="Cover", index=False,
+            )
+            pd.DataFrame({"a": [None, None, "x"]}).to_excel(
+                writer, sheet_name="Data", index=False, startrow=3,
+            )
+
+        reads = []
+        real = pd.read_excel
+        monkeypatch.setattr(
+            pd, "read_excel", lambda *a, **kw: reads.append(kw["sheet_name"]) or real(*a, **kw),
+        )
+        tables = parse_excel(path)
+        assert [t.title for t in tables] == ["Data"]
+        assert tables[0].df.iloc[:, 0].tolist() == ["a", "x"]
+        assert reads == ["Data"]
+
+
+class TestWorkbookHandles:
+    def test_one_workbook_per_worker_and_all_closed(self, tmp_path, monkeypatch):
+        pytest.importorskip("openpyxl")
+        path = tmp_path / "forecast.xlsx"
+        _write_workbook(path, 6)
+
+        handles = []
+        real_open = excel_parser._open_excel
+
+        def tracking_open(p):
+            xls = real_open(p)
+            handles.append(xls)
+            return xls
+
+        closed = []
+        real_close = pd.ExcelFile.close
+        monkeypatch.setattr(
+            pd.ExcelFile, "close", lambda self: closed.append(self) or real_close(self),
+        )
+        monkeypatch.setattr(excel_parser, "_open_excel", tracking_open)
+        monkeypatch.setattr(excel_parser, "SHEET_PARALLELISM", 2)
+        assert len(parse_excel(path)) == 6
+        assert len(handles) <= 2
+        assert {id(x) for x in closed} == {id(x) for x in handles}
+
+        handles.clear()
+        assert len(parse_excel(path, sheet_name="Sheet1")) == 1
+        assert len(handles) == 1
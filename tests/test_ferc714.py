@@ -0,0 +1,179 @@
+"""Tests for adapters.federal_data.ferc714 bulk-file parsing."""
+
+import os
+import sys
+import zipfile
+from datetime import date
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from adapters.federal_data import ferc714
+from adapters.federal_data.ferc714 import FERC714Parser, Form714HourlyLoad
+
+HOURLY_CSV = """RespondentID,Year,PlanDate,Hour,LoadMW
+101,2022,2022-01-01,0,500.5
+101,2022,2022-01-01,1,480
+101,,01/02/2023,2,470
+102,2022,2022-01-01,0,900
+102,2022,bad-date,1,910
+102,2022,2022-01-01,2,
+103,2021,2021-06-30 00:00:00,,300
+"""
+
+
+@pytest.fixture
+def bulk_zip(tmp_path):
+    path = tmp_path / "ferc714.zip"
+    with zipfile.ZipFile(path, "w") as zf:
+        zf.writestr("Part3_hourly_loads.csv", HOURLY_CSV)
+    return path
+
+
+@pytest.fixture(params=["arrow", "rows"])
+def parser(request, monkeypatch):
+    if request.param == "rows":
+        monkeypatch.setattr(ferc714, "pa", None)
+    return FERC714Parser(data_dir=Path("unused"))
+
+
+class TestParseHourlyLoads:
+    def test_all_rows(self, parser, bulk_zip):
+        loads = parser.parse_hourly_loads(bulk_zip)
+        assert loads == [
+            Form714HourlyLoad(101, 2022, date(2022, 1, 1), 0, 500.5),
+            Form714HourlyLoad(101, 2022, date(2022, 1, 1), 1, 480.0),
+            Form714HourlyLoad(101, 2023, date(2023, 1, 2), 2, 470.0),
+            Form714HourlyLoad(102, 2022, date(2022, 1, 1), 0, 900.0),
+            Form714HourlyLoad(103, 2021, date(2021, 6, 30), 0, 300.0),
+        ]
+
+    def test_filters_and_limit(self, parser, bulk_zip):
+        by_respondent = parser.parse_hourly_loads(bulk_zip, respondent_id=101)
+        assert [l.hour for l in by_respondent] == [0, 1, 2]
+
+        by_year = parser.parse_hourly_loads(bulk_zip, respondent_id=101, year=2022)
+        assert [l.hour for l in by_year] == [0, 1]
+
+        assert len(parser.parse_hourly_loads(bulk_zip, limit=2)) == 2
+
+    def test_missing_member(self, parser, tmp_path):
+        path = tmp_path / "empty.zip"
+        with zipfile.ZipFile(path, "w") as zf:
+            zf.writestr("readme.txt", "")
+        assert parser.parse_hourly_loads(path) == []
+
+
+class TestRowFallback:
+    def test_short_rows_and_crlf(self, monkeypatch, tmp_path):
+        monkeypatch.setattr(ferc714, "pa", None)
+        parser = FERC714Parser(data_dir=Path("unused"))
+        path = tmp_path / "ragged.zip"
+        with zipfile.ZipFile(path, "w") as zf:
+            zf.writestr(
+                "hourly.csv",
+                "respondent_id,plan_date,load_mw,hour\r\n7,2020-03-01,12.5\r\n7,2020-03-01\r\n",
+            )
+        assert parser.parse_hourly_loads(path) == [
+            Form714HourlyLoad(7, 2020, date(2020, 3, 1), 0, 12.5),
+        ]
+
+
+class TestHourlySidecar:
+    def test_second_parse_reads_sidecar(self, bulk_zip, monkeypatch):
+        parser = FERC714Parser(data_dir=Path("unused"))
+        full = parser.parse_hourly_loads(bulk_zip)
+        sidecar = ferc714._hourly_sidecar(bulk_zip)
+        assert sidecar.exists()
+
+        def no_csv(f):
+            raise AssertionError("CSV reparsed despite a fresh sidecar")
+
+        monkeypatch.setattr(ferc714, "_read_hourly_table", no_csv)
+        assert parser.parse_hourly_loads(bulk_zip) == full
+        assert [l.hour for l in parser.parse_hourly_loads(bulk_zip, respondent_id=101, year=2022)] == [0, 1]
+        assert len(parser.parse_hourly_loads(bulk_zip, limit=3)) == 3
+
+    def test_stale_sidecar_is_rebuilt(self, bulk_zip):
+        parser = FERC714Parser(data_dir=Path("unused"))
+        parser.parse_hourly_loads(bulk_zip)
+        sidecar = ferc714._hourly_sidecar(bulk_zip)
+
+        with zipfile.ZipFile(bulk_zip, "w") as zf:
+            zf.writestr("hourly.csv", "respondent_id,plan_date,load_mw\n5,2020-01-01,1.0\n")
+        mtime = sidecar.stat().st_mtime_ns + 1_000_000_000
+        os.utime(bulk_zip, ns=(mtime, mtime))
+
+        assert parser.parse_hourly_loads(bulk_zip) == [
+            Form714HourlyLoad(5, 2020, date(2020, 1, 1), 0, 1.0),
+        ]
+
+    def test_sorted_input_stops_after_block(self, monkeypatch, tmp_path):
+        monkeypatch.setattr(ferc714, "pa", None)
+        parser = FERC714Parser(data_dir=Path("unused"))
+        path = tmp_path / "sorted.zip"
+        with zipfile.ZipFile(path, "w") as zf:
+            # A stray later row for respondent 1 shows where the scan stopped
+            zf.writestr("hourly.csv", (
+                "respondent_id,report_year,plan_date,hour,load_mw\n"
+                "1,2021,2021-01-01,0,10\n1,2022,2022-01-01,0,11\n"
+                "2,2022,2022-01-01,0,20\n1,2022,2022-01-02,0,12\n"
+            ))
+
+        def loads(**kwargs):
+            return [l.load_mw for l in parser.parse_hourly_loads(path, respondent_id=1, **kwargs)]
+
+        assert loads() == [10.0, 11.0, 12.0]
+        assert loads(sorted_by_respondent=True) == [10.0, 11.0]
+        assert loads(year=2022, sorted_by_respondent=True) == [11.0]
+
+
+class TestParsePlanDate:
+    def test_formats(self):
+        assert ferc714._parse_plan_date("2022-03-04") == date(2022, 3, 4)
+        assert ferc714._parse_plan_date("03/04/2022") == date(2022, 3, 4)
+        assert ferc714._parse_plan_date("2022-13-04") is None
+        assert ferc714._parse_plan_date("bad-date") is None
+
+
+class TestRespondentsAndAreas:
+    @pytest.fixture
+    def zip_path(self, tmp_path):
+        path = tmp_path / "bulk.zip"
+        with zipfile.ZipFile(path, "w") as zf:
+            zf.writestr("respondent_id.csv", "RespondentID,RespondentName,EIACode\n1,Alpha,123\n2,Beta,\n")
+            zf.writestr("part2_planning_area.csv", (
+                "respondent_id,respondent_name,report_year,peak_demand_mw,net_energy_gwh\n"
+                "1,Alpha,2021,100.5,800\n1,Alpha,2022,110,\n"
+            ))
+        return path
+
+    def test_respondents(self, zip_path):
+        resp = FERC714Parser(data_dir=Path("unused")).parse_respondents(zip_path)
+        assert [(r.respondent_id, r.respondent_name, r.eia_code, r.state) for r in resp] == [
+            (1, "Alpha", 123, None), (2, "Beta", None, None),
+        ]
+
+    def test_planning_areas(self, zip_path):
+        areas = FERC714Parser(data_dir=Path("unused")).parse_planning_areas(zip_path, year=2022)
+        assert len(areas) == 1
+        assert areas[0].peak_demand_mw == 110.0
+        assert areas[0].annual_energy_gwh is None
+        assert areas[0].summer_peak_mw is None
+
+
+class TestRecordSlots:
+    def test_no_instance_dict(self):
+        from adapters.federal_data.ferc714 import Form714PlanningArea, Form714Respondent
+        from adapters.federal_data.ferc_elibrary import FERCFiling
+
+        for record in (
+            Form714HourlyLoad(1, 2022, date(2022, 1, 1), 0, 1.0),
+            Form714Respondent(1, "Alpha"),
+            Form714PlanningArea(1, "Alpha", 2022),
+            FERCFiling("20240101-0001"),
+        ):
+            assert not hasattr(record, "__dict__")
+        assert Form714PlanningArea(1, "A", 2022).adjacent_systems == []
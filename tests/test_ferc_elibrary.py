@@ -0,0 +1,173 @@
+"""Tests for adapters.federal_data.ferc_elibrary (no network)."""
+
+import sys
+from pathlib import Path
+
+import pytest
+import requests
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from adapters.federal_data import _http, ferc_elibrary
+from adapters.federal_data.ferc714 import FERC714Parser
+from adapters.federal_data.ferc_elibrary import FERCeLibraryScraper
+
+
+class TestSharedSession:
+    def test_scrapers_share_one_session(self):
+        assert FERCeLibraryScraper().session is FERC714Parser().session
+        assert FERCeLibraryScraper().session is _http.shared_session()
+
+    def test_pooled_retrying_adapter(self):
+        adapter = _http.make_session().get_adapter("https://elibrary.ferc.gov/")
+        assert adapter._pool_maxsize == _http.HTTP_POOL_MAXSIZE
+        assert adapter.max_retries.total == 3
+        assert 503 in adapter.max_retries.status_forcelist
+
+    def test_explicit_session(self):
+        session = requests.Session()
+        assert FERCeLibraryScraper(session=session).session is session
+
+
+RESULTS_HTML = """
+<html><head><title>eLibrary</title></head><body>
+<div class="nav"><a href="/help">Help</a></div>
+<table>
+  <tr><th>Accession</th><th>Description</th><th>Date</th></tr>
+  <tr>
+    <td><a href="/filelist?accession_number=20240115-5123">20240115-5123</a></td>
+    <td>PJM transmission plan ER24-1234 filing</td>
+    <td>01/15/2024</td>
+  </tr>
+  <tr>
+    <td>20231201-4001</td><td>Form 714 report</td><td>12/01/2023</td>
+  </tr>
+  <tr><td>no accession here</td><td>x</td><td>y</td></tr>
+</table></body></html>
+"""
+
+
+@pytest.fixture(params=["lxml", "html.parser"])
+def scraper(request, monkeypatch):
+    if request.param == "lxml":
+        pytest.importorskip("lxml")
+    monkeypatch.setattr(ferc_elibrary, "HTML_PARSER", request.param)
+    return FERCeLibraryScraper(session=requests.Session())
+
+
+class TestParseHtmlResults:
+    def test_rows_parsed(self, scraper):
+        filings = scraper._parse_html_results(RESULTS_HTML)
+
+        assert [f.accession_number for f in filings] == ["20240115-5123", "20231201-4001"]
+        first = filings[0]
+        assert first.docket_number == "ER24-1234"
+        assert first.description == "PJM transmission plan ER24-1234 filing"
+        assert first.filing_date.isoformat() == "2024-01-15"
+        assert filings[1].docket_number is None
+
+    def test_duplicate_accessions_keep_first(self, scraper):
+        rows = "".join(
+            f"<tr><td>2024010{i % 3}-0001</td><td>filing {i}</td><td>01/0{i % 3 + 1}/2024</td></tr>"
+            for i in range(9)
+        )
+        filings = scraper._parse_html_results(f"<table>{rows}</table>")
+
+        assert [f.accession_number for f in filings] == [
+            "20240100-0001", "20240101-0001", "20240102-0001",
+        ]
+        assert [f.description for f in filings] == ["filing 0", "filing 1", "filing 2"]
+
+
+class TestSaveResponse:
+    def test_gzip_body_saved_decoded(self, tmp_path):
+        import gzip
+        import io
+        from urllib3.response import HTTPResponse
+
+        payload = b"%PDF-1.7 " + b"x" * (3 << 20)
+        resp = requests.Response()
+        resp.raw = HTTPResponse(
+            body=io.BytesIO(gzip.compress(payload)),
+            headers={"content-encoding": "gzip"},
+            preload_content=False,
+        )
+        dest = tmp_path / "filing.pdf"
+
+        _http.save_response(resp, dest)
+        assert dest.read_bytes() == payload
+
+
+class _FakeSession:
+    """Session whose GETs take a fixed time; tracks concurrency and failures."""
+
+    def __init__(self, latency=0.05, failing=()):
+        import threading
+        self.latency = latency
+        self.failing = set(failing)
+        self.in_flight = 0
+        self.peak = 0
+        self.starts = []
+        self._lock = threading.Lock()
+
+    def get(self, url, **kwargs):
+        import time
+        with self._lock:
+            self.starts.append(time.monotonic())
+            self.in_flight += 1
+            self.peak = max(self.peak, self.in_flight)
+        time.sleep(self.latency)
+        with self._lock:
+            self.in_flight -= 1
+        accession = url.rsplit("=", 1)[1]
+        if accession in self.failing:
+            raise requests.ConnectionError("reset")
+        return _FakeDownload(accession)
+
+
+class _FakeDownload:
+    def __init__(self, body: str):
+        self.body = body
+
+    def raise_for_status(self):
+        pass
+
+
+class TestDownloadDocuments:
+    @pytest.fixture(autouse=True)
+    def _write_body(self, monkeypatch):
+        monkeypatch.setattr(
+            ferc_elibrary, "save_response",
+            lambda resp, dest: dest.write_text(resp.body),
+        )
+
+    def test_concurrent_and_mapped(self, tmp_path):
+        session = _FakeSession(failing={"20240101-0003"})
+        scraper = FERCeLibraryScraper(rate_limit_sec=0.0, session=session)
+        accessions = [f"20240101-000{i}" for i in range(6)] + ["20240101-0000"]
+
+        paths = scraper.download_documents(accessions, tmp_path)
+
+        assert list(paths) == accessions[:6]
+        assert paths["20240101-0003"] is None
+        assert paths["20240101-0001"].read_text() == "20240101-0001"
+        assert session.peak > 1
+
+    def test_request_starts_rate_limited(self, tmp_path):
+        session = _FakeSession(latency=0.0)
+        scraper = FERCeLibraryScraper(rate_limit_sec=0.03, session=session)
+
+        scraper.download_documents([f"20240101-000{i}" for i in range(4)], tmp_path)
+
+        assert max(session.starts) - min(session.starts) >= 0.08
+
+
+class TestRowIds:
+    def test_both_found_in_one_pass(self):
+        assert ferc_elibrary._row_ids("ER24-1234 filed 20240115-5123 EL23-9") == (
+            "20240115-5123", "ER24-1234",
+        )
+
+    def test_missing(self):
+        assert ferc_elibrary._row_ids("Form 714 report 12/01/2023") == (None, None)
+        assert ferc_elibrary._row_ids("20231201-4001 only") == ("20231201-4001", None)
@@ -0,0 +1,401 @@
+"""Tests for adapters.congestion_lmp.gridstatus_lmp (gridstatus ISO faked)."""
+
+import sys
+import threading
+import time
+from datetime import date
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+import pytest
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+import adapters.congestion_lmp.gridstatus_lmp as gridstatus_lmp
+from adapters.congestion_lmp.gridstatus_lmp import GridStatusLMPAdapter
+
+
+@pytest.fixture(autouse=True)
+def _reset_breakers():
+    gridstatus_lmp._BREAKERS.clear()
+    yield
+    gridstatus_lmp._BREAKERS.clear()
+
+
+class _FakeISO:
+    """Returns one hourly row per day in [date, end); optionally fails."""
+
+    def __init__(self, fail_starts=(), exc=RuntimeError):
+        self.fail_starts = set(fail_starts)
+        self.exc = exc
+        self.calls: list[tuple[str, str]] = []
+        self.active = 0
+        self.peak = 0
+        self._lock = threading.Lock()
+
+    def get_lmp(self, date, end, market, locations):
+        with self._lock:
+            self.calls.append((date, end))
+            self.active += 1
+            self.peak = max(self.peak, self.active)
+        try:
+            time.sleep(0.005)
+            if date in self.fail_starts:
+                raise self.exc("ISO unavailable")
+            ts = pd.date_range(date, end, freq="D", inclusive="left", tz="US/Pacific")
+            return pd.DataFrame({
+                "Interval Start": ts,
+                "LMP": 30.0,
+                "Energy": 28.0,
+                "Congestion": 1.5,
+                "Loss": 0.5,
+            })
+        finally:
+            with self._lock:
+                self.active -= 1
+
+
+def _adapter(iso, **kwargs):
+    adapter = GridStatusLMPAdapter("CAISO", rate_limit_sec=1e-6, **kwargs)
+    adapter._iso = iso
+    return adapter
+
+
+class TestChunkedFetch:
+    def test_date_chunks_cover_range(self):
+        adapter = _adapter(_FakeISO())
+        chunks = adapter._date_chunks(date(2024, 1, 1), date(2024, 3, 15))
+        assert chunks[0] == (date(2024, 1, 1), date(2024, 1, 31))
+        assert chunks[-1][1] == date(2024, 3, 15)
+        assert all(a[1] == b[0] for a, b in zip(chunks, chunks[1:]))
+
+    def test_chunks_fetched_concurrently_and_combined(self):
+        iso = _FakeISO()
+        adapter = _adapter(iso, parallelism=4)
+        df = adapter.fetch_node_lmp("NODE_A", date(2024, 1, 1), date(2024, 12, 31))
+        assert len(iso.calls) == 13
+        assert iso.peak > 1
+        assert len(df) == 365
+        assert df["timestamp_utc"].is_monotonic_increasing
+        assert (df["node_id"] == "NODE_A").all()
+
+    def test_overlapping_chunk_boundaries_are_deduplicated(self):
+        class _InclusiveISO(_FakeISO):
+            def get_lmp(self, date, end, market, locations):
+                ts = pd.date_range(date, end, freq="D", tz="UTC")
+                return pd.DataFrame({"Interval Start": ts, "LMP": 1.0})
+
+        adapter = _adapter(_InclusiveISO(), parallelism=3)
+        df = adapter.fetch_node_lmp("NODE_A", date(2024, 1, 1), date(2024, 4, 1))
+        assert df["timestamp_utc"].is_unique
+        assert len(df) == 92
+        assert df["energy_component"].isna().all()
+
+    def test_serial_when_parallelism_is_one(self):
+        iso = _FakeISO()
+        adapter = _adapter(iso, parallelism=1)
+        adapter.fetch_hub_baseline(date(2024, 1, 1), date(2024, 4, 1))
+        assert iso.peak == 1
+        assert [c[0] for c in iso.calls] == ["2024-01-01", "2024-01-31", "2024-03-01", "2024-03-31"]
+
+    def test_throttle_spaces_request_starts(self):
+        adapter = _adapter(_FakeISO())
+        adapter._rate_limit_sec = 0.02
+        starts = []
+
+        def worker():
+            adapter._throttle()
+            starts.append(time.monotonic())
+
+        threads = [threading.Thread(target=worker) for _ in range(4)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+        # Four starts spaced 20ms apart span at least 60ms end to end
+        assert max(starts) - min(starts) >= 0.055
+
+
+def _http_error(status):
+    import requests
+
+    resp = requests.Response()
+    resp.status_code = status
+    return requests.HTTPError(f"{status} error", response=resp)
+
+
+class _ErrorISO:
+    def __init__(self, errors):
+        self.errors = list(errors)
+        self.calls = 0
+
+    def get_lmp(self, date, end, market, locations):
+        self.calls += 1
+        if self.errors:
+            raise self.errors.pop(0)
+        return pd.DataFrame({"Interval Start": [pd.Timestamp(date)], "LMP": [1.0]})
+
+
+class TestFetchChunkRetry:
+    def _patch_sleep(self, monkeypatch):
+        import adapters.congestion_lmp.gridstatus_lmp as mod
+
+        waits = []
+        monkeypatch.setattr(mod.time, "sleep", waits.append)
+        return waits
+
+    def test_client_error_fails_fast(self, monkeypatch):
+        waits = self._patch_sleep(monkeypatch)
+        iso = _ErrorISO([_http_error(404)])
+        df = _adapter(iso)._fetch_chunk("N", "2024-01-01", "2024-01-31")
+        assert df.empty
+        assert iso.calls == 1
+        assert all(w < 0.01 for w in waits)
+
+    def test_server_errors_retry_with_bounded_jitter(self, monkeypatch):
+        waits = self._patch_sleep(monkeypatch)
+        iso = _ErrorISO([_http_error(503), ConnectionError("reset")])
+        adapter = _adapter(iso)
+        df = adapter._fetch_chunk("N", "2024-01-01", "2024-01-31", max_retries=3)
+        assert len(df) == 1
+        assert iso.calls == 3
+        backoffs = [w for w in waits if w >= 0.01]
+        retry = adapter._config["retry"]
+        assert len(backoffs) == 2
+        assert retry["base"] <= backoffs[0] <= retry["base"] * 3
+        assert retry["base"] <= backoffs[1] <= min(retry["cap"], backoffs[0] * 3)
+
+    def test_gives_up_after_max_retries(self, monkeypatch):
+        self._patch_sleep(monkeypatch)
+        iso = _ErrorISO([_http_error(500)] * 5)
+        df = _adapter(iso)._fetch_chunk("N", "2024-01-01", "2024-01-31")
+        assert df.empty
+        assert iso.calls == 3
+
+
+class TestCircuitBreaker:
+    def test_opens_after_threshold_and_short_circuits(self, monkeypatch):
+        monkeypatch.setattr(gridstatus_lmp.time, "sleep", lambda s: None)
+        iso = _ErrorISO([ConnectionError("down")] * 10)
+        adapter = _adapter(iso)
+        adapter._fetch_chunk("N", "2024-01-01", "2024-01-31")  # 3 failures
+        adapter._fetch_chunk("N", "2024-01-31", "2024-03-01")  # 2 more -> open
+        assert iso.calls == 5
+        assert gridstatus_lmp._BREAKERS["CAISO"]["state"] == "open"
+
+        assert adapter._fetch_chunk("N", "2024-03-01", "2024-03-31").empty
+        assert iso.calls == 5
+
+    def test_half_open_probe_closes_on_success(self, monkeypatch):
+        monkeypatch.setattr(gridstatus_lmp.time, "sleep", lambda s: None)
+        gridstatus_lmp._BREAKERS["CAISO"] = {
+            "state": "open", "failures": 5, "opened_at": time.monotonic() - 61,
+        }
+        iso = _ErrorISO([])
+        df = _adapter(iso)._fetch_chunk("N", "2024-01-01", "2024-01-31")
+        assert len(df) == 1
+        assert gridstatus_lmp._BREAKERS["CAISO"]["state"] == "closed"
+        assert gridstatus_lmp._BREAKERS["CAISO"]["failures"] == 0
+
+    def test_failed_probe_reopens(self, monkeypatch):
+        monkeypatch.setattr(gridstatus_lmp.time, "sleep", lambda s: None)
+        gridstatus_lmp._BREAKERS["CAISO"] = {
+            "state": "open", "failures": 5, "opened_at": time.monotonic() - 61,
+        }
+        iso = _ErrorISO([ConnectionError("still down")] * 3)
+        assert _adapter(iso)._fetch_chunk("N", "2024-01-01", "2024-01-31").empty
+        assert iso.calls == 1
+        assert gridstatus_lmp._BREAKERS["CAISO"]["state"] == "open"
+
+
+class TestNormalize:
+    def test_dedupes_sorts_and_fills_missing_components(self):
+        adapter = _adapter(_FakeISO())
+        raw = pd.DataFrame({
+            "Interval Start": pd.to_datetime([
+                "2024-11-03 01:00-07:00",
+                "2024-11-03 00:00-07:00",
+                "2024-11-03 01:00-07:00",  # duplicate, second occurrence dropped
+                "2024-11-03 01:00-08:00",
+            ], utc=True).tz_convert("US/Pacific"),
+            "LMP": ["30", 20, 99, 40],
+            "Congestion": [1.0, 2.0, 9.0, 4.0],
+        })
+        out = adapter._normalize(raw, "NODE_A")
+        assert list(out.columns) == [
+            "timestamp_utc", "node_id", "lmp", "energy_component",
+            "congestion_component", "loss_component",
+        ]
+        assert out["timestamp_utc"].tolist() == list(pd.to_datetime([
+            "2024-11-03 07:00", "2024-11-03 08:00", "2024-11-03 09:00",
+        ]))
+        assert out["lmp"].tolist() == [20.0, 30.0, 40.0]
+        assert out["congestion_component"].tolist() == [2.0, 1.0, 4.0]
+        assert out["energy_component"].isna().all()
+        assert (out["node_id"] == "NODE_A").all()
+        assert out.index.tolist() == [0, 1, 2]
+
+
+class TestChunkCache:
+    def test_settled_chunks_served_from_disk(self, tmp_path):
+        iso = _FakeISO()
+        adapter = _adapter(iso, cache_dir=tmp_path)
+        first = adapter.fetch_node_lmp("NODE/A", date(2024, 1, 1), date(2024, 3, 1))
+        assert len(iso.calls) == 2
+        assert len(list((tmp_path / "CAISO").rglob("*.parquet"))) == 2
+
+        again = _adapter(iso, cache_dir=tmp_path).fetch_node_lmp(
+            "NODE/A", date(2024, 1, 1), date(2024, 3, 1),
+        )
+        assert len(iso.calls) == 2
+        pd.testing.assert_frame_equal(first, again)
+
+    def test_force_bypasses_cache(self, tmp_path):
+        iso = _FakeISO()
+        adapter = _adapter(iso, cache_dir=tmp_path)
+        adapter.fetch_hub_baseline(date(2024, 1, 1), date(2024, 1, 31))
+        adapter.fetch_hub_baseline(date(2024, 1, 1), date(2024, 1, 31), force=True)
+        assert len(iso.calls) == 2
+
+    def test_recent_chunks_are_not_cached(self, tmp_path):
+        from datetime import timedelta
+
+        iso = _FakeISO()
+        adapter = _adapter(iso, cache_dir=tmp_path)
+        end = date.today()
+        adapter.fetch_node_lmp("NODE_A", end - timedelta(days=10), end)
+        adapter.fetch_node_lmp("NODE_A", end - timedelta(days=10), end)
+        assert len(iso.calls) == 2
+        assert not list(tmp_path.rglob("*.parquet"))
+
+
+class TestHubLookup:
+    def test_unknown_hub_lists_available(self):
+        adapter = _adapter(_FakeISO())
+        with pytest.raises(ValueError, match=r"Available: \['NP15', 'SP15'\]"):
+            adapter.fetch_hub_baseline(date(2024, 1, 1), date(2024, 1, 2), hub="ZP26")
+
+    def test_hub_index_is_read_only(self):
+        adapter = _adapter(_FakeISO())
+        with pytest.raises(TypeError):
+            adapter._hubs["NEW"] = "X"
+
+
+class TestArrowTables:
+    def test_node_table_matches_dataframe(self):
+        from adapters.congestion_lmp.gridstatus_lmp import CANONICAL_SCHEMA
+
+        adapter = _adapter(_FakeISO())
+        table = adapter.fetch_node_lmp_table("NODE_A", date(2024, 1, 1), date(2024, 3, 1))
+        df = adapter.fetch_node_lmp("NODE_A", date(2024, 1, 1), date(2024, 3, 1))
+        assert table.schema == CANONICAL_SCHEMA
+        assert table.num_rows == len(df) == 60
+        assert table.column("node_id").to_pylist() == df["node_id"].tolist()
+        assert table.column("lmp").to_numpy().tolist() == df["lmp"].tolist()
+        assert (
+            table.column("timestamp_utc").to_pandas().tolist()
+            == df["timestamp_utc"].tolist()
+        )
+
+    def test_hub_table_and_empty_result(self):
+        adapter = _adapter(_FakeISO())
+        table = adapter.fetch_hub_baseline_table(date(2024, 1, 1), date(2024, 1, 11))
+        assert set(table.column("node_id").to_pylist()) == {"CAISO_NP15_BASELINE"}
+
+        failing = _adapter(_FakeISO(fail_starts={"2024-01-01"}, exc=ValueError))
+        failing._config = {**failing._config, "retry": {"base": 0.0, "cap": 0.0, "max_retries": 1}}
+        empty = failing.fetch_node_lmp_table("N", date(2024, 1, 1), date(2024, 1, 5))
+        assert empty.num_rows == 0
+        assert empty.schema == table.schema
+
+
+class TestTimestampConversion:
+    @pytest.mark.parametrize("col", [
+        pd.Series(pd.date_range("2024-11-03", periods=4, freq="h", tz="US/Pacific")),
+        pd.Series(pd.date_range("2024-11-03 07:00", periods=4, freq="h")),
+        pd.Series(["2024-11-03T02:00-05:00", "2024-11-03T03:00-05:00",
+                   "2024-11-03T04:00-05:00", "2024-11-03T05:00-05:00"]),
+    ])
+    def test_utc_naive_ns(self, col):
+        from adapters.congestion_lmp.gridstatus_lmp import _utc_naive_ns
+
+        out = _utc_naive_ns(col)
+        assert out.dtype == "datetime64[ns]"
+        assert list(out) == list(pd.date_range("2024-11-03 07:00", periods=4, freq="h").to_numpy())
+
+
+class TestIsoSingleton:
+    @pytest.fixture(autouse=True)
+    def _fake_gridstatus(self, monkeypatch):
+        created = []
+
+        class _ISO:
+            def __init__(self):
+                created.append(self)
+
+        fake = type(sys)("gridstatus")
+        fake.CAISO = fake.PJM = _ISO
+        monkeypatch.setitem(sys.modules, "gridstatus", fake)
+        gridstatus_lmp._iso_for_class.cache_clear()
+        self.created = created
+        yield
+        gridstatus_lmp._iso_for_class.cache_clear()
+
+    def test_instances_share_client(self):
+        a = GridStatusLMPAdapter("CAISO")._get_iso()
+        b = GridStatusLMPAdapter("caiso")._get_iso()
+        assert a is b
+        assert len(self.created) == 1
+
+    def test_client_per_rto(self):
+        caiso = GridStatusLMPAdapter("CAISO")._get_iso()
+        pjm = GridStatusLMPAdapter("PJM")._get_iso()
+        assert caiso is not pjm
+
+    def test_concurrent_first_use_creates_once(self):
+        adapters = [GridStatusLMPAdapter("PJM") for _ in range(8)]
+        barrier = threading.Barrier(len(adapters))
+
+        def get(adapter):
+            barrier.wait()
+            return adapter._get_iso()
+
+        threads = []
+        results = []
+        for adapter in adapters:
+            t = threading.Thread(target=lambda a=adapter: results.append(get(a)))
+            t.start()
+            threads.append(t)
+        for t in threads:
+            t.join()
+
+        assert len(self.created) == 1
+        assert all(r is results[0] for r in results)
+
+
+class TestFirstRowPerTimestamp:
+    def test_single_node_keeps_first_and_sorts(self):
+        ts = pd.to_datetime(["2024-01-02", "2024-01-01", "2024-01-02", "2024-01-03"])
+        keep = gridstatus_lmp.first_row_per_timestamp(ts.to_numpy().view("i8"))
+        assert keep.tolist() == [1, 0, 3]
+
+    def test_multi_node_matches_drop_duplicates(self):
+        rng = np.random.default_rng(0)
+        df = pd.DataFrame({
+            "timestamp_utc": pd.to_datetime("2024-01-01")
+            + pd.to_timedelta(rng.integers(0, 48, 500), unit="h"),
+            "node_id": rng.choice(["A", "B", "C"], 500),
+            "lmp": np.arange(500, dtype=float),
+        })
+        codes, _ = pd.factorize(df["node_id"])
+        keep = gridstatus_lmp.first_row_per_timestamp(
+            df["timestamp_utc"].to_numpy().view("i8"), codes,
+        )
+        fast = df.iloc[keep].sort_values(["node_id", "timestamp_utc"]).reset_index(drop=True)
+        expected = (
+            df.drop_duplicates(subset=["timestamp_utc", "node_id"], keep="first")
+            .sort_values(["node_id", "timestamp_utc"])
+            .reset_index(drop=True)
+        )
+        pd.testing.assert_frame_equal(fast, expected)
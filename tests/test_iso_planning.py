@@ -0,0 +1,262 @@
+"""Tests for adapters.federal_data.iso_planning (no network)."""
+
+import dataclasses
+import io
+import json
+import sys
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from adapters.federal_data import _http, iso_planning
+from adapters.federal_data.iso_planning import ISOPlanningDownloader
+
+
+class FakeResponse:
+    def __init__(self, body: bytes, status_code: int = 200, headers=None):
+        self.raw = io.BytesIO(body)
+        self.status_code = status_code
+        self.headers = headers or {}
+
+    def raise_for_status(self):
+        pass
+
+    def close(self):
+        pass
+
+
+class FakeSession:
+    """Records request start times and peak concurrency per host."""
+
+    def __init__(self, delay: float = 0.05, fail: tuple = ()):
+        self.delay = delay
+        self.fail = fail
+        self.lock = threading.Lock()
+        self.starts: list[tuple[str, float]] = []
+        self.headers: list[dict] = []
+        self.etag = None
+        self.active = 0
+        self.peak = 0
+
+    def get(self, url, headers=None, timeout=None, stream=False):
+        with self.lock:
+            self.starts.append((url, time.monotonic()))
+            self.headers.append(headers)
+            self.active += 1
+            self.peak = max(self.peak, self.active)
+        try:
+            time.sleep(self.delay)
+            if url in self.fail:
+                raise ConnectionError("boom")
+            if self.etag and (headers or {}).get("If-None-Match") == self.etag:
+                return FakeResponse(b"", 304)
+            return FakeResponse(url.encode(), headers={"etag": self.etag} if self.etag else {})
+        finally:
+            with self.lock:
+                self.active -= 1
+
+
+def make_downloader(session, rate_limit_sec=0.0):
+    dl = ISOPlanningDownloader(rate_limit_sec=rate_limit_sec)
+    dl.session = session
+    return dl
+
+
+class TestDownloadMany:
+    def test_downloads_concurrently_across_hosts(self, tmp_path):
+        session = FakeSession()
+        dl = make_downloader(session)
+        urls = [f"https://iso{i}.example.com/plan.pdf" for i in range(4)]
+        results = dl.download_many(urls, tmp_path / "out", max_workers=4)
+        assert session.peak > 1
+        assert list(results) == urls
+        assert all(p is not None and p.exists() for p in results.values())
+
+    def test_failed_download_maps_to_none(self, tmp_path):
+        bad = "https://a.example.com/bad.pdf"
+        good = "https://b.example.com/good.pdf"
+        dl = make_downloader(FakeSession(delay=0, fail=(bad,)))
+        results = dl.download_many([bad, good], tmp_path)
+        assert results[bad] is None
+        assert results[good].read_bytes() == good.encode()
+
+    def test_duplicate_urls_fetched_once(self, tmp_path):
+        session = FakeSession(delay=0)
+        dl = make_downloader(session)
+        url = "https://a.example.com/plan.pdf"
+        results = dl.download_many([url, url], tmp_path)
+        assert list(results) == [url]
+        assert len(session.starts) == 1
+
+    def test_per_host_concurrency_cap(self, tmp_path, monkeypatch):
+        monkeypatch.setattr(iso_planning, "HOST_CONCURRENCY", 2)
+        session = FakeSession()
+        dl = make_downloader(session)
+        urls = [f"https://one.example.com/f{i}.pdf" for i in range(6)]
+        dl.download_many(urls, tmp_path, max_workers=6)
+        assert session.peak == 2
+
+    def test_same_host_starts_are_spaced(self, tmp_path):
+        session = FakeSession(delay=0)
+        dl = make_downloader(session, rate_limit_sec=0.05)
+        urls = [f"https://one.example.com/f{i}.pdf" for i in range(3)]
+        dl.download_many(urls, tmp_path, max_workers=3)
+        times = sorted(t for _, t in session.starts)
+        assert times[-1] - times[0] >= 0.09
+
+    def test_other_hosts_not_throttled(self, tmp_path):
+        session = FakeSession(delay=0)
+        dl = make_downloader(session, rate_limit_sec=1.0)
+        urls = [f"https://iso{i}.example.com/plan.pdf" for i in range(3)]
+        started = time.monotonic()
+        dl.download_many(urls, tmp_path, max_workers=3)
+        assert time.monotonic() - started < 0.5
+
+
+class TestRegistryIndexes:
+    def test_accessors_match_linear_scan(self):
+        sources = iso_planning.ISO_PLANNING_SOURCES
+        for iso in iso_planning.ISOCode:
+            assert iso_planning.get_sources_for_iso(iso.value) == [
+                s for s in sources if s.iso_code == iso.value
+            ]
+        for cat in {c for s in sources for c in s.categories}:
+            assert iso_planning.get_sources_by_category(cat) == [
+                s for s in sources if cat in s.categories
+            ]
+        for fmt in {s.format for s in sources}:
+            assert iso_planning.get_sources_by_format(fmt) == [
+                s for s in sources if s.format == fmt
+            ]
+        assert iso_planning.get_downloadable_datasets() == [
+            s for s in sources if s.data_type == "dataset"
+        ]
+
+    def test_enum_member_lookup(self):
+        assert iso_planning.get_sources_for_iso(iso_planning.ISOCode.ISONE) == (
+            iso_planning.get_sources_for_iso("ISO-NE")
+        )
+        assert iso_planning.get_sources_for_iso("ISO-NE")
+
+    def test_unknown_keys_are_empty(self):
+        assert iso_planning.get_sources_for_iso("NOPE") == []
+        assert iso_planning.get_sources_by_category("nope") == []
+
+    def test_returned_lists_are_copies(self):
+        iso_planning.get_sources_by_format("pdf").clear()
+        assert iso_planning.get_sources_by_format("pdf")
+
+
+class TestImmutableRecords:
+    def test_sources_are_frozen_and_hashable(self):
+        source = iso_planning.ISO_PLANNING_SOURCES[0]
+        assert isinstance(source.categories, tuple)
+        with pytest.raises(dataclasses.FrozenInstanceError):
+            source.name = "x"
+        assert len(set(iso_planning.ISO_PLANNING_SOURCES)) == len(iso_planning.ISO_PLANNING_SOURCES)
+
+    def test_no_instance_dict(self):
+        assert not hasattr(iso_planning.ISO_PLANNING_SOURCES[0], "__dict__")
+
+
+class TestConditionalDownload:
+    URL = "https://a.example.com/queue.xlsx"
+
+    def test_unchanged_file_revalidated_with_etag(self, tmp_path):
+        session = FakeSession(delay=0)
+        session.etag = '"v1"'
+        dl = make_downloader(session)
+        path = dl.download(self.URL, tmp_path)
+        mtime = path.stat().st_mtime_ns
+        assert dl.download(self.URL, tmp_path) == path
+        assert session.headers[1] == {"If-None-Match": '"v1"'}
+        assert path.stat().st_mtime_ns == mtime
+
+    def test_changed_file_refetched(self, tmp_path):
+        session = FakeSession(delay=0)
+        session.etag = '"v1"'
+        dl = make_downloader(session)
+        path = dl.download(self.URL, tmp_path)
+        session.etag = '"v2"'
+        dl.download(self.URL, tmp_path)
+        assert len(session.starts) == 2
+        assert json.loads((tmp_path / "queue.xlsx.meta.json").read_text())["etag"] == '"v2"'
+        assert path.read_bytes() == self.URL.encode()
+
+    def test_file_without_sidecar_is_reused(self, tmp_path):
+        (tmp_path / "queue.xlsx").write_bytes(b"old")
+        session = FakeSession(delay=0)
+        assert make_downloader(session).download(self.URL, tmp_path).read_bytes() == b"old"
+        assert session.starts == []
+
+    def test_index_keys_interned(self):
+        built = iso_planning.PlanningDataSource(
+            iso_code="".join(["ISO", "-NE"]), name="n", description="d", url="u",
+            data_type="report", format="pdf", frequency="annual",
+            categories=["".join(["load_", "forecast"])],
+        )
+        registry = iso_planning.get_sources_for_iso("ISO-NE")[0]
+        assert built.iso_code is registry.iso_code
+        assert built.categories == ("load_forecast",)
+        assert built.categories[0] is sys.intern("load_forecast")
+
+
+class FlakyHandler(BaseHTTPRequestHandler):
+    """Answers 429 with Retry-After until `failures` runs out, then 200."""
+
+    failures = 0
+    hits = 0
+
+    def do_GET(self):
+        type(self).hits += 1
+        if type(self).failures > 0:
+            type(self).failures -= 1
+            self.send_response(429)
+            self.send_header("Retry-After", "0")
+            self.send_header("Content-Length", "0")
+            self.end_headers()
+            return
+        body = b"queue data"
+        self.send_response(200)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+
+@pytest.fixture
+def flaky_server():
+    server = ThreadingHTTPServer(("127.0.0.1", 0), FlakyHandler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield server
+    server.shutdown()
+    server.server_close()
+
+
+class TestRetryingSession:
+    def test_session_uses_download_retry(self):
+        dl = ISOPlanningDownloader()
+        assert dl.session is None
+        adapter = dl._get_session().get_adapter("https://www.caiso.com/")
+        assert adapter.max_retries is _http.DOWNLOAD_RETRY
+        assert adapter.max_retries.respect_retry_after_header
+
+    def test_retries_through_429(self, tmp_path, flaky_server, monkeypatch):
+        # Retry-After: 0 falls through to the backoff; drop it to keep the test fast
+        monkeypatch.setattr(
+            _http, "DOWNLOAD_RETRY", _http.DOWNLOAD_RETRY.new(backoff_factor=0, backoff_jitter=0),
+        )
+        FlakyHandler.failures, FlakyHandler.hits = 2, 0
+        dl = ISOPlanningDownloader(rate_limit_sec=0)
+        url = f"http://127.0.0.1:{flaky_server.server_port}/queue.csv"
+        path = dl.download(url, tmp_path)
+        assert path.read_bytes() == b"queue data"
+        assert FlakyHandler.hits == 3
@@ -0,0 +1,537 @@
+"""Tests for adapters.document_parser.llm_extractor request building and parsing."""
+
+import sys
+from pathlib import Path
+from types import SimpleNamespace
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from adapters.document_parser import llm_extractor
+from adapters.document_parser.base import Confidence, ExtractedData, ExtractionType
+from adapters.document_parser.extraction_prompts import PROMPTS, SYSTEM_PROMPT
+from adapters.document_parser.semantic_cache import embed_text
+
+
+@pytest.fixture(autouse=True)
+def _clear_extraction_cache():
+    llm_extractor._EXTRACTION_CACHE.clear()
+    llm_extractor._SEMANTIC_CACHE.clear()
+    yield
+    llm_extractor._EXTRACTION_CACHE.clear()
+    llm_extractor._SEMANTIC_CACHE.clear()
+
+
+def _request(extraction_type, text="Peak demand 1,200 MW in 2030.", utility="PG&E"):
+    return llm_extractor._build_request(
+        text, PROMPTS[extraction_type], utility, llm_extractor.DEFAULT_MODEL, 4096,
+    )
+
+
+class TestBuildRequest:
+    def test_system_prompt_is_cached_block(self):
+        req = _request("load_forecast")
+        assert req["system"] == [
+            {"type": "text", "text": SYSTEM_PROMPT, "cache_control": {"type": "ephemeral"}},
+        ]
+
+    def test_document_block_is_shared_prefix_across_types(self):
+        a = _request("load_forecast")["messages"][0]["content"]
+        b = _request("grid_constraint")["messages"][0]["content"]
+
+        assert a[0] == b[0]
+        assert a[0]["cache_control"] == {"type": "ephemeral"}
+        assert "Utility: PG&E" in a[0]["text"]
+        assert a[1] == {"type": "text", "text": PROMPTS["load_forecast"]}
+        assert b[1] == {"type": "text", "text": PROMPTS["grid_constraint"]}
+
+    def test_no_utility_line_without_name(self):
+        req = _request("general_summary", utility=None)
+        assert req["messages"][0]["content"][0]["text"].startswith("Document text:")
+
+
+def _message(text):
+    return SimpleNamespace(content=[SimpleNamespace(text=text)], usage=None)
+
+
+class _Stream:
+    """Context manager standing in for client.messages.stream(...)."""
+
+    def __init__(self, message):
+        self.message = message
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+    def get_final_message(self):
+        return self.message
+
+
+class _FakeBatches:
+    """Message Batches endpoint that ends after `polls` retrievals."""
+
+    def __init__(self, replies, polls=1, fail_types=()):
+        self.replies = replies
+        self.polls = polls
+        self.fail_types = set(fail_types)
+        self.submitted = None
+        self.retrievals = 0
+        self.creates = 0
+        self.cancelled = []
+
+    def create(self, requests):
+        self.creates += 1
+        self.submitted = requests
+        return SimpleNamespace(id="batch_1", processing_status="in_progress")
+
+    def retrieve(self, batch_id):
+        self.retrievals += 1
+        status = "ended" if self.retrievals >= self.polls else "in_progress"
+        return SimpleNamespace(id=batch_id, processing_status=status)
+
+    def cancel(self, batch_id):
+        self.cancelled.append(batch_id)
+
+    def results(self, batch_id):
+        for req in self.submitted:
+            etype = req["custom_id"]
+            if etype in self.fail_types:
+                yield SimpleNamespace(custom_id=etype, result=SimpleNamespace(type="errored"))
+            else:
+                yield SimpleNamespace(
+                    custom_id=etype,
+                    result=SimpleNamespace(type="succeeded", message=_message(self.replies[etype])),
+                )
+
+
+class _FakeClient:
+    def __init__(self, batches):
+        self.messages = SimpleNamespace(batches=batches, stream=self._stream)
+        self.single_calls = []
+
+    def _stream(self, **params):
+        self.single_calls.append(params)
+        return _Stream(_message('{"summary": "ok"}'))
+
+
+class TestExtractMany:
+    REPLIES = {
+        "grid_constraint": '```json\n{"constraints": [{"location_name": "A", "constraint_type": "thermal"}]}\n```',
+        "general_summary": '{"summary": "ok"}',
+    }
+
+    def test_one_batch_for_all_types(self, monkeypatch):
+        batches = _FakeBatches(self.REPLIES, polls=2)
+        monkeypatch.setattr(llm_extractor, "_anthropic_client", lambda: _FakeClient(batches))
+
+        out = llm_extractor.extract_many_with_llm(
+            "doc text", ["grid_constraint", "general_summary"], poll_interval=0,
+        )
+
+        assert [r["custom_id"] for r in batches.submitted] == ["grid_constraint", "general_summary"]
+        assert batches.retrievals == 2
+        assert out["grid_constraint"].confidence == Confidence.MEDIUM
+        assert out["general_summary"].data == {"summary": "ok"}
+
+    def test_failed_entry_is_none(self, monkeypatch):
+        batches = _FakeBatches(self.REPLIES, fail_types={"general_summary"})
+        monkeypatch.setattr(llm_extractor, "_anthropic_client", lambda: _FakeClient(batches))
+
+        out = llm_extractor.extract_many_with_llm(
+            "doc text", ["grid_constraint", "general_summary"], poll_interval=0,
+        )
+
+        assert out["general_summary"] is None
+        assert out["grid_constraint"] is not None
+
+    def test_bad_entry_does_not_drop_rest_of_batch(self):
+        replies = {"grid_constraint": "[1, 2]", "general_summary": '{"summary": "ok"}'}
+        batches = _FakeBatches(replies)
+        out = llm_extractor._run_batch(
+            _FakeClient(batches), "doc text", ["grid_constraint", "general_summary"],
+            None, "m", 1024, poll_interval=0, timeout=60,
+        )
+        assert out["grid_constraint"] is None
+        assert out["general_summary"].data == {"summary": "ok"}
+
+    def test_malformed_message_skips_only_that_entry(self):
+        batches = _FakeBatches(self.REPLIES)
+        results = batches.results
+
+        def broken_first(batch_id):
+            entries = list(results(batch_id))
+            entries[0].result.message = SimpleNamespace(content=[], usage=None)
+            return entries
+
+        batches.results = broken_first
+        out = llm_extractor._run_batch(
+            _FakeClient(batches), "doc text", ["grid_constraint", "general_summary"],
+            None, "m", 1024, poll_interval=0, timeout=60,
+        )
+        assert out["grid_constraint"] is None
+        assert out["general_summary"].data == {"summary": "ok"}
+
+    def test_timed_out_batch_falls_back_per_type(self, monkeypatch):
+        batches = _FakeBatches(self.REPLIES, polls=10**9)
+        client = _FakeClient(batches)
+        monkeypatch.setattr(llm_extractor, "_anthropic_client", lambda: client)
+
+        out = llm_extractor.extract_many_with_llm(
+            "doc text", ["grid_constraint", "general_summary"], poll_interval=0, timeout=0,
+        )
+
+        # The fast round runs type by type; the escalated type does not wait
+        # on a second batch
+        assert batches.cancelled == ["batch_1"]
+        assert batches.creates == 1
+        assert [c["model"] for c in client.single_calls] == [
+            llm_extractor.FAST_MODEL, llm_extractor.FAST_MODEL, llm_extractor.DEFAULT_MODEL,
+        ]
+        assert out["general_summary"].data == {"summary": "ok"}
+
+    def test_single_type_skips_batch(self, monkeypatch):
+        batches = _FakeBatches(self.REPLIES)
+        client = _FakeClient(batches)
+        monkeypatch.setattr(llm_extractor, "_anthropic_client", lambda: client)
+
+        out = llm_extractor.extract_many_with_llm("doc text", ["general_summary", "bogus"])
+
+        assert batches.submitted is None
+        assert len(client.single_calls) == 1
+        assert out["general_summary"].data == {"summary": "ok"}
+        assert out["bogus"] is None
+
+
+class _ModelClient:
+    """Messages endpoint replying per model; records the models called."""
+
+    def __init__(self, replies_by_model):
+        self.replies_by_model = replies_by_model
+        self.models = []
+        self.messages = SimpleNamespace(stream=self._stream)
+
+    def _stream(self, **params):
+        self.models.append(params["model"])
+        return _Stream(_message(self.replies_by_model[params["model"]]))
+
+
+class TestModelCascade:
+    LOW = '{"constraints": []}'
+    GOOD = '{"constraints": [{"location_name": "A", "constraint_type": "thermal"}]}'
+
+    def _run(self, monkeypatch, replies, **kwargs):
+        client = _ModelClient(replies)
+        monkeypatch.setattr(llm_extractor, "_anthropic_client", lambda: client)
+        return client, llm_extractor.extract_with_llm("doc text", "grid_constraint", **kwargs)
+
+    def test_confident_fast_result_is_kept(self, monkeypatch):
+        client, out = self._run(monkeypatch, {llm_extractor.FAST_MODEL: self.GOOD})
+        assert client.models == [llm_extractor.FAST_MODEL]
+        assert out.llm_model == llm_extractor.FAST_MODEL
+
+    def test_low_confidence_escalates(self, monkeypatch):
+        client, out = self._run(monkeypatch, {
+            llm_extractor.FAST_MODEL: self.LOW,
+            llm_extractor.DEFAULT_MODEL: self.GOOD,
+        })
+        assert client.models == [llm_extractor.FAST_MODEL, llm_extractor.DEFAULT_MODEL]
+        assert out.llm_model == llm_extractor.DEFAULT_MODEL
+        assert out.notes.startswith("escalated")
+
+    def test_invalid_json_escalates(self, monkeypatch):
+        client, out = self._run(monkeypatch, {
+            llm_extractor.FAST_MODEL: "not json",
+            llm_extractor.DEFAULT_MODEL: self.GOOD,
+        })
+        assert out.llm_model == llm_extractor.DEFAULT_MODEL
+
+    def test_pinned_model_skips_cascade(self, monkeypatch):
+        client, out = self._run(monkeypatch, {"pinned": self.LOW}, model="pinned")
+        assert client.models == ["pinned"]
+        assert out.confidence == Confidence.LOW
+
+    def test_batch_escalates_low_types_in_second_batch(self, monkeypatch):
+        submitted = []
+
+        class _Batches(_FakeBatches):
+            def create(self, requests):
+                submitted.append([(r["custom_id"], r["params"]["model"]) for r in requests])
+                self.replies = {
+                    r["custom_id"]: (self.LOW if r["params"]["model"] == llm_extractor.FAST_MODEL
+                                     and r["custom_id"] == "grid_constraint" else self.GOOD)
+                    for r in requests
+                }
+                return super().create(requests)
+
+        _Batches.LOW = self.LOW
+        _Batches.GOOD = self.GOOD
+        batches = _Batches({})
+        monkeypatch.setattr(llm_extractor, "_anthropic_client", lambda: _FakeClient(batches))
+
+        out = llm_extractor.extract_many_with_llm(
+            "doc text", ["grid_constraint", "general_summary"], poll_interval=0,
+        )
+
+        assert submitted == [
+            [("grid_constraint", llm_extractor.FAST_MODEL), ("general_summary", llm_extractor.FAST_MODEL)],
+            [("grid_constraint", llm_extractor.DEFAULT_MODEL)],
+        ]
+        assert out["grid_constraint"].llm_model == llm_extractor.DEFAULT_MODEL
+        assert out["general_summary"].llm_model == llm_extractor.FAST_MODEL
+
+
+class TestParseResponse:
+    def test_invalid_json_returns_none(self):
+        assert llm_extractor._parse_response(
+            _message("no json here"), "general_summary", "doc", "m",
+        ) is None
+
+    def test_non_object_json_returns_none(self):
+        assert llm_extractor._parse_response(
+            _message("[1, 2]"), "general_summary", "doc", "m",
+        ) is None
+
+    def test_non_ascii_values_round_trip(self):
+        out = llm_extractor._parse_response(
+            _message('{"summary": "Puget Sound — 5 MW"}'), "general_summary", "doc", "m",
+        )
+        assert out.data == {"summary": "Puget Sound — 5 MW"}
+
+
+class TestExtractJson:
+    def test_json_fence_preferred(self):
+        text = 'Here:\n```\nnot this\n```\n```json\n{"a": 1}\n```'
+        assert llm_extractor._extract_json(text) == '{"a": 1}'
+
+    def test_plain_fence(self):
+        assert llm_extractor._extract_json('```\n[1, 2]\n```') == "[1, 2]"
+
+    def test_brackets_inside_strings_are_ignored(self):
+        text = 'Result: {"note": "a } and a \\" quote {", "v": [1]} trailing'
+        assert llm_extractor._extract_json(text) == '{"note": "a } and a \\" quote {", "v": [1]}'
+
+    def test_array_before_object(self):
+        assert llm_extractor._extract_json('x [{"a": 1}] y') == '[{"a": 1}]'
+
+    def test_unclosed_fence_falls_back_to_scan(self):
+        assert llm_extractor._extract_json('```json\n{"a": 1}') == '{"a": 1}'
+
+    def test_no_json_returns_text(self):
+        assert llm_extractor._extract_json("nothing") == "nothing"
+
+
+class TestClientCache:
+    @pytest.fixture(autouse=True)
+    def _fake_sdk(self, monkeypatch):
+        created = []
+
+        class _Anthropic:
+            def __init__(self, api_key):
+                self.api_key = api_key
+                created.append(self)
+
+        fake = type(sys)("anthropic")
+        fake.Anthropic = _Anthropic
+        monkeypatch.setitem(sys.modules, "anthropic", fake)
+        llm_extractor._client_for_key.cache_clear()
+        self.created = created
+        yield
+        llm_extractor._client_for_key.cache_clear()
+
+    def test_client_reused_across_calls(self, monkeypatch):
+        monkeypatch.setenv("ANTHROPIC_API_KEY", "k1")
+        assert llm_extractor._anthropic_client() is llm_extractor._anthropic_client()
+        assert len(self.created) == 1
+
+    def test_new_key_builds_new_client(self, monkeypatch):
+        monkeypatch.setenv("ANTHROPIC_API_KEY", "k1")
+        first = llm_extractor._anthropic_client()
+        monkeypatch.setenv("ANTHROPIC_API_KEY", "k2")
+        assert llm_extractor._anthropic_client().api_key == "k2"
+        assert first.api_key == "k1"
+
+    def test_missing_key(self, monkeypatch):
+        monkeypatch.delenv("ANTHROPIC_API_KEY", raising=False)
+        assert llm_extractor._anthropic_client() is None
+
+
+class _StatusError(Exception):
+    def __init__(self, status_code, retry_after=None):
+        super().__init__(f"HTTP {status_code}")
+        self.status_code = status_code
+        headers = {"retry-after": retry_after} if retry_after is not None else {}
+        self.response = SimpleNamespace(headers=headers)
+
+
+class _FlakyClient:
+    """Stream endpoint raising the queued errors before succeeding."""
+
+    def __init__(self, errors):
+        self.errors = list(errors)
+        self.calls = 0
+        self.messages = SimpleNamespace(stream=self._stream)
+
+    def _stream(self, **params):
+        self.calls += 1
+        if self.errors:
+            raise self.errors.pop(0)
+        return _Stream(_message('{"summary": "ok"}'))
+
+
+class TestRetry:
+    @pytest.fixture(autouse=True)
+    def _no_sleep(self, monkeypatch):
+        self.sleeps = []
+        monkeypatch.setattr(llm_extractor.time, "sleep", self.sleeps.append)
+
+    def _extract(self, client):
+        return llm_extractor._extract_once(
+            client, "doc", "general_summary", None, "m", 100,
+        )
+
+    def test_rate_limit_honours_retry_after(self):
+        client = _FlakyClient([_StatusError(429, "2.5"), _StatusError(529)])
+        out = self._extract(client)
+
+        assert out.data == {"summary": "ok"}
+        assert client.calls == 3
+        assert self.sleeps == [2.5, 4.0]
+
+    def test_timeouts_back_off(self):
+        client = _FlakyClient([TimeoutError("slow")])
+        assert self._extract(client) is not None
+        assert self.sleeps == [1.0]
+
+    def test_gives_up_after_max_retries(self):
+        client = _FlakyClient([_StatusError(429)] * 10)
+        assert self._extract(client) is None
+        assert client.calls == llm_extractor.LLM_MAX_RETRIES + 1
+        assert self.sleeps == [1.0, 4.0, 16.0]
+
+    def test_client_errors_are_not_retried(self):
+        client = _FlakyClient([_StatusError(400)])
+        assert self._extract(client) is None
+        assert client.calls == 1
+        assert self.sleeps == []
+
+
+class TestExtractionCache:
+    GOOD = '{"constraints": [{"location_name": "A", "constraint_type": "thermal"}]}'
+
+    def test_repeat_call_served_from_cache(self, monkeypatch):
+        client = _ModelClient({llm_extractor.FAST_MODEL: self.GOOD})
+        monkeypatch.setattr(llm_extractor, "_anthropic_client", lambda: client)
+
+        first = llm_extractor.extract_with_llm("doc text", "grid_constraint")
+        first.data["constraints"].clear()  # caller mutation must not leak into the cache
+        second = llm_extractor.extract_with_llm("doc text", "grid_constraint")
+
+        assert client.models == [llm_extractor.FAST_MODEL]
+        assert len(second.data["constraints"]) == 1
+
+    def test_key_includes_text_and_options(self, monkeypatch):
+        client = _ModelClient({llm_extractor.FAST_MODEL: self.GOOD, "pinned": self.GOOD})
+        monkeypatch.setattr(llm_extractor, "_anthropic_client", lambda: client)
+
+        llm_extractor.extract_with_llm("doc text", "grid_constraint")
+        llm_extractor.extract_with_llm("other text", "grid_constraint")
+        llm_extractor.extract_with_llm("doc text", "grid_constraint", utility_name="SCE")
+        llm_extractor.extract_with_llm("doc text", "grid_constraint", model="pinned")
+
+        assert len(client.models) == 4
+
+    def test_failures_not_cached(self, monkeypatch):
+        client = _ModelClient({
+            llm_extractor.FAST_MODEL: "not json", llm_extractor.DEFAULT_MODEL: "not json",
+        })
+        monkeypatch.setattr(llm_extractor, "_anthropic_client", lambda: client)
+
+        assert llm_extractor.extract_with_llm("doc text", "grid_constraint") is None
+        assert llm_extractor.extract_with_llm("doc text", "grid_constraint") is None
+        assert len(client.models) == 4
+
+    def test_batch_only_submits_uncached_types(self, monkeypatch):
+        client = _ModelClient({llm_extractor.FAST_MODEL: self.GOOD})
+        monkeypatch.setattr(llm_extractor, "_anthropic_client", lambda: client)
+        llm_extractor.extract_with_llm("doc text", "grid_constraint")
+
+        out = llm_extractor.extract_many_with_llm(
+            "doc text", ["grid_constraint", "general_summary"],
+        )
+
+        # general_summary alone is left, so it goes through a single call
+        assert client.models == [llm_extractor.FAST_MODEL, llm_extractor.FAST_MODEL]
+        assert out["grid_constraint"] is not None
+        assert out["general_summary"] is not None
+
+    def test_lru_eviction(self, monkeypatch):
+        monkeypatch.setattr(llm_extractor, "EXTRACTION_CACHE_SIZE", 2)
+        client = _ModelClient({llm_extractor.FAST_MODEL: self.GOOD})
+        monkeypatch.setattr(llm_extractor, "_anthropic_client", lambda: client)
+
+        for text in ("a", "b", "c", "a"):
+            llm_extractor.extract_with_llm(text, "grid_constraint")
+
+        assert len(client.models) == 4
+        assert len(llm_extractor._EXTRACTION_CACHE) == 2
+
+
+class TestSemanticCache:
+    GOOD = TestExtractionCache.GOOD
+    FILING = " ".join(f"paragraph {i} describes feeder {i % 37} loading" for i in range(400))
+
+    def test_near_duplicate_reuses_extraction(self, monkeypatch):
+        client = _ModelClient({llm_extractor.FAST_MODEL: self.GOOD})
+        monkeypatch.setattr(llm_extractor, "_anthropic_client", lambda: client)
+
+        llm_extractor.extract_with_llm(self.FILING, "grid_constraint")
+        hit = llm_extractor.extract_with_llm(self.FILING + " updated for 2025", "grid_constraint")
+
+        assert client.models == [llm_extractor.FAST_MODEL]
+        assert hit.notes == (
+            f"Extracted via {llm_extractor.FAST_MODEL}; {llm_extractor.SEMANTIC_HIT_NOTE}"
+        )
+        assert hit.confidence == Confidence.UNVERIFIED
+        assert len(hit.data["constraints"]) == 1
+
+    def test_hit_keeps_existing_notes(self, monkeypatch):
+        monkeypatch.setattr(llm_extractor, "_anthropic_client", lambda: None)
+        key = llm_extractor._cache_key(self.FILING, "grid_constraint", None, None, 4096)
+        stored = ExtractedData(
+            extraction_type=ExtractionType.GRID_CONSTRAINT, data={"constraints": []},
+            confidence=Confidence.HIGH, notes="escalated",
+        )
+        llm_extractor._SEMANTIC_CACHE.add(key[1:], embed_text(self.FILING), stored)
+
+        hit = llm_extractor.extract_with_llm(self.FILING + " errata", "grid_constraint")
+
+        assert hit.notes == f"escalated; {llm_extractor.SEMANTIC_HIT_NOTE}"
+        assert hit.confidence == Confidence.UNVERIFIED
+        assert stored.notes == "escalated"
+
+    def test_flag_disables_near_duplicate_lookup(self, monkeypatch):
+        monkeypatch.setattr(llm_extractor, "SEMANTIC_CACHE_ENABLED", False)
+        client = _ModelClient({llm_extractor.FAST_MODEL: self.GOOD})
+        monkeypatch.setattr(llm_extractor, "_anthropic_client", lambda: client)
+
+        llm_extractor.extract_with_llm(self.FILING, "grid_constraint")
+        miss = llm_extractor.extract_with_llm(self.FILING + " errata", "grid_constraint")
+
+        assert client.models == [llm_extractor.FAST_MODEL] * 2
+        assert llm_extractor.SEMANTIC_HIT_NOTE not in miss.notes
+        assert len(llm_extractor._SEMANTIC_CACHE) == 0
+
+    def test_unrelated_text_or_other_type_misses(self, monkeypatch):
+        client = _ModelClient({llm_extractor.FAST_MODEL: self.GOOD})
+        monkeypatch.setattr(llm_extractor, "_anthropic_client", lambda: client)
+
+        llm_extractor.extract_with_llm(self.FILING, "grid_constraint")
+        llm_extractor.extract_with_llm(self.FILING + " v2", "load_forecast")
+        other = " ".join(f"rate schedule {i} tariff {i * 7}" for i in range(400))
+        llm_extractor.extract_with_llm(other, "grid_constraint")
+
+        assert client.models.count(llm_extractor.FAST_MODEL) == 3
@@ -0,0 +1,159 @@
+"""Tests for adapters.document_parser.pdf_parser helpers (no PDF libraries needed)."""
+
+import contextlib
+import sys
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from types import SimpleNamespace
+
+import pandas as pd
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from adapters.document_parser import pdf_parser
+
+
+class TestPageRanges:
+    def test_even_split(self):
+        assert pdf_parser._page_ranges(16, 4) == [(0, 4), (4, 8), (8, 12), (12, 16)]
+
+    def test_remainder_goes_to_last_range(self):
+        assert pdf_parser._page_ranges(10, 4) == [(0, 3), (3, 6), (6, 9), (9, 10)]
+
+    def test_fewer_pages_than_workers(self):
+        assert pdf_parser._page_ranges(3, 8) == [(0, 1), (1, 2), (2, 3)]
+
+    def test_no_pages(self):
+        assert pdf_parser._page_ranges(0, 4) == []
+
+
+class TestPageTexts:
+    def test_labels_use_absolute_page_numbers_and_skip_blank_pages(self):
+        pages = [SimpleNamespace(extract_text=lambda t=t: t) for t in ["a", "", "c", "d"]]
+        pdf = SimpleNamespace(pages=pages)
+
+        assert pdf_parser._page_texts(pdf, 1, 3) == ["--- Page 3 ---\nc"]
+        assert pdf_parser._page_texts(pdf, 0, 4) == [
+            "--- Page 1 ---\na", "--- Page 3 ---\nc", "--- Page 4 ---\nd",
+        ]
+
+
+class TestRawTableValidity:
+    def test_agrees_with_dataframe_check(self):
+        tables = [
+            [["a", "b"], ["1", "2"], ["3", "4"]],
+            [["a", "b"], ["1", "2"]],                      # one data row
+            [["a"], ["1"], ["2"]],                          # one column
+            [["a", "b", "c"], ["1", None, None], [None, None, None]],  # ~17% filled
+            [["a", "b", "c"], ["1", "", None], ["", None, None]],      # "" is not null
+        ]
+        for table in tables:
+            df = pd.DataFrame(table[1:], columns=table[0])
+            assert pdf_parser._is_valid_raw_table(table) == pdf_parser._is_valid_table(df), table
+
+
+def _fake_pdf(page_texts, page_tables=None):
+    page_tables = page_tables or [[] for _ in page_texts]
+    pages = [
+        SimpleNamespace(extract_text=lambda t=t: t, extract_tables=lambda tb=tb: tb)
+        for t, tb in zip(page_texts, page_tables)
+    ]
+    return SimpleNamespace(pages=pages)
+
+
+class TestOpenHandle:
+    def test_text_from_open_respects_max_pages(self):
+        pdf = _fake_pdf(["one", "two", "three"])
+        parts, page_count = pdf_parser._text_from_open(pdf, Path("x.pdf"), max_pages=2)
+        assert page_count == 3
+        assert parts == ["--- Page 1 ---\none", "--- Page 2 ---\ntwo"]
+
+    def test_tables_from_open_numbers_valid_tables(self):
+        good = [["Year", "MW"], ["2030", "100"], ["2031", "110"]]
+        sparse = [["a", "b"], [None, None], ["1", None]]
+        pdf = _fake_pdf(["", ""], [[sparse, good], [good]])
+
+        tables = pdf_parser._tables_from_open(pdf)
+
+        assert [(t.page_number, t.table_index) for t in tables] == [(1, 0), (2, 1)]
+        assert list(tables[0].df.columns) == ["Year", "MW"]
+        assert tables[0].source_method == "pdfplumber"
+
+    def test_blank_header_cells_get_positional_names(self):
+        table = [["Year", None, " MW "], ["2030", "x", "100"], ["2031", "y", "110"]]
+        (parsed,) = pdf_parser._tables_from_open(_fake_pdf([""], [[table]]))
+        assert list(parsed.df.columns) == ["Year", "col_1", "MW"]
+        assert parsed.df.values.tolist() == [["2030", "x", "100"], ["2031", "y", "110"]]
+
+
+class TestParallelText:
+    def test_pool_shared_and_not_forked(self, monkeypatch):
+        monkeypatch.setattr(pdf_parser, "_text_pool", None)
+        pool = pdf_parser._get_text_pool()
+        try:
+            assert pdf_parser._get_text_pool() is pool
+            assert pool._mp_context.get_start_method() in ("forkserver", "spawn")
+            assert pool._max_workers == pdf_parser.TEXT_PROCESSES
+        finally:
+            pool.shutdown()
+
+    def test_workers_get_caller_bytes(self, monkeypatch):
+        opened = []
+
+        def fake_open(source):
+            opened.append(source.getvalue() if hasattr(source, "getvalue") else source)
+            return contextlib.nullcontext(_fake_pdf([f"p{i}" for i in range(12)]))
+
+        monkeypatch.setattr(pdf_parser, "pdfplumber", SimpleNamespace(open=fake_open))
+        monkeypatch.setattr(pdf_parser, "_get_text_pool", lambda: ThreadPoolExecutor(max_workers=4))
+        monkeypatch.setattr(pdf_parser, "TEXT_PROCESSES", 4)
+        parts, page_count = pdf_parser._text_from_open(
+            _fake_pdf([f"p{i}" for i in range(12)]), Path("x.pdf"), None, b"%PDF",
+        )
+        assert page_count == 12
+        assert parts == [f"--- Page {i + 1} ---\np{i}" for i in range(12)]
+        assert opened == [b"%PDF"] * 4
+
+
+class TestTabula:
+    TABLE = pd.DataFrame({"a": ["1", "2"], "b": ["3", "4"]})
+
+    def _fake_tabula(self, monkeypatch, by_mode):
+        calls = []
+
+        def read_pdf(path, pages, multiple_tables, silent, **mode):
+            (name,) = mode
+            calls.append(name)
+            result = by_mode[name]
+            if isinstance(result, Exception):
+                raise result
+            return result
+
+        monkeypatch.setattr(pdf_parser, "tabula", SimpleNamespace(read_pdf=read_pdf))
+        return calls
+
+    def test_lattice_preferred(self, monkeypatch):
+        self._fake_tabula(monkeypatch, {"lattice": [self.TABLE], "stream": [self.TABLE]})
+        tables = pdf_parser._extract_tables_tabula(Path("x.pdf"))
+        assert [t.source_method for t in tables] == ["tabula_lattice"]
+
+    def test_stream_when_lattice_empty_or_fails(self, monkeypatch):
+        for lattice in ([], RuntimeError("jvm")):
+            calls = self._fake_tabula(monkeypatch, {"lattice": lattice, "stream": [self.TABLE]})
+            tables = pdf_parser._extract_tables_tabula(Path("x.pdf"))
+            assert [t.source_method for t in tables] == ["tabula_stream"]
+            assert sorted(calls) == ["lattice", "stream"]
+
+
+class TestTableValidity:
+    def test_mostly_empty_rejected(self):
+        df = pd.DataFrame({"a": ["1", None, None, None], "b": [None] * 4})
+        assert not pdf_parser._is_valid_table(df)
+
+    def test_mixed_dtypes_accepted(self):
+        df = pd.DataFrame({"a": [1.0, float("nan")], "b": ["x", "y"], "c": [None, 3]})
+        assert pdf_parser._is_valid_table(df)
+
+    def test_too_small_rejected(self):
+        assert not pdf_parser._is_valid_table(pd.DataFrame({"a": [1, 2]}))
+        assert not pdf_parser._is_valid_table(pd.DataFrame({"a": [1], "b": [2]}))
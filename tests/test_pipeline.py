@@ -0,0 +1,69 @@
+"""Tests for adapters.document_parser.pipeline document orchestration."""
+
+import sys
+import threading
+import time
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from adapters.document_parser import excel_parser, pipeline
+from adapters.document_parser.base import DocumentCategory
+
+
+@pytest.fixture(autouse=True)
+def _no_parse_cache(monkeypatch):
+    monkeypatch.setattr(excel_parser, "PARSE_CACHE_DIR", None)
+
+
+def _csv(tmp_path, name, rows):
+    path = tmp_path / name
+    path.write_text("year,peak_demand_mw\n" + "".join(f"{2030 + i},{100 + i}\n" for i in range(rows)))
+    return path
+
+
+class TestParseDocuments:
+    def test_results_in_input_order(self, tmp_path):
+        paths = [_csv(tmp_path, f"f{i}.csv", rows=i + 2) for i in range(5)]
+
+        results = pipeline.parse_documents(paths, concurrency=3)
+
+        assert [r.file_path for r in results] == [str(p) for p in paths]
+        assert all(r.category == DocumentCategory.TABULAR_EXCEL for r in results)
+        assert [len(r.tables[0].df) for r in results] == [2, 3, 4, 5, 6]
+
+    def test_documents_overlap(self, tmp_path, monkeypatch):
+        active = 0
+        peak = 0
+        lock = threading.Lock()
+
+        def slow_parse(file_path, **kwargs):
+            nonlocal active, peak
+            with lock:
+                active += 1
+                peak = max(peak, active)
+            time.sleep(0.02)
+            with lock:
+                active -= 1
+            return pipeline.DocumentParseResult(file_path=str(file_path))
+
+        monkeypatch.setattr(pipeline, "parse_document", slow_parse)
+        pipeline.parse_documents([tmp_path / f"{i}.pdf" for i in range(6)], concurrency=3)
+
+        assert 1 < peak <= 3
+
+    def test_exception_becomes_failed_result(self, tmp_path, monkeypatch):
+        def boom(file_path, **kwargs):
+            raise RuntimeError("bad file")
+
+        monkeypatch.setattr(pipeline, "parse_document", boom)
+        (result,) = pipeline.parse_documents([tmp_path / "x.pdf"])
+
+        assert result.status == "failed"
+        assert "bad file" in result.errors[0]
+
+    def test_missing_file(self, tmp_path):
+        (result,) = pipeline.parse_documents([tmp_path / "missing.csv"])
+        assert result.status == "failed"
@@ -0,0 +1,275 @@
+"""Tests for adapters.federal_data.pudl_client (no network)."""
+
+import dataclasses
+import io
+import json
+import re
+import sqlite3
+import subprocess
+import sys
+import threading
+from pathlib import Path
+
+import pyarrow as pa
+import pytest
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from adapters.federal_data import _http, pudl_client
+from adapters.federal_data.pudl_client import PUDLClient
+
+BODY = bytes(range(256)) * 400  # 102,400 bytes
+
+
+class FakeResponse:
+    def __init__(self, body: bytes = b"", status_code: int = 200, headers=None):
+        self.body = body
+        self.raw = io.BytesIO(body)
+        self.status_code = status_code
+        self.headers = headers or {}
+
+    def raise_for_status(self):
+        if self.status_code >= 400:
+            raise RuntimeError(f"HTTP {self.status_code}")
+
+    def close(self):
+        pass
+
+    def iter_content(self, chunk_size=8192):
+        for i in range(0, len(self.body), chunk_size):
+            yield self.body[i:i + chunk_size]
+
+
+class FakeSession:
+    """Serves BODY, honouring Range headers only when ranges=True.
+
+    change_after switches the ETag to "v2" after that many range GETs, so
+    later ranges fail If-Range and get the full body back as a 200.
+    """
+
+    def __init__(self, ranges: bool = True, truncate_at=None, change_after=None, reported_total=None):
+        self.ranges = ranges
+        self.truncate_at = truncate_at
+        self.change_after = change_after
+        self.reported_total = reported_total
+        self.lock = threading.Lock()
+        self.gets: list[dict] = []
+        self.heads: list[dict] = []
+        self.etag = '"v1"'
+
+    def head(self, url, headers=None, timeout=None, allow_redirects=False):
+        self.heads.append(headers)
+        if (headers or {}).get("If-None-Match") == self.etag:
+            return FakeResponse(status_code=304)
+        headers = {"content-length": str(len(BODY)), "etag": self.etag}
+        if self.ranges:
+            headers["accept-ranges"] = "bytes"
+        return FakeResponse(headers=headers)
+
+    def get(self, url, headers=None, timeout=None, stream=False):
+        headers = headers or {}
+        with self.lock:
+            self.gets.append(headers)
+            if self.change_after is not None and len(self.gets) > self.change_after:
+                self.etag = '"v2"'
+        m = re.fullmatch(r"bytes=(\d+)-(\d+)", headers.get("Range", ""))
+        if m and self.ranges and headers.get("If-Range", self.etag) == self.etag:
+            lo, hi = int(m[1]), int(m[2])
+            body = BODY[lo:hi + 1]
+            if self.truncate_at is not None and lo == 0:
+                body = body[:self.truncate_at]
+            total = self.reported_total or len(BODY)
+            return FakeResponse(body, 206, {"content-range": f"bytes {lo}-{hi}/{total}", "etag": self.etag})
+        if headers.get("If-None-Match") == self.etag:
+            return FakeResponse(status_code=304)
+        return FakeResponse(BODY, 200, {"content-length": str(len(BODY)), "etag": self.etag})
+
+
+def make_client(tmp_path, session):
+    client = PUDLClient(data_dir=tmp_path)
+    client.session = session
+    return client
+
+
+@pytest.fixture(autouse=True)
+def small_ranges(monkeypatch):
+    monkeypatch.setattr(pudl_client, "RANGE_MIN_BYTES", 1024)
+
+
+class TestDownloadSqlite:
+    def test_parallel_ranges_reassemble_file(self, tmp_path):
+        session = FakeSession()
+        dest = make_client(tmp_path, session).download_sqlite()
+        assert dest.read_bytes() == BODY
+        assert len(session.gets) == pudl_client.RANGE_PARALLELISM
+        assert all(g["If-Range"] == '"v1"' for g in session.gets)
+        assert not (tmp_path / "pudl.sqlite.part").exists()
+
+    def test_streams_without_accept_ranges(self, tmp_path):
+        session = FakeSession(ranges=False)
+        dest = make_client(tmp_path, session).download_sqlite()
+        assert dest.read_bytes() == BODY
+        assert session.gets == [{}]
+
+    def test_revalidated_with_head(self, tmp_path):
+        session = FakeSession()
+        client = make_client(tmp_path, session)
+        dest = client.download_sqlite()
+        gets = len(session.gets)
+        assert client.download_sqlite() == dest
+        assert session.heads[-1] == {"If-None-Match": '"v1"'}
+        assert len(session.gets) == gets
+
+    def test_changed_remote_refetched(self, tmp_path):
+        session = FakeSession(ranges=False)
+        client = make_client(tmp_path, session)
+        client.download_sqlite()
+        session.etag = '"v2"'
+        assert client.download_sqlite().read_bytes() == BODY
+        assert session.heads[-1] == {"If-None-Match": '"v1"'}
+        assert len(session.gets) == 2
+        assert json.loads((tmp_path / "pudl.sqlite.meta.json").read_text())["etag"] == '"v2"'
+
+    def test_parquet_conditional_get(self, tmp_path):
+        session = FakeSession()
+        client = make_client(tmp_path, session)
+        path = client.download_parquet("core_eia__entity_plants")
+        assert path.read_bytes() == BODY
+        assert client.download_parquet("core_eia__entity_plants") == path
+        assert session.gets[-1] == {"If-None-Match": '"v1"'}
+
+    def test_small_file_streams(self, tmp_path, monkeypatch):
+        monkeypatch.setattr(pudl_client, "RANGE_MIN_BYTES", len(BODY) + 1)
+        session = FakeSession()
+        assert make_client(tmp_path, session).download_sqlite().read_bytes() == BODY
+        assert len(session.gets) == 1
+
+    def test_short_range_fails_cleanly(self, tmp_path):
+        session = FakeSession(truncate_at=10)
+        assert make_client(tmp_path, session).download_sqlite() is None
+        assert list(tmp_path.iterdir()) == []
+
+    def test_remote_changed_mid_download_fails_cleanly(self, tmp_path):
+        session = FakeSession(change_after=1)
+        assert make_client(tmp_path, session).download_sqlite() is None
+        assert list(tmp_path.iterdir()) == []
+
+    def test_content_range_total_mismatch_fails(self, tmp_path):
+        session = FakeSession(reported_total=len(BODY) + 1)
+        assert make_client(tmp_path, session).download_sqlite() is None
+        assert list(tmp_path.iterdir()) == []
+
+    def test_weak_etag_streams(self, tmp_path):
+        session = FakeSession()
+        session.etag = 'W/"v1"'
+        assert make_client(tmp_path, session).download_sqlite().read_bytes() == BODY
+        assert len(session.gets) == 1
+
+    def test_existing_file_not_refetched(self, tmp_path):
+        (tmp_path / "pudl.sqlite").write_bytes(b"db")
+        session = FakeSession()
+        assert make_client(tmp_path, session).download_sqlite() == tmp_path / "pudl.sqlite"
+        assert session.gets == []
+
+
+class TestPriorityTables:
+    def test_frozen_slotted(self):
+        table = pudl_client.PRIORITY_TABLES[0]
+        assert not hasattr(table, "__dict__")
+        with pytest.raises(dataclasses.FrozenInstanceError):
+            table.name = "x"
+
+
+@pytest.fixture
+def pudl_db(tmp_path):
+    db = tmp_path / "pudl.sqlite"
+    conn = sqlite3.connect(db)
+    conn.executescript("""
+        CREATE TABLE core_eia__entity_utilities (utility_id_eia INTEGER, name TEXT, state TEXT);
+        INSERT INTO core_eia__entity_utilities VALUES (1, 'Alpha', 'CA'), (2, 'Beta', 'NY'),
+            (3, 'O''Brien Power', 'CA');
+        CREATE TABLE core_eia__entity_plants (plant_id_eia INTEGER, utility_id_eia INTEGER, state TEXT);
+        INSERT INTO core_eia__entity_plants VALUES (10, 1, 'CA'), (11, 3, 'CA'), (12, 2, 'NY');
+    """)
+    conn.commit()
+    conn.close()
+    client = PUDLClient(data_dir=tmp_path)
+    yield client
+    client.close()
+
+
+class TestQuerySqlite:
+    def test_state_filter_is_parameterized(self, pudl_db):
+        rows = pudl_db.get_utilities(state="CA")
+        assert [r["name"] for r in rows] == ["Alpha", "O'Brien Power"]
+        assert pudl_db.get_utilities(state="CA' OR '1'='1") == []
+
+    def test_plants_filters(self, pudl_db):
+        assert [r["plant_id_eia"] for r in pudl_db.get_plants(state="CA", utility_id=3)] == [11]
+        assert len(pudl_db.get_plants()) == 3
+
+    def test_connection_reused_and_read_only(self, pudl_db):
+        pudl_db.get_utilities()
+        conn = next(iter(pudl_db._conns.values()))
+        pudl_db.get_plants()
+        assert list(pudl_db._conns.values()) == [conn]
+        assert pudl_db.query_sqlite("DELETE FROM core_eia__entity_plants") == []
+        assert len(pudl_db.get_plants()) == 3
+
+    def test_missing_database(self, tmp_path):
+        assert PUDLClient(data_dir=tmp_path).query_sqlite("SELECT 1") == []
+
+
+class TestQueryArrow:
+    def test_matches_dict_rows(self, pudl_db):
+        table = pudl_db.get_utilities(state="CA", return_type="arrow")
+        assert table.to_pylist() == pudl_db.get_utilities(state="CA")
+        assert table.schema.field("utility_id_eia").type == pa.int64()
+
+    def test_batches_promote_null_columns(self, pudl_db, monkeypatch):
+        monkeypatch.setattr(pudl_client, "SQLITE_ARROW_BATCH_ROWS", 1)
+        table = pudl_db.query_arrow(
+            "SELECT plant_id_eia, CASE WHEN plant_id_eia > 10 THEN state END AS s "
+            "FROM core_eia__entity_plants ORDER BY plant_id_eia"
+        )
+        assert table.column("s").to_pylist() == [None, "CA", "NY"]
+        assert table.schema.field("s").type == pa.string()
+
+    def test_empty_result_keeps_columns(self, pudl_db):
+        table = pudl_db.get_plants(state="ZZ", return_type="arrow")
+        assert table.num_rows == 0
+        assert table.column_names == ["plant_id_eia", "utility_id_eia", "state"]
+
+    def test_unknown_return_type(self, pudl_db):
+        with pytest.raises(ValueError):
+            pudl_db.get_plants(return_type="polars")
+
+
+class TestProgress:
+    def test_reports_on_wall_clock_interval(self, tmp_path, monkeypatch, caplog):
+        monkeypatch.setattr(pudl_client, "PROGRESS_INTERVAL_SEC", 0.0)
+        monkeypatch.setattr(_http, "DOWNLOAD_CHUNK_BYTES", 10_000)
+        with caplog.at_level("INFO", logger=pudl_client.__name__):
+            make_client(tmp_path, FakeSession(ranges=False)).download_sqlite()
+        lines = [r.message for r in caplog.records if r.message.startswith("  ")]
+        assert len(lines) == -(-len(BODY) // 10_000)
+        assert lines[-1].endswith("(100%)")
+
+
+class TestLazyImports:
+    def test_registry_import_skips_requests(self):
+        code = (
+            "import sys; "
+            "import adapters.federal_data.iso_planning, adapters.federal_data.pudl_client; "
+            "print('requests' in sys.modules)"
+        )
+        root = Path(__file__).resolve().parent.parent
+        out = subprocess.run([sys.executable, "-c", code], cwd=root, capture_output=True, text=True)
+        assert out.stdout.strip() == "False", out.stderr
+
+    def test_session_built_on_first_use(self, tmp_path):
+        client = PUDLClient(data_dir=tmp_path)
+        assert client.session is None
+        session = client._get_session()
+        assert client._get_session() is session
+        assert "grid-constraint-classifier" in session.headers["User-Agent"]
@@ -0,0 +1,55 @@
+"""Tests for the near-duplicate extraction cache."""
+
+import sys
+from pathlib import Path
+
+import numpy as np
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from adapters.document_parser.semantic_cache import SemanticCache, embed_text
+
+DOC = " ".join(f"substation {i} peak load {i * 3} mw in year {2020 + i % 10}" for i in range(300))
+
+
+class TestEmbedText:
+    def test_unit_norm(self):
+        vec = embed_text(DOC)
+        assert vec.shape == (4096,)
+        assert np.isclose(np.linalg.norm(vec), 1.0, atol=1e-5)
+
+    def test_near_duplicate_is_similar(self):
+        edited = DOC.replace("substation 5 ", "substation five ")
+        assert float(embed_text(DOC) @ embed_text(edited)) > 0.95
+
+    def test_unrelated_is_dissimilar(self):
+        other = " ".join(f"tariff schedule {i} rate {i * 11} cents" for i in range(300))
+        assert abs(float(embed_text(DOC) @ embed_text(other))) < 0.2
+
+    def test_too_short(self):
+        assert embed_text("two words") is None
+
+
+class TestSemanticCache:
+    def test_lookup_within_scope(self):
+        cache = SemanticCache()
+        vec = embed_text(DOC)
+        cache.add("a", vec, {"rows": [1]})
+
+        hit = cache.lookup("a", vec)
+        hit["rows"].append(2)
+        assert cache.lookup("a", vec) == {"rows": [1]}
+        assert cache.lookup("b", vec) is None
+        assert cache.lookup("a", None) is None
+
+    def test_eviction_drops_oldest(self):
+        cache = SemanticCache(max_entries=2)
+        docs = [f"{DOC} {tag} {tag} {tag}" for tag in ("x", "y", "z")]
+        cache.threshold = 1.0 - 1e-6  # only the exact vector matches
+        for i, doc in enumerate(docs):
+            cache.add("a" if i < 2 else "b", embed_text(doc), i)
+
+        assert len(cache) == 2
+        assert cache.lookup("a", embed_text(docs[0])) is None
+        assert cache.lookup("a", embed_text(docs[1])) == 1
+        assert cache.lookup("b", embed_text(docs[2])) == 2
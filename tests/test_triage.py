@@ -0,0 +1,92 @@
+"""Tests for adapters.document_parser.triage classification and relevance."""
+
+import sys
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from adapters.document_parser import triage
+from adapters.document_parser.base import DocumentCategory
+from adapters.document_parser.triage import classify_document, estimate_relevance
+
+PDF = Path("filing.pdf")
+
+PROCEDURAL_TEXT = "Notice of hearing. Motion to compel. Certificate of Service attached."
+FORECAST_TEXT = (
+    "The Distribution Resource Plan presents the load forecast and peak demand "
+    "outlook; the resource plan also covers hosting capacity."
+)
+
+
+class TestKeywordCounter:
+    @pytest.mark.parametrize("use_automaton", [True, False])
+    def test_counts_distinct_and_overlapping_keywords(self, use_automaton, monkeypatch):
+        if use_automaton and triage.ahocorasick is None:
+            pytest.skip("pyahocorasick not installed")
+        if not use_automaton:
+            monkeypatch.setattr(triage, "ahocorasick", None)
+        count = triage._keyword_counter(triage.HIGH_VALUE_KEYWORDS)
+
+        # "resource plan" is nested inside "distribution resource plan";
+        # repeats of "peak demand" count once
+        assert count("distribution resource plan; peak demand, peak demand") == 3
+        assert count("nothing here") == 0
+
+
+class TestClassifyDocument:
+    def test_spreadsheet(self):
+        assert classify_document(Path("data.xlsx")) == DocumentCategory.TABULAR_EXCEL
+
+    def test_procedural(self):
+        assert classify_document(PDF, PROCEDURAL_TEXT, 3) == DocumentCategory.PROCEDURAL
+
+    def test_pipe_table(self):
+        text = "a | b | c\n" * 6
+        assert classify_document(PDF, text, 40) == DocumentCategory.TABULAR_PDF
+
+    def test_units_with_early_digits(self):
+        text = "Table 3: peak load 1,200 MW by 2030"
+        assert classify_document(PDF, text, 40) == DocumentCategory.TABULAR_PDF
+
+    def test_units_without_early_digits(self):
+        text = "peak load in mw" + " narrative" * 60 + " 2030"
+        assert classify_document(PDF, text, 40) == DocumentCategory.NARRATIVE_PDF
+
+    def test_short_high_value_pdf(self):
+        assert classify_document(PDF, FORECAST_TEXT, 10) == DocumentCategory.TABULAR_PDF
+
+    def test_long_narrative(self):
+        assert classify_document(PDF, FORECAST_TEXT, 100) == DocumentCategory.NARRATIVE_PDF
+
+    def test_no_text_uses_page_count(self):
+        assert classify_document(PDF, None, 12) == DocumentCategory.TABULAR_PDF
+        assert classify_document(PDF, None, 80) == DocumentCategory.NARRATIVE_PDF
+        assert classify_document(PDF) == DocumentCategory.UNKNOWN
+
+
+class TestEstimateRelevance:
+    def test_keywords_raise_and_procedural_lowers(self):
+        base = estimate_relevance(PDF, "nothing relevant")
+        assert estimate_relevance(PDF, FORECAST_TEXT) > base
+        assert estimate_relevance(PDF, PROCEDURAL_TEXT) < base
+
+    def test_clamped(self):
+        score = estimate_relevance(Path("data.xlsx"), FORECAST_TEXT * 3, filing_type="IRP")
+        assert 0.0 <= score <= 1.0
+
+
+class TestTableIndicators:
+    @pytest.mark.parametrize("text, expected", [
+        ("a|" * 11, True),
+        ("a|" * 10, False),
+        ("a\t" * 21, True),
+        ("a\t" * 20, False),
+        ("2030 demand 5 gwh", True),
+        ("2030 demand 5 mwh", True),
+        ("2030 demand only", False),
+        ("x" * 500 + " 5 mw", False),
+    ])
+    def test_indicators(self, text, expected):
+        assert triage._has_table_indicators(text) is expected